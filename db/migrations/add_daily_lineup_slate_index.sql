@@ -0,0 +1,9 @@
+-- Migration: Add slate lookup index to nba_daily_lineup
+-- Date: 2026-10-19
+-- Description: Composite index used by the predictor's slate loader, which
+--              reads every team's latest scrape for a game date in one query.
+--
+-- IMPORTANT: This script is compatible with MySQL 5.7+ and MariaDB 10.0+
+
+ALTER TABLE `nba_daily_lineup`
+  ADD KEY `idx_game_date_team_scrape` (`game_date`, `team_name`, `scrape_date`);
@@ -0,0 +1,38 @@
+-- Migration: Classify play-by-play events and add quarter aggregates
+-- Date: 2026-10-19
+-- Description: Adds typed event columns to nba_playbyplay and creates
+--              nba_pbp_quarter_stats, the per-game, per-quarter and per-team
+--              counts of field goals, free throws, rebounds, turnovers and
+--              fouls. Classify rows imported before this migration with
+--              `python -m nba_predictor.cli classify-pbp`.
+--
+-- IMPORTANT: This script is compatible with MySQL 5.7+ and MariaDB 10.0+
+
+ALTER TABLE `nba_playbyplay`
+  ADD COLUMN `side` char(1) DEFAULT NULL,
+  ADD COLUMN `event_type` varchar(16) DEFAULT NULL,
+  ADD COLUMN `player_name` varchar(100) DEFAULT NULL,
+  ADD COLUMN `shot_value` smallint(6) DEFAULT NULL,
+  ADD COLUMN `is_made` tinyint(1) DEFAULT NULL,
+  ADD COLUMN `detail` varchar(30) DEFAULT NULL,
+  ADD KEY `ix_nba_playbyplay_event_type` (`event_type`);
+
+CREATE TABLE IF NOT EXISTS `nba_pbp_quarter_stats` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `game_id` varchar(50) NOT NULL,
+  `quarter` smallint(6) NOT NULL,
+  `side` char(1) NOT NULL,
+  `field_goals` smallint(6) DEFAULT 0,
+  `field_goal_attempts` smallint(6) DEFAULT 0,
+  `three_pointers` smallint(6) DEFAULT 0,
+  `three_point_attempts` smallint(6) DEFAULT 0,
+  `free_throws` smallint(6) DEFAULT 0,
+  `free_throw_attempts` smallint(6) DEFAULT 0,
+  `offensive_rebounds` smallint(6) DEFAULT 0,
+  `defensive_rebounds` smallint(6) DEFAULT 0,
+  `turnovers` smallint(6) DEFAULT 0,
+  `fouls` smallint(6) DEFAULT 0,
+
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `idx_game_quarter_side` (`game_id`, `quarter`, `side`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
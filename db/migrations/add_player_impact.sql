@@ -0,0 +1,25 @@
+-- Migration: Add rolling player impact averages
+-- Date: 2026-10-19
+-- Description: Creates nba_player_impact, one row per player with
+--              exponentially weighted per-game minutes, points, possessions
+--              used and plus/minus. Fill it with
+--              `python -m nba_predictor.cli calculate-player-impact --rebuild`.
+--
+-- IMPORTANT: This script is compatible with MySQL 5.7+ and MariaDB 10.0+
+--            Requires add_player_registry.sql.
+
+CREATE TABLE IF NOT EXISTS `nba_player_impact` (
+  `player_id` int(11) NOT NULL,
+  `team_name` varchar(100) NOT NULL,
+  `last_game_date` date NOT NULL,
+  `games` int(11) NOT NULL,
+  `minutes` decimal(5,2) NOT NULL,
+  `points` decimal(5,2) NOT NULL,
+  `possessions` decimal(5,2) NOT NULL,
+  `plus_minus` decimal(5,2) NOT NULL,
+
+  PRIMARY KEY (`player_id`),
+  KEY `ix_nba_player_impact_team_name` (`team_name`),
+  KEY `ix_nba_player_impact_last_game_date` (`last_game_date`),
+  CONSTRAINT `fk_player_impact_player` FOREIGN KEY (`player_id`) REFERENCES `nba_player` (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
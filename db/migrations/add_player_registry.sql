@@ -0,0 +1,32 @@
+-- Migration: Add player registry and player links
+-- Date: 2026-10-19
+-- Description: Creates nba_player, the canonical player identity table, and
+--              adds player_id links to nba_daily_lineup and
+--              nba_player_game_stats. Existing rows can be linked afterwards
+--              with `python -m nba_predictor.cli link-players`.
+--
+-- IMPORTANT: This script is compatible with MySQL 5.7+ and MariaDB 10.0+
+
+CREATE TABLE IF NOT EXISTS `nba_player` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `name` varchar(100) NOT NULL,
+  `name_key` varchar(100) NOT NULL,
+  `bbref_id` varchar(20) DEFAULT NULL,
+  `team_name` varchar(100) DEFAULT NULL,
+  `created_at` datetime DEFAULT NULL,
+  `updated_at` datetime DEFAULT NULL,
+
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `bbref_id` (`bbref_id`),
+  KEY `ix_nba_player_name_key` (`name_key`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+ALTER TABLE `nba_daily_lineup`
+  ADD COLUMN `player_id` int(11) DEFAULT NULL AFTER `player_name`,
+  ADD KEY `ix_nba_daily_lineup_player_id` (`player_id`),
+  ADD CONSTRAINT `fk_daily_lineup_player` FOREIGN KEY (`player_id`) REFERENCES `nba_player` (`id`);
+
+ALTER TABLE `nba_player_game_stats`
+  ADD COLUMN `player_id` int(11) DEFAULT NULL AFTER `player_name`,
+  ADD KEY `ix_nba_player_game_stats_player_id` (`player_id`),
+  ADD CONSTRAINT `fk_player_game_stats_player` FOREIGN KEY (`player_id`) REFERENCES `nba_player` (`id`);
@@ -0,0 +1,11 @@
+-- Migration: Add pending-prediction index to nba_prediction
+-- Date: 2026-10-19
+-- Description: Index on actual_winner used by reconcile-predictions, which
+--              pages over pending predictions (actual_winner IS NULL) in ID
+--              order. InnoDB secondary indexes carry the primary key, so the
+--              page query is a range scan over pending rows only.
+--
+-- IMPORTANT: This script is compatible with MySQL 5.7+ and MariaDB 10.0+
+
+ALTER TABLE `nba_prediction`
+  ADD KEY `idx_actual_winner` (`actual_winner`);
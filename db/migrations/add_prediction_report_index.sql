@@ -0,0 +1,10 @@
+-- Migration: Add accuracy report index to nba_prediction
+-- Date: 2026-10-19
+-- Description: Composite index used by the SQL accuracy report
+--              (analyze-accuracy), which filters and groups predictions by
+--              season and model version and only counts reconciled rows.
+--
+-- IMPORTANT: This script is compatible with MySQL 5.7+ and MariaDB 10.0+
+
+ALTER TABLE `nba_prediction`
+  ADD KEY `idx_season_model_version` (`season`, `model_version`, `is_correct`);
@@ -0,0 +1,19 @@
+-- Migration: Add Elo team rating snapshots
+-- Date: 2026-10-19
+-- Description: Creates nba_team_rating, which stores each team's Elo rating
+--              after the games of every date it played.
+--
+-- IMPORTANT: This script is compatible with MySQL 5.7+ and MariaDB 10.0+
+
+CREATE TABLE IF NOT EXISTS `nba_team_rating` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `team_name` varchar(50) NOT NULL,
+  `date` date NOT NULL,
+  `season` varchar(10) NOT NULL,
+  `elo` decimal(7,2) NOT NULL,
+  `games` int(11) NOT NULL,
+
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `idx_team_date` (`team_name`, `date`),
+  KEY `idx_season_date` (`season`, `date`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,33 @@
+-- Migration: Store player playing time and plus/minus as integers
+-- Date: 2026-10-19
+-- Description: Replaces the string columns of nba_player_game_stats with
+--              numeric ones: minutes_played ("34:12") becomes seconds_played
+--              (2052) and plus_minus ("+7") becomes a signed integer.
+--              Existing rows are converted in bulk with one UPDATE.
+--
+-- IMPORTANT: This script is compatible with MySQL 5.7+ and MariaDB 10.0+
+
+ALTER TABLE `nba_player_game_stats`
+  ADD COLUMN `seconds_played` int(11) DEFAULT NULL AFTER `minutes_played`,
+  ADD COLUMN `plus_minus_value` int(11) DEFAULT NULL AFTER `plus_minus`;
+
+UPDATE `nba_player_game_stats`
+SET
+  `seconds_played` = CASE
+    WHEN `minutes_played` REGEXP '^[0-9]+(:[0-9]+)?$' THEN
+      CAST(SUBSTRING_INDEX(`minutes_played`, ':', 1) AS UNSIGNED) * 60
+      + IF(LOCATE(':', `minutes_played`) > 0,
+           CAST(SUBSTRING_INDEX(`minutes_played`, ':', -1) AS UNSIGNED), 0)
+    ELSE NULL
+  END,
+  `plus_minus_value` = CASE
+    WHEN `plus_minus` REGEXP '^[+-]?[0-9]+$' THEN CAST(REPLACE(`plus_minus`, '+', '') AS SIGNED)
+    ELSE NULL
+  END;
+
+ALTER TABLE `nba_player_game_stats`
+  DROP COLUMN `minutes_played`,
+  DROP COLUMN `plus_minus`;
+
+ALTER TABLE `nba_player_game_stats`
+  CHANGE COLUMN `plus_minus_value` `plus_minus` int(11) DEFAULT NULL;
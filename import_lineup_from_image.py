@@ -2,7 +2,10 @@
 """Script to import NBA lineups from image screenshots.
 
 Usage:
-    python import_lineup_from_image.py <image_path> [game_date]
+    python import_lineup_from_image.py <image_path> [image_path ...] [game_date] [--preprocess [--tile]]
+    python import_lineup_from_image.py --benchmark-preprocessing <folder>
+    python import_lineup_from_image.py --cache-info | --clear-cache
+    python import_lineup_from_image.py --invalidate-cache <image_path> [image_path ...]
 
 Examples:
     # Import from a single image for today's games
@@ -13,18 +16,42 @@ Examples:
 
     # Import from multiple images
     python import_lineup_from_image.py game1.png game2.png game3.png
+
+    # Crop and downscale screenshots before sending them (requires Pillow)
+    python import_lineup_from_image.py game1.png game2.png --preprocess
+
+    # Also split very tall full-page screenshots into tiles
+    python import_lineup_from_image.py full_page.png --preprocess --tile
+
+    # Measure preprocessing savings on a folder of sample screenshots (no API calls)
+    python import_lineup_from_image.py --benchmark-preprocessing screenshots/
+
+    # Extractions are cached by image hash; re-running with another date is free.
+    # Force a fresh extraction, list the cache, or drop entries:
+    python import_lineup_from_image.py lineup_screenshot.png --no-cache
+    python import_lineup_from_image.py --cache-info
+    python import_lineup_from_image.py --invalidate-cache lineup_screenshot.png
+    python import_lineup_from_image.py --clear-cache
 """
 
+import argparse
+import json
 import sys
 from datetime import date, datetime
 from pathlib import Path
 
+from nba_predictor.core.config import get_settings
 from nba_predictor.core.logger import get_logger
 from nba_predictor.models.database import init_db
+from nba_predictor.scraper.extraction_cache import ExtractionCache, hash_image
 from nba_predictor.scraper.image_lineup_scraper import (
     ImageLineupScraper,
     ImageLineupScraperError,
 )
+from nba_predictor.scraper.image_preprocessing import (
+    ImagePreprocessingError,
+    benchmark_preprocessing,
+)
 
 logger = get_logger(__name__)
 
@@ -44,9 +71,114 @@ def parse_date(date_str: str) -> date:
         raise ValueError(f"Invalid date format: {date_str}. Use YYYY-MM-DD")
 
 
+def run_benchmark(folder: Path, tile: bool) -> None:
+    """Preprocess a folder of screenshots and print the savings.
+
+    Args:
+        folder: Folder containing sample screenshots
+        tile: Split very tall screenshots into tiles
+    """
+    if not folder.is_dir():
+        logger.error(f"Folder not found: {folder}")
+        sys.exit(1)
+
+    try:
+        results = benchmark_preprocessing(folder, tile=tile)
+    except ImagePreprocessingError as e:
+        logger.error(f"Benchmark failed: {e}")
+        sys.exit(1)
+
+    print(json.dumps(results, indent=2))
+
+
+def manage_cache(args: argparse.Namespace) -> None:
+    """Inspect or invalidate the extraction cache.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    cache = ExtractionCache(get_settings().scraper.image_cache_dir)
+
+    if args.cache_info:
+        entries = cache.entries()
+        print(
+            json.dumps(
+                {
+                    "directory": str(cache.directory),
+                    "entries": len(entries),
+                    "bytes": sum(entry["bytes"] for entry in entries),
+                    "images": entries,
+                },
+                indent=2,
+            )
+        )
+    elif args.clear_cache:
+        removed = cache.clear()
+        logger.info(f"Removed {removed} cache entries from {cache.directory}")
+    else:
+        if not args.inputs:
+            logger.error("No image paths provided")
+            sys.exit(1)
+        for arg in args.inputs:
+            image_path = Path(arg)
+            if not image_path.exists():
+                logger.error(f"Image file not found: {image_path}")
+                sys.exit(1)
+            removed = cache.invalidate(hash_image(image_path))
+            logger.info(f"Removed {removed} cache entries for {image_path}")
+
+
 def main():
     """Main function."""
-    if len(sys.argv) < 2:
+    parser = argparse.ArgumentParser(
+        description="Import NBA lineups from image screenshots",
+        usage="%(prog)s <image_path> [image_path ...] [game_date] [--preprocess [--tile]]",
+    )
+    parser.add_argument("inputs", nargs="*", help="Image paths and an optional YYYY-MM-DD date")
+    parser.add_argument(
+        "--preprocess",
+        action="store_true",
+        help="Crop and downscale screenshots before sending them (requires Pillow)",
+    )
+    parser.add_argument(
+        "--tile",
+        action="store_true",
+        help="With --preprocess, split very tall screenshots into tiles instead of shrinking them",
+    )
+    parser.add_argument(
+        "--benchmark-preprocessing",
+        metavar="FOLDER",
+        type=Path,
+        help="Report preprocessing savings for a folder of screenshots and exit",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always send screenshots to Claude, ignoring and not updating the cache",
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--cache-info", action="store_true", help="List cached extractions and exit"
+    )
+    cache_group.add_argument(
+        "--clear-cache", action="store_true", help="Remove all cached extractions and exit"
+    )
+    cache_group.add_argument(
+        "--invalidate-cache",
+        action="store_true",
+        help="Remove the cached extractions of the given images and exit",
+    )
+    args = parser.parse_args()
+
+    if args.cache_info or args.clear_cache or args.invalidate_cache:
+        manage_cache(args)
+        return
+
+    if args.benchmark_preprocessing:
+        run_benchmark(args.benchmark_preprocessing, args.tile)
+        return
+
+    if not args.inputs:
         print(__doc__)
         sys.exit(1)
 
@@ -54,7 +186,7 @@ def main():
     image_paths = []
     game_date = None
 
-    for arg in sys.argv[1:]:
+    for arg in args.inputs:
         # Check if it's a date
         if arg.count("-") == 2 and len(arg) == 10:
             try:
@@ -94,26 +226,24 @@ def main():
 
     # Initialize scraper
     try:
-        scraper = ImageLineupScraper()
+        scraper = ImageLineupScraper(
+            preprocess=args.preprocess, tile=args.tile, use_cache=not args.no_cache
+        )
+    except ImageLineupScraperError as e:
+        logger.error(f"Failed to initialize scraper: {e}")
+        sys.exit(1)
     except Exception as e:
         logger.error(f"Failed to initialize scraper: {e}")
         logger.error("Make sure ANTHROPIC_API_KEY is set in your environment or .env file")
         sys.exit(1)
 
-    # Process images
-    total_imported = 0
-    for image_path in image_paths:
-        try:
-            logger.info(f"Processing image: {image_path}")
-            count = scraper.import_lineups_from_image(image_path, game_date)
-            total_imported += count
-            logger.info(f"Successfully imported {count} lineup entries from {image_path}")
-        except ImageLineupScraperError as e:
-            logger.error(f"Failed to process {image_path}: {e}")
-            continue
-        except Exception as e:
-            logger.error(f"Unexpected error processing {image_path}: {e}", exc_info=True)
-            continue
+    # Process all images concurrently and save them in one transaction
+    try:
+        logger.info(f"Processing {len(image_paths)} image(s)")
+        total_imported = scraper.import_lineups_from_multiple_images(image_paths, game_date)
+    except ImageLineupScraperError as e:
+        logger.error(f"Failed to import lineups: {e}")
+        sys.exit(1)
 
     logger.info(f"\n{'='*60}")
     logger.info(f"IMPORT COMPLETE")
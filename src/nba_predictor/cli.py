@@ -6,10 +6,29 @@ from typing import List, Optional
 
 from nba_predictor.core.config import get_settings
 from nba_predictor.core.logger import get_logger, setup_logging
+from nba_predictor.export.features import FeatureExportError, export_features
+from nba_predictor.export.pbp_archive import ArchiveError, archive_play_by_play
 from nba_predictor.models import init_db, create_tables
+from nba_predictor.prediction.accuracy import accuracy_report
+from nba_predictor.prediction.backtest import BacktestEngine
+from nba_predictor.prediction.baseline import (
+    DEFAULT_MODEL_PATH,
+    BaselinePredictor,
+    BaselinePredictorError,
+)
 from nba_predictor.prediction.claude_predictor import ClaudePredictor, PredictionError
+from nba_predictor.prediction.reconcile import reconcile_predictions
+from nba_predictor.prediction.simulation import (
+    PROBABILITY_SOURCES,
+    SeasonSimulator,
+    SimulationError,
+)
+from nba_predictor.scraper.pbp_parser import classify_stored_plays
 from nba_predictor.scraper.scraper import BasketballReferenceScraper, ScraperError
 from nba_predictor.scraper.basketballmonster_scraper import BasketballMonsterScraper, BasketballMonsterScraperError
+from nba_predictor.utils.player_impact import PlayerImpactCalculator
+from nba_predictor.utils.players import get_player_registry
+from nba_predictor.utils.ratings import RatingCalculator
 from nba_predictor.utils.statistics import StatisticsCalculator
 
 logger = get_logger(__name__)
@@ -27,6 +46,8 @@ class NBA_Predictor_CLI:
         self.scraper = BasketballReferenceScraper()
         self.lineups_scraper = BasketballMonsterScraper()
         self.stats_calculator = StatisticsCalculator()
+        self.rating_calculator = RatingCalculator()
+        self.player_impact = PlayerImpactCalculator()
 
     def init_database(self) -> None:
         """Initialize database tables."""
@@ -69,6 +90,23 @@ class NBA_Predictor_CLI:
                 logger.error("Game scraping failed", month=month, error=str(e), exc_info=True)
                 continue
 
+        # Fold new results into the Elo ratings
+        if total_games > 0:
+            try:
+                snapshots = self.rating_calculator.update_ratings(season)
+                print(f"✅ Updated Elo ratings ({snapshots} snapshots)")
+            except Exception as e:
+                print(f"⚠️  Failed to update Elo ratings: {e}")
+                logger.error("Rating update failed", error=str(e), exc_info=True)
+
+            # Fold new box scores into the player impact averages
+            try:
+                players = self.player_impact.update()
+                print(f"✅ Updated player impact ({players} players)")
+            except Exception as e:
+                print(f"⚠️  Failed to update player impact: {e}")
+                logger.error("Player impact update failed", error=str(e), exc_info=True)
+
         print(f"\n{'='*60}")
         print(f"📊 Summary:")
         print(f"   Total games imported: {total_games}")
@@ -97,12 +135,117 @@ class NBA_Predictor_CLI:
             logger.error("Play-by-play scraping failed", error=str(e), exc_info=True)
             sys.exit(1)
 
-    def scrape_lineups(self, date_str: Optional[str] = None) -> None:
+    def classify_play_by_play(self, batch_size: int) -> None:
+        """Classify stored play-by-play rows and build their quarter aggregates.
+
+        Args:
+            batch_size: Games per transaction
+        """
+        print("🏀 Classifying stored play-by-play...")
+        try:
+            classified = classify_stored_plays(batch_size=batch_size)
+            print(f"✅ Classified {classified['plays']} plays in {classified['games']} games")
+
+        except Exception as e:
+            print(f"❌ Failed to classify play-by-play: {e}")
+            logger.error("Play-by-play classification failed", error=str(e), exc_info=True)
+            sys.exit(1)
+
+    def archive_play_by_play(
+        self,
+        season: str,
+        months: List[str],
+        prune: bool = False,
+        archive_format: Optional[str] = None,
+    ) -> None:
+        """Archive play-by-play of completed games to columnar files.
+
+        Args:
+            season: NBA season year
+            months: Month names (all months when empty)
+            prune: Delete archived plays from MySQL
+            archive_format: "parquet" or "arrow" (default from settings)
+        """
+        print(f"🏀 Archiving play-by-play for {season} season...")
+        try:
+            month_numbers = [self.scraper.MONTH_MAP[month.lower()] for month in months] or None
+        except KeyError as e:
+            print(f"❌ Invalid month: {e.args[0]}")
+            sys.exit(1)
+
+        try:
+            totals = archive_play_by_play(
+                season, month_numbers, prune=prune, archive_format=archive_format
+            )
+            print(
+                f"✅ Archived {totals['games']} games to {totals['partitions']} partitions "
+                f"({totals['plays']} plays in archive)"
+            )
+            if prune:
+                print(f"✅ Pruned {totals['pruned']} plays from the database")
+
+        except ArchiveError as e:
+            print(f"❌ Failed to archive play-by-play: {e}")
+            logger.error("Play-by-play archive failed", error=str(e), exc_info=True)
+            sys.exit(1)
+
+    def export_features(
+        self,
+        output: str,
+        export_format: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        seasons: Optional[List[str]] = None,
+        include_unplayed: bool = False,
+        chunk_size: int = 10000,
+    ) -> None:
+        """Export a per-game feature dataset with both teams' statistics.
+
+        Args:
+            output: Output file (.parquet, .arrow or .csv)
+            export_format: "parquet", "arrow" or "csv" (default from extension)
+            columns: Team history columns to export (default set when empty)
+            start_date: First game date in YYYY-MM-DD format (optional)
+            end_date: Last game date in YYYY-MM-DD format (optional)
+            seasons: Only these seasons (optional)
+            include_unplayed: Also export games without a final score
+            chunk_size: Rows streamed and written per batch
+        """
+        print(f"🏀 Exporting features to {output}...")
+        try:
+            first = datetime.strptime(start_date, "%Y-%m-%d").date() if start_date else None
+            last = datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else None
+
+            totals = export_features(
+                output,
+                export_format=export_format,
+                columns=columns,
+                start_date=first,
+                end_date=last,
+                seasons=seasons,
+                completed_only=not include_unplayed,
+                chunk_size=chunk_size,
+            )
+            print(f"✅ Exported {totals['rows']} games to {totals['path']}")
+
+        except ValueError as e:
+            print(f"❌ Invalid date format: {e}")
+            sys.exit(1)
+        except FeatureExportError as e:
+            print(f"❌ Failed to export features: {e}")
+            logger.error("Feature export failed", error=str(e), exc_info=True)
+            sys.exit(1)
+
+    def scrape_lineups(self, date_str: Optional[str] = None, diagnostics: bool = False) -> None:
         """Scrape daily lineups and injury status from Basketball Monster.
 
         Args:
             date_str: Date in YYYY-MM-DD format (defaults to today)
+            diagnostics: Save the fetched pages to /tmp and log selector statistics
         """
+        self.lineups_scraper.diagnostics = diagnostics
+
         try:
             target_date = None
             if date_str:
@@ -142,19 +285,83 @@ class NBA_Predictor_CLI:
             logger.error("Statistics calculation failed", error=str(e), exc_info=True)
             sys.exit(1)
 
-    def predict_game(self, home_team: str, away_team: str, date_str: str) -> None:
+    def _create_predictor(
+        self, fallback: bool = False, gate: Optional[float] = None
+    ) -> ClaudePredictor:
+        """Create a Claude predictor, optionally backed by the baseline model.
+
+        Args:
+            fallback: Use the baseline model when the Claude call fails
+            gate: Only call Claude for games whose baseline home-win
+                probability is within this margin of 0.5
+        """
+        baseline = None
+        if fallback or gate is not None:
+            baseline = BaselinePredictor()
+            baseline.load()
+        return ClaudePredictor(baseline=baseline, gate_margin=gate)
+
+    def calculate_ratings(self, season: str, replay: bool = False) -> None:
+        """Update Elo ratings for a season.
+
+        Args:
+            season: NBA season year
+            replay: Rebuild the whole season instead of applying new games only
+        """
+        print(f"🏀 {'Replaying' if replay else 'Updating'} Elo ratings for {season} season...")
+        try:
+            if replay:
+                count = self.rating_calculator.replay_season(season)
+            else:
+                count = self.rating_calculator.update_ratings(season)
+            print(f"✅ Wrote {count} rating snapshots!")
+
+        except Exception as e:
+            print(f"❌ Failed to calculate ratings: {e}")
+            logger.error("Rating calculation failed", error=str(e), exc_info=True)
+            sys.exit(1)
+
+    def calculate_player_impact(self, rebuild: bool = False) -> None:
+        """Update the rolling player impact averages.
+
+        Args:
+            rebuild: Recompute from all box scores instead of applying new ones only
+        """
+        print(f"🏀 {'Rebuilding' if rebuild else 'Updating'} player impact...")
+        try:
+            if rebuild:
+                count = self.player_impact.rebuild()
+            else:
+                count = self.player_impact.update()
+            print(f"✅ Wrote {count} player impact rows!")
+
+        except Exception as e:
+            print(f"❌ Failed to calculate player impact: {e}")
+            logger.error("Player impact calculation failed", error=str(e), exc_info=True)
+            sys.exit(1)
+
+    def predict_game(
+        self,
+        home_team: str,
+        away_team: str,
+        date_str: str,
+        fallback: bool = False,
+        gate: Optional[float] = None,
+    ) -> None:
         """Predict outcome of a specific game.
 
         Args:
             home_team: Home team name
             away_team: Away team name
             date_str: Game date in YYYY-MM-DD format
+            fallback: Use the baseline model when the Claude call fails
+            gate: Baseline margin below which Claude is consulted
         """
         try:
             game_date = datetime.strptime(date_str, "%Y-%m-%d").date()
             print(f"\n🏀 Predicting: {home_team} vs {away_team} on {game_date}\n")
 
-            predictor = ClaudePredictor()
+            predictor = self._create_predictor(fallback, gate)
             prediction = predictor.predict_game(home_team, away_team, game_date)
 
             self._print_prediction(prediction)
@@ -162,22 +369,26 @@ class NBA_Predictor_CLI:
         except ValueError:
             print(f"❌ Invalid date format: {date_str}. Use YYYY-MM-DD")
             sys.exit(1)
-        except PredictionError as e:
+        except (PredictionError, BaselinePredictorError) as e:
             print(f"❌ Prediction failed: {e}")
             logger.error("Prediction failed", error=str(e), exc_info=True)
             sys.exit(1)
 
-    def predict_date(self, date_str: str) -> None:
+    def predict_date(
+        self, date_str: str, fallback: bool = False, gate: Optional[float] = None
+    ) -> None:
         """Predict all games for a specific date.
 
         Args:
             date_str: Date in YYYY-MM-DD format
+            fallback: Use the baseline model when the Claude call fails
+            gate: Baseline margin below which Claude is consulted
         """
         try:
             game_date = datetime.strptime(date_str, "%Y-%m-%d").date()
             print(f"\n🏀 Predicting all games for {game_date}\n")
 
-            predictor = ClaudePredictor()
+            predictor = self._create_predictor(fallback, gate)
             predictions = predictor.predict_games_for_date(game_date)
 
             if not predictions:
@@ -193,36 +404,267 @@ class NBA_Predictor_CLI:
         except ValueError:
             print(f"❌ Invalid date format: {date_str}. Use YYYY-MM-DD")
             sys.exit(1)
-        except PredictionError as e:
+        except (PredictionError, BaselinePredictorError) as e:
             print(f"❌ Prediction failed: {e}")
             logger.error("Date prediction failed", error=str(e), exc_info=True)
             sys.exit(1)
 
-    def analyze_accuracy(self, season: str) -> None:
+    def train_baseline(self, seasons: List[str], output: str, l2: float) -> None:
+        """Train the local baseline model and save it to disk.
+
+        Args:
+            seasons: NBA season years to train on
+            output: Path of the model artifact
+            l2: Ridge penalty
+        """
+        print(f"🏀 Training baseline model on seasons {', '.join(seasons)}...")
+        try:
+            baseline = BaselinePredictor(output)
+            summary = baseline.train(seasons, l2=l2)
+            path = baseline.save()
+
+            print(f"✅ Trained on {summary['games']} games, saved to {path}")
+            print(f"   In-sample accuracy: {summary['accuracy_percentage']}%")
+            print(f"   Log loss: {summary['log_loss']}")
+            print(f"   Brier score: {summary['brier_score']}")
+            print(f"   Margin MAE: {summary['margin_mae']} points")
+
+        except BaselinePredictorError as e:
+            print(f"❌ Failed to train baseline model: {e}")
+            logger.error("Baseline training failed", error=str(e), exc_info=True)
+            sys.exit(1)
+
+    def analyze_accuracy(
+        self,
+        season: str,
+        predict_missing: bool = False,
+        limit: Optional[int] = None,
+        workers: int = 4,
+        requests_per_minute: float = 50,
+        baseline: bool = False,
+    ) -> None:
         """Analyze prediction accuracy for a season.
 
         Args:
             season: NBA season year
+            predict_missing: Whether to predict completed games lacking a prediction
+            limit: Maximum number of games to backtest
+            workers: Number of concurrent predictions
+            requests_per_minute: Maximum number of API calls started per minute
+            baseline: Predict missing games with the local baseline model (no API calls)
         """
+        if baseline and not predict_missing:
+            print("❌ --baseline requires --predict-missing")
+            sys.exit(1)
+
         print(f"\n🏀 Analyzing prediction accuracy for {season} season...")
-        print("⚠️  This will make multiple API calls and may take a while\n")
+
+        try:
+            if predict_missing and baseline:
+                engine = BacktestEngine(BaselinePredictor(), workers=workers, requests_per_minute=0)
+                backtest = engine.run(season, limit=limit)
+                report = accuracy_report(season)
+                report["backtest"] = backtest
+            elif predict_missing:
+                print("⚠️  Predicting missing games will make multiple API calls and may take a while")
+                print("   Interrupted runs resume from the predictions already saved\n")
+                predictor = ClaudePredictor()
+                report = predictor.analyze_prediction_accuracy(
+                    season,
+                    predict_missing=True,
+                    limit=limit,
+                    workers=workers,
+                    requests_per_minute=requests_per_minute,
+                )
+            else:
+                report = accuracy_report(season)
+
+        except (PredictionError, BaselinePredictorError) as e:
+            print(f"❌ Analysis failed: {e}")
+            logger.error("Accuracy analysis failed", error=str(e), exc_info=True)
+            sys.exit(1)
+
+        backtest = report.get("backtest")
+        if backtest:
+            print(
+                f"Backtest: {backtest['games_predicted']} predicted, "
+                f"{backtest['games_resumed']} already stored, "
+                f"{backtest['games_skipped']} skipped"
+            )
+            if backtest.get("baseline"):
+                baseline_backtest = backtest["baseline"]
+                print(
+                    f"   {baseline_backtest['games_analyzed']} games were answered by the "
+                    f"baseline ({baseline_backtest['model_version']}): "
+                    f"{baseline_backtest['accuracy_percentage']}% accuracy, "
+                    "reported separately"
+                )
+
+        print("\n" + "="*60)
+        print("ACCURACY ANALYSIS")
+        print("="*60)
+
+        if not report["overall"]:
+            print("No reconciled predictions found for this season")
+
+        for group in report["overall"]:
+            print(f"\nModel: {group['model_version']}")
+            print(f"Games Analyzed: {group['predictions']}")
+            print(f"Correct Predictions: {group['correct']}")
+            print(f"Accuracy: {group['accuracy_percentage']}%")
+            print(f"Average Confidence: {group['average_confidence']}%")
+            print(f"Brier Score: {group['brier_score']}")
+
+            print("Calibration:")
+            for bucket in report["by_confidence"]:
+                if bucket["model_version"] != group["model_version"]:
+                    continue
+                print(
+                    f"   {bucket['bucket']:>7}%: {bucket['predictions']} games, "
+                    f"avg confidence {bucket['average_confidence']}%, "
+                    f"accuracy {bucket['accuracy_percentage']}%"
+                )
+
+            print("By Team:")
+            for team in report["by_team"]:
+                if team["model_version"] != group["model_version"]:
+                    continue
+                print(
+                    f"   {team['team']:<25} {team['correct']}/{team['predictions']} "
+                    f"({team['accuracy_percentage']}%)"
+                )
+
+        print(f"\nCompleted games without a prediction: {report['games_missing']}")
+        if report["games_missing"] and not predict_missing:
+            print("   Use --predict-missing to predict them")
+        print("="*60 + "\n")
+
+    def simulate_season(
+        self,
+        season: str,
+        simulations: int,
+        source: str,
+        processes: int,
+        seed: Optional[int],
+    ) -> None:
+        """Simulate the rest of a season and print standings odds.
+
+        Args:
+            season: NBA season year
+            simulations: Number of seasons to simulate
+            source: Win probability source ("elo", "baseline" or "predictions")
+            processes: Number of worker processes
+            seed: Random seed (optional)
+        """
+        print(f"\n🏀 Simulating {simulations} seasons for {season} ({source} probabilities)...")
+        try:
+            simulator = SeasonSimulator(source=source)
+            results = simulator.simulate(
+                season, simulations=simulations, processes=processes, seed=seed
+            )
+
+        except (SimulationError, BaselinePredictorError) as e:
+            print(f"❌ Simulation failed: {e}")
+            logger.error("Season simulation failed", error=str(e), exc_info=True)
+            sys.exit(1)
+
+        print("\n" + "="*60)
+        print("SEASON SIMULATION")
+        print("="*60)
+        print(f"Remaining Games: {results['remaining_games']}")
+        print(
+            f"Simulations: {results['simulations']} in {results['elapsed_seconds']}s "
+            f"({results['simulations_per_second']} per second)"
+        )
+
+        conference = None
+        for team in results["teams"]:
+            if team["conference"] != conference:
+                conference = team["conference"]
+                print(f"\n{conference or 'Other'}:")
+                print(
+                    f"   {'Team':<25} {'W-L':>7} {'Proj W':>7} {'10-90%':>8} "
+                    f"{'Top 6':>6} {'Play-in':>8} {'Playoffs':>9}"
+                )
+            top_six = sum(team["seed_probabilities"][:6])
+            print(
+                f"   {team['team']:<25} {team['wins']:>3}-{team['losses']:<3} "
+                f"{team['mean_wins']:>7} "
+                f"{team['win_percentiles']['p10']:>3}-{team['win_percentiles']['p90']:<4} "
+                f"{top_six:>6.1%} {team['play_in_probability']:>8.1%} "
+                f"{team['playoff_probability']:>9.1%}"
+            )
+        print("="*60 + "\n")
+
+    def reconcile_predictions(self, batch_size: int) -> None:
+        """Back-fill actual results into predictions whose games are final.
+
+        Args:
+            batch_size: Pending predictions reconciled per page
+        """
+        print("🏀 Reconciling predictions with game results...")
+        try:
+            counts = reconcile_predictions(batch_size=batch_size)
+            print(
+                f"✅ Reconciled {counts['matched_by_game_id'] + counts['matched_by_teams']} "
+                f"predictions ({counts['matched_by_game_id']} by game ID, "
+                f"{counts['matched_by_teams']} by date and teams)"
+            )
+
+        except Exception as e:
+            print(f"❌ Failed to reconcile predictions: {e}")
+            logger.error("Prediction reconciliation failed", error=str(e), exc_info=True)
+            sys.exit(1)
+
+    def link_players(self) -> None:
+        """Link stored lineup and box-score rows to the player registry."""
+        print("🏀 Linking players...")
+        try:
+            linked = get_player_registry().link_existing()
+            print(
+                f"✅ Linked {linked['player_game_stats']} box-score rows and "
+                f"{linked['daily_lineup']} lineup rows"
+            )
+
+        except Exception as e:
+            print(f"❌ Failed to link players: {e}")
+            logger.error("Player linking failed", error=str(e), exc_info=True)
+            sys.exit(1)
+
+    def benchmark_prompts(self, season: str, limit: Optional[int], live: bool) -> None:
+        """Compare token usage of the compact and JSON prompt formats.
+
+        Args:
+            season: NBA season year
+            limit: Maximum number of games to benchmark
+            live: Whether to also time real prediction calls
+        """
+        print(f"\n🏀 Benchmarking prompt formats for {season} season...")
+        if live:
+            print("⚠️  Live mode makes two API calls per game and may take a while\n")
 
         try:
             predictor = ClaudePredictor()
-            metrics = predictor.analyze_prediction_accuracy(season)
+            results = predictor.benchmark_prompt_formats(season, limit=limit, live=live)
 
             print("\n" + "="*60)
-            print("ACCURACY ANALYSIS")
+            print("PROMPT FORMAT BENCHMARK")
             print("="*60)
-            print(f"Games Analyzed: {metrics['games_analyzed']}")
-            print(f"Correct Predictions: {metrics['correct_predictions']}")
-            print(f"Accuracy: {metrics['accuracy_percentage']}%")
-            print(f"Average Confidence: {metrics['average_confidence']}%")
+            print(f"Games Benchmarked: {results['games_benchmarked']}")
+            for fmt, metrics in results["formats"].items():
+                line = (
+                    f"{fmt:>8}: {metrics['avg_input_tokens']} tokens, "
+                    f"{metrics['avg_chars']} chars"
+                )
+                if metrics["avg_latency_ms"] is not None:
+                    line += f", {metrics['avg_latency_ms']} ms"
+                print(line)
+            print(f"Token Reduction: {results['token_reduction_percentage']}%")
             print("="*60 + "\n")
 
         except PredictionError as e:
-            print(f"❌ Analysis failed: {e}")
-            logger.error("Accuracy analysis failed", error=str(e), exc_info=True)
+            print(f"❌ Benchmark failed: {e}")
+            logger.error("Prompt benchmark failed", error=str(e), exc_info=True)
             sys.exit(1)
 
     def _print_prediction(self, prediction: dict) -> None:
@@ -263,23 +705,62 @@ Examples:
   # Scrape games and play-by-play data
   python -m nba_predictor.cli scrape-games 2024 january february --scrape-pbp
 
+  # Archive a season's play-by-play to Parquet and remove it from MySQL
+  python -m nba_predictor.cli archive-pbp 2023 --prune
+
+  # Export training features of three seasons to Parquet
+  python -m nba_predictor.cli export-features data/features.parquet --season 2022 2023 2024
+
+  # Classify play-by-play imported before event classification existed
+  python -m nba_predictor.cli classify-pbp
+
   # Scrape daily lineups and injury status (today)
   python -m nba_predictor.cli scrape-lineups
 
   # Scrape lineups for a specific date
   python -m nba_predictor.cli scrape-lineups 2024-01-15
 
+  # Debug a changed page layout (saves pages to /tmp, logs selector statistics)
+  python -m nba_predictor.cli scrape-lineups --diagnostics
+
   # Calculate statistics
   python -m nba_predictor.cli calculate-stats 2024
 
+  # Update Elo ratings with newly imported games (rebuild with --replay)
+  python -m nba_predictor.cli calculate-ratings 2024
+
+  # Update rolling player minutes/points used to weigh injuries (rebuild with --rebuild)
+  python -m nba_predictor.cli calculate-player-impact
+
   # Predict a game
   python -m nba_predictor.cli predict "Los Angeles Lakers" "Boston Celtics" 2024-01-15
 
   # Predict all games for a date
   python -m nba_predictor.cli predict-date 2024-01-15
 
+  # Train the local baseline model on earlier seasons
+  python -m nba_predictor.cli train-baseline 2022 2023
+
+  # Only call Claude for close games, fall back to the baseline on API errors
+  python -m nba_predictor.cli predict-date 2024-01-15 --gate 0.15 --fallback
+
   # Analyze accuracy
   python -m nba_predictor.cli analyze-accuracy 2024
+
+  # Backtest the baseline over a season it was not trained on (no API calls)
+  python -m nba_predictor.cli analyze-accuracy 2024 --predict-missing --baseline
+
+  # Simulate the rest of the season 100k times on 4 cores
+  python -m nba_predictor.cli simulate-season 2024 --sims 100000 --processes 4
+
+  # Back-fill actual results into stored predictions (safe to run from cron)
+  python -m nba_predictor.cli reconcile-predictions
+
+  # Link stored lineup and box-score rows to the player registry
+  python -m nba_predictor.cli link-players
+
+  # Compare prompt token usage of the compact and JSON formats
+  python -m nba_predictor.cli benchmark-prompts 2024 --limit 100
         """,
     )
 
@@ -307,6 +788,77 @@ Examples:
     pbp_parser = subparsers.add_parser("scrape-pbp", help="Scrape play-by-play data")
     pbp_parser.add_argument("date", help="Date in YYYY-MM-DD format")
 
+    # Archive play-by-play command
+    archive_parser = subparsers.add_parser(
+        "archive-pbp", help="Archive play-by-play of completed games to columnar files"
+    )
+    archive_parser.add_argument("season", help="NBA season year (e.g., 2024)")
+    archive_parser.add_argument(
+        "months", nargs="*", help="Month names to archive (default: whole season)"
+    )
+    archive_parser.add_argument(
+        "--prune",
+        action="store_true",
+        default=False,
+        help="Delete archived plays from the database after verifying the files",
+    )
+    archive_parser.add_argument(
+        "--format",
+        choices=["parquet", "arrow"],
+        default=None,
+        help="File format (default: EXPORT_PBP_ARCHIVE_FORMAT)",
+    )
+
+    # Export features command
+    features_parser = subparsers.add_parser(
+        "export-features", help="Export games joined with both teams' statistics"
+    )
+    features_parser.add_argument("output", help="Output file (.parquet, .arrow or .csv)")
+    features_parser.add_argument(
+        "--format",
+        choices=["parquet", "arrow", "csv"],
+        default=None,
+        help="File format (default: from the file extension)",
+    )
+    features_parser.add_argument(
+        "--columns",
+        nargs="+",
+        default=None,
+        help="Team history columns to export (default: standard feature set)",
+    )
+    features_parser.add_argument(
+        "--start-date", default=None, help="First game date in YYYY-MM-DD format"
+    )
+    features_parser.add_argument(
+        "--end-date", default=None, help="Last game date in YYYY-MM-DD format"
+    )
+    features_parser.add_argument(
+        "--season", nargs="+", default=None, help="Only these seasons (e.g., 2023 2024)"
+    )
+    features_parser.add_argument(
+        "--include-unplayed",
+        action="store_true",
+        default=False,
+        help="Also export games without a final score (for prediction)",
+    )
+    features_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=10000,
+        help="Rows streamed and written per batch (default: 10000)",
+    )
+
+    # Classify play-by-play command
+    classify_parser = subparsers.add_parser(
+        "classify-pbp", help="Classify stored play-by-play and build quarter aggregates"
+    )
+    classify_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=100,
+        help="Games per transaction (default: 100)",
+    )
+
     # Scrape lineups command
     lineups_parser = subparsers.add_parser(
         "scrape-lineups", help="Scrape daily lineups and injury status from Basketball Monster"
@@ -316,11 +868,37 @@ Examples:
         nargs="?",
         help="Date in YYYY-MM-DD format (optional, defaults to today)",
     )
+    lineups_parser.add_argument(
+        "--diagnostics",
+        action="store_true",
+        help="Save the fetched pages to /tmp and log selector statistics (for layout changes)",
+    )
 
     # Calculate stats command
     stats_parser = subparsers.add_parser("calculate-stats", help="Calculate team statistics")
     stats_parser.add_argument("season", help="NBA season year (e.g., 2024)")
 
+    # Calculate ratings command
+    ratings_parser = subparsers.add_parser("calculate-ratings", help="Update team Elo ratings")
+    ratings_parser.add_argument("season", help="NBA season year (e.g., 2024)")
+    ratings_parser.add_argument(
+        "--replay",
+        action="store_true",
+        default=False,
+        help="Rebuild all rating snapshots of the season",
+    )
+
+    # Player impact command
+    impact_parser = subparsers.add_parser(
+        "calculate-player-impact", help="Update rolling player impact averages"
+    )
+    impact_parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        default=False,
+        help="Recompute from all box scores instead of applying new ones only",
+    )
+
     # Predict game command
     predict_parser = subparsers.add_parser("predict", help="Predict a specific game")
     predict_parser.add_argument("home_team", help="Home team name")
@@ -333,9 +911,132 @@ Examples:
     )
     predict_date_parser.add_argument("date", help="Date in YYYY-MM-DD format")
 
+    for baseline_parser in (predict_parser, predict_date_parser):
+        baseline_parser.add_argument(
+            "--fallback",
+            action="store_true",
+            default=False,
+            help="Use the local baseline model when the Claude API call fails",
+        )
+        baseline_parser.add_argument(
+            "--gate",
+            type=float,
+            default=None,
+            metavar="MARGIN",
+            help="Only call Claude when the baseline home-win probability is within "
+            "MARGIN of 0.5 (e.g. 0.15); other games keep the baseline prediction",
+        )
+
+    # Train baseline command
+    train_parser = subparsers.add_parser(
+        "train-baseline", help="Train the local statistical baseline model"
+    )
+    train_parser.add_argument("seasons", nargs="+", help="NBA season year(s) to train on")
+    train_parser.add_argument(
+        "--output",
+        default=str(DEFAULT_MODEL_PATH),
+        help=f"Model artifact path (default: {DEFAULT_MODEL_PATH})",
+    )
+    train_parser.add_argument(
+        "--l2", type=float, default=1.0, help="Ridge penalty (default: 1.0)"
+    )
+
     # Analyze accuracy command
     accuracy_parser = subparsers.add_parser("analyze-accuracy", help="Analyze prediction accuracy")
     accuracy_parser.add_argument("season", help="NBA season year (e.g., 2024)")
+    accuracy_parser.add_argument(
+        "--predict-missing",
+        action="store_true",
+        default=False,
+        help="Predict completed games that have no stored prediction (makes API calls)",
+    )
+    accuracy_parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Maximum number of games to backtest with --predict-missing (default: whole season)",
+    )
+    accuracy_parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of concurrent predictions (default: 4)",
+    )
+    accuracy_parser.add_argument(
+        "--rpm",
+        type=float,
+        default=50,
+        help="Maximum API calls started per minute (default: 50)",
+    )
+    accuracy_parser.add_argument(
+        "--baseline",
+        action="store_true",
+        default=False,
+        help="Predict missing games with the local baseline model instead of Claude "
+        "(requires --predict-missing)",
+    )
+
+    # Simulate season command
+    simulate_parser = subparsers.add_parser(
+        "simulate-season", help="Monte Carlo simulation of the remaining season"
+    )
+    simulate_parser.add_argument("season", help="NBA season year (e.g., 2024)")
+    simulate_parser.add_argument(
+        "--sims",
+        type=int,
+        default=10000,
+        help="Number of seasons to simulate (default: 10000)",
+    )
+    simulate_parser.add_argument(
+        "--source",
+        choices=PROBABILITY_SOURCES,
+        default="elo",
+        help="Per-game win probabilities: Elo ratings, the baseline model or stored "
+        "predictions (default: elo)",
+    )
+    simulate_parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1)",
+    )
+    simulate_parser.add_argument(
+        "--seed", type=int, default=None, help="Random seed for reproducible results"
+    )
+
+    # Reconcile predictions command
+    reconcile_parser = subparsers.add_parser(
+        "reconcile-predictions", help="Back-fill actual results into stored predictions"
+    )
+    reconcile_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10000,
+        help="Pending predictions reconciled per page (default: 10000)",
+    )
+
+    # Link players command
+    subparsers.add_parser(
+        "link-players", help="Link stored lineup and box-score rows to the player registry"
+    )
+
+    # Benchmark prompts command
+    benchmark_parser = subparsers.add_parser(
+        "benchmark-prompts", help="Compare token usage of prompt formats"
+    )
+    benchmark_parser.add_argument("season", help="NBA season year (e.g., 2024)")
+    benchmark_parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Maximum number of games to benchmark (default: whole season)",
+    )
+    benchmark_parser.add_argument(
+        "--live",
+        action="store_true",
+        default=False,
+        help="Also send each prompt to Claude to measure end-to-end latency",
+    )
 
     args = parser.parse_args()
 
@@ -351,16 +1052,47 @@ Examples:
         cli.scrape_games(args.season, args.months, args.scrape_pbp)
     elif args.command == "scrape-pbp":
         cli.scrape_play_by_play(args.date)
+    elif args.command == "archive-pbp":
+        cli.archive_play_by_play(args.season, args.months, args.prune, args.format)
+    elif args.command == "export-features":
+        cli.export_features(
+            args.output,
+            args.format,
+            args.columns,
+            args.start_date,
+            args.end_date,
+            args.season,
+            args.include_unplayed,
+            args.chunk_size,
+        )
+    elif args.command == "classify-pbp":
+        cli.classify_play_by_play(args.batch_size)
     elif args.command == "scrape-lineups":
-        cli.scrape_lineups(args.date)
+        cli.scrape_lineups(args.date, args.diagnostics)
     elif args.command == "calculate-stats":
         cli.calculate_statistics(args.season)
+    elif args.command == "calculate-ratings":
+        cli.calculate_ratings(args.season, args.replay)
+    elif args.command == "calculate-player-impact":
+        cli.calculate_player_impact(args.rebuild)
     elif args.command == "predict":
-        cli.predict_game(args.home_team, args.away_team, args.date)
+        cli.predict_game(args.home_team, args.away_team, args.date, args.fallback, args.gate)
     elif args.command == "predict-date":
-        cli.predict_date(args.date)
+        cli.predict_date(args.date, args.fallback, args.gate)
+    elif args.command == "train-baseline":
+        cli.train_baseline(args.seasons, args.output, args.l2)
     elif args.command == "analyze-accuracy":
-        cli.analyze_accuracy(args.season)
+        cli.analyze_accuracy(
+            args.season, args.predict_missing, args.limit, args.workers, args.rpm, args.baseline
+        )
+    elif args.command == "simulate-season":
+        cli.simulate_season(args.season, args.sims, args.source, args.processes, args.seed)
+    elif args.command == "reconcile-predictions":
+        cli.reconcile_predictions(args.batch_size)
+    elif args.command == "link-players":
+        cli.link_players()
+    elif args.command == "benchmark-prompts":
+        cli.benchmark_prompts(args.season, args.limit, args.live)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+"""Shared Anthropic client factory.
+
+Every component talking to Claude (predictor, image lineup scraper) gets the
+same client, so concurrent calls share one HTTP connection pool and reuse warm
+keep-alive connections instead of paying a TLS handshake per client. Pool
+limits, timeouts, retries and HTTP/2 are configured through
+``AnthropicSettings``.
+"""
+
+import importlib.util
+import threading
+from typing import Dict, Optional
+
+import httpx
+from anthropic import Anthropic, DefaultHttpxClient
+
+from nba_predictor.core.config import get_settings
+from nba_predictor.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+_clients: Dict[Optional[str], Anthropic] = {}
+_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    """Whether httpx can negotiate HTTP/2 (requires the optional h2 package)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_anthropic_client(api_key: Optional[str] = None) -> Anthropic:
+    """Get the shared Anthropic client for an API key.
+
+    Args:
+        api_key: API key (defaults to ``ANTHROPIC_API_KEY`` from settings,
+            then to the SDK's own environment lookup)
+
+    Returns:
+        Anthropic client, created on first use and reused afterwards
+    """
+    settings = get_settings().anthropic
+    api_key = api_key or settings.api_key or None
+
+    with _lock:
+        client = _clients.get(api_key)
+        if client is not None:
+            return client
+
+        http2 = settings.http2 and _http2_available()
+        timeout = httpx.Timeout(settings.timeout, connect=settings.connect_timeout)
+        http_client = DefaultHttpxClient(
+            http2=http2,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+        )
+
+        client = Anthropic(
+            api_key=api_key,
+            timeout=timeout,
+            max_retries=settings.max_retries,
+            http_client=http_client,
+        )
+        _clients[api_key] = client
+
+        logger.info(
+            "Anthropic client created",
+            http2=http2,
+            max_connections=settings.max_connections,
+            max_retries=settings.max_retries,
+            timeout=settings.timeout,
+        )
+        return client
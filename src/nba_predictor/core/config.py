@@ -3,7 +3,7 @@
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
 from dotenv import load_dotenv
 from pydantic import Field, field_validator
@@ -27,8 +27,53 @@ class DatabaseSettings(BaseSettings):
     name: str = Field(default="sportbet", description="Database name")
     charset: str = Field(default="utf8mb4", description="Database charset")
 
+    # Engine and connection pool
+    pool_size: int = Field(default=5, description="Connections kept open in the pool")
+    max_overflow: int = Field(
+        default=10, description="Connections opened beyond pool_size under load"
+    )
+    pool_timeout: float = Field(
+        default=30.0, description="Seconds to wait for a free connection before failing"
+    )
+    pool_recycle: int = Field(
+        default=3600, description="Seconds after which a connection is replaced"
+    )
+    echo: bool = Field(default=False, description="Log every SQL statement (slow)")
+    isolation_level: Optional[
+        Literal["READ UNCOMMITTED", "READ COMMITTED", "REPEATABLE READ", "SERIALIZABLE"]
+    ] = Field(default=None, description="Transaction isolation level (default: server's)")
+    client_flags: str = Field(
+        default="",
+        description="Comma-separated pymysql client flags, e.g. MULTI_STATEMENTS",
+    )
+
     model_config = SettingsConfigDict(env_prefix="DB_")
 
+    @field_validator("pool_size", "pool_timeout", "pool_recycle")
+    @classmethod
+    def validate_positive(cls, v: float) -> float:
+        """Validate that values are positive."""
+        if v <= 0:
+            raise ValueError("Value must be positive")
+        return v
+
+    @field_validator("max_overflow")
+    @classmethod
+    def validate_non_negative(cls, v: int) -> int:
+        """Validate that the overflow is not negative."""
+        if v < 0:
+            raise ValueError("Value must not be negative")
+        return v
+
+    @field_validator("client_flags")
+    @classmethod
+    def validate_client_flags(cls, v: str) -> str:
+        """Normalize client flag names; pymysql does not implement compression."""
+        names = [name.strip().upper() for name in v.split(",") if name.strip()]
+        if "COMPRESS" in names:
+            raise ValueError("COMPRESS is not supported by pymysql")
+        return ",".join(names)
+
     @property
     def url(self) -> str:
         """Generate SQLAlchemy database URL."""
@@ -45,6 +90,9 @@ class ScraperSettings(BaseSettings):
     timeout: int = Field(default=30, description="Request timeout in seconds")
     retry_attempts: int = Field(default=3, description="Number of retry attempts")
     retry_delay: int = Field(default=2, description="Delay between retries in seconds")
+    image_cache_dir: str = Field(
+        default="data/image_cache", description="Cache of lineups extracted from screenshots"
+    )
 
     model_config = SettingsConfigDict(env_prefix="SCRAPER_")
 
@@ -61,9 +109,45 @@ class AnthropicSettings(BaseSettings):
     """Anthropic Claude API configuration."""
 
     api_key: str = Field(default="", description="Anthropic API key")
+    timeout: float = Field(default=120.0, description="Request timeout in seconds")
+    connect_timeout: float = Field(default=10.0, description="Connection timeout in seconds")
+    max_retries: int = Field(default=3, description="Retries on connection errors, 429 and 5xx")
+    max_connections: int = Field(default=20, description="Maximum open connections")
+    max_keepalive_connections: int = Field(
+        default=10, description="Maximum idle connections kept alive for reuse"
+    )
+    keepalive_expiry: float = Field(
+        default=60.0, description="Seconds an idle connection is kept alive"
+    )
+    http2: bool = Field(
+        default=True, description="Use HTTP/2 when the h2 package is installed"
+    )
 
     model_config = SettingsConfigDict(env_prefix="ANTHROPIC_")
 
+    @field_validator("timeout", "connect_timeout", "max_connections", "max_keepalive_connections")
+    @classmethod
+    def validate_positive(cls, v: float) -> float:
+        """Validate that values are positive."""
+        if v <= 0:
+            raise ValueError("Value must be positive")
+        return v
+
+
+class ExportSettings(BaseSettings):
+    """Columnar archive and export configuration."""
+
+    pbp_archive_dir: str = Field(
+        default="data/archive/pbp",
+        description="Directory of the partitioned play-by-play archive",
+    )
+    pbp_archive_format: Literal["parquet", "arrow"] = Field(
+        default="parquet",
+        description="File format of new play-by-play archive partitions",
+    )
+
+    model_config = SettingsConfigDict(env_prefix="EXPORT_")
+
 
 class LoggingSettings(BaseSettings):
     """Logging configuration."""
@@ -94,6 +178,7 @@ class Settings(BaseSettings):
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     scraper: ScraperSettings = Field(default_factory=ScraperSettings)
     anthropic: AnthropicSettings = Field(default_factory=AnthropicSettings)
+    export: ExportSettings = Field(default_factory=ExportSettings)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
     app: AppSettings = Field(default_factory=AppSettings)
 
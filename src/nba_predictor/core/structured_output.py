@@ -0,0 +1,157 @@
+"""Schema-validated Claude responses through forced tool use.
+
+Instead of asking for JSON in free text and locating it in the reply, the
+response schema (a Pydantic model) is offered as the only tool and Claude is
+required to call it. The tool input arrives as parsed JSON, is streamed so
+callers can observe partial results, and is validated against the model. When
+validation fails, the validation errors are sent back as the tool result and
+Claude gets exactly one chance to repair its answer, which is far cheaper
+than re-issuing the whole request.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from anthropic import Anthropic
+from pydantic import BaseModel, ValidationError
+
+from nba_predictor.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class StructuredOutputError(Exception):
+    """Raised when a response cannot be validated against its schema."""
+
+    pass
+
+
+def tool_definition(
+    schema: Type[BaseModel], name: str, description: str, cache: bool = False
+) -> Dict[str, Any]:
+    """Build a tool definition whose input schema is a Pydantic model.
+
+    Args:
+        schema: Pydantic model describing the expected output
+        name: Tool name
+        description: Tool description shown to the model
+        cache: Mark the tool for prompt caching (it then closes the cached prefix)
+
+    Returns:
+        Tool definition for ``messages.create``
+    """
+    tool: Dict[str, Any] = {
+        "name": name,
+        "description": description,
+        "input_schema": schema.model_json_schema(),
+    }
+    if cache:
+        tool["cache_control"] = {"type": "ephemeral"}
+    return tool
+
+
+def _tool_input(message: Any, tool_name: str) -> Tuple[Optional[str], Any]:
+    """Return (tool_use id, input) of the named tool call in a response."""
+    for block in message.content:
+        if getattr(block, "type", None) == "tool_use" and block.name == tool_name:
+            return block.id, block.input
+    return None, None
+
+
+def request_structured(
+    client: Anthropic,
+    schema: Type[ModelT],
+    tool: Dict[str, Any],
+    messages: List[Dict[str, Any]],
+    on_partial: Optional[Callable[[Dict[str, Any]], None]] = None,
+    on_response: Optional[Callable[[Any, float], None]] = None,
+    validation_context: Optional[Dict[str, Any]] = None,
+    **create_kwargs: Any,
+) -> ModelT:
+    """Request a response that must validate against a schema.
+
+    Args:
+        client: Anthropic client
+        schema: Pydantic model the tool input is validated against
+        tool: Tool definition built by ``tool_definition`` for ``schema``
+        messages: Conversation to send
+        on_partial: Called with the partially parsed tool input while the
+            response streams (optional)
+        on_response: Called with each final message and its latency in
+            seconds, e.g. to log usage (optional)
+        validation_context: Context passed to the schema's validators (optional)
+        **create_kwargs: Other ``messages`` arguments (model, max_tokens, system, ...)
+
+    Returns:
+        Validated model instance
+
+    Raises:
+        StructuredOutputError: If the response is still invalid after one repair attempt
+    """
+    tool_name = tool["name"]
+    request = dict(
+        create_kwargs,
+        tools=[tool],
+        tool_choice={"type": "tool", "name": tool_name},
+    )
+
+    started = time.perf_counter()
+    if on_partial is not None:
+        with client.messages.stream(messages=messages, **request) as stream:
+            for event in stream:
+                if event.type == "input_json" and isinstance(event.snapshot, dict):
+                    on_partial(event.snapshot)
+            message = stream.get_final_message()
+    else:
+        message = client.messages.create(messages=messages, **request)
+    if on_response is not None:
+        on_response(message, time.perf_counter() - started)
+
+    tool_use_id, data = _tool_input(message, tool_name)
+    if tool_use_id is None:
+        raise StructuredOutputError(f"Response did not call the {tool_name} tool")
+
+    try:
+        return schema.model_validate(data, context=validation_context)
+    except ValidationError as e:
+        error = e
+
+    # Single repair attempt: return the validation errors as the tool result
+    logger.warning(
+        "Structured response failed validation, requesting repair",
+        tool=tool_name,
+        errors=error.error_count(),
+    )
+    repair_messages = messages + [
+        {"role": "assistant", "content": message.content},
+        {
+            "role": "user",
+            "content": [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": tool_use_id,
+                    "is_error": True,
+                    "content": (
+                        "The input did not match the schema. Call the tool again with "
+                        f"corrected input. Validation errors:\n{error}"
+                    ),
+                }
+            ],
+        },
+    ]
+
+    started = time.perf_counter()
+    message = client.messages.create(messages=repair_messages, **request)
+    if on_response is not None:
+        on_response(message, time.perf_counter() - started)
+
+    tool_use_id, data = _tool_input(message, tool_name)
+    if tool_use_id is None:
+        raise StructuredOutputError(f"Repair response did not call the {tool_name} tool")
+
+    try:
+        return schema.model_validate(data, context=validation_context)
+    except ValidationError as e:
+        raise StructuredOutputError(f"Invalid {tool_name} input after repair: {e}")
@@ -0,0 +1 @@
+"""Columnar archives and dataset exports of NBA data."""
@@ -0,0 +1,281 @@
+"""Feature dataset export: games joined with both teams' statistics.
+
+Every game is joined with the ``nba_team_history`` row of its home and its
+away team on the game date, which gives one training row per game with the
+statistics both teams carried into it. The join is streamed from a
+server-side cursor in chunks and each chunk is written straight to the
+output file, so memory use does not depend on the number of games.
+
+Parquet and Arrow IPC output is typed (integers, floats, dates) and requires
+pyarrow (optional dependency); CSV output does not.
+"""
+
+import csv
+import os
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional
+    pa = None
+
+from sqlalchemy import Date, Integer, Numeric, and_, select
+from sqlalchemy.orm import aliased
+
+from nba_predictor.core.logger import get_logger
+from nba_predictor.models import Game, TeamHistory, get_db, stream_chunks
+
+logger = get_logger(__name__)
+
+EXPORT_FORMATS = ("parquet", "arrow", "csv")
+_EXTENSIONS = {".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow", ".csv": "csv"}
+
+# Team history columns exported by default (prefixed with home_ / away_)
+DEFAULT_COLUMNS: Tuple[str, ...] = (
+    "game",
+    "win",
+    "last5",
+    "last10",
+    "win_streak",
+    "loss_streak",
+    "pointavg",
+    "pointavga",
+    "pointavg5",
+    "pointavg10",
+    "pace_avg",
+    "efg_avg",
+    "tov_avg",
+    "orb_avg",
+    "ftfga_avg",
+    "ortg_avg",
+    "day_diff",
+)
+
+# Team history columns that identify the row rather than describe the team
+_KEY_COLUMNS = frozenset({"id", "team_name", "date", "season"})
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+class FeatureExportError(Exception):
+    """Exception raised for feature export errors."""
+
+    pass
+
+
+def is_available() -> bool:
+    """Whether pyarrow is installed (needed for Parquet and Arrow output)."""
+    return pa is not None
+
+
+def feature_columns() -> List[str]:
+    """Team history columns that can be exported."""
+    return [
+        column.name for column in TeamHistory.__table__.columns if column.name not in _KEY_COLUMNS
+    ]
+
+
+def _arrow_type(column: Any) -> "pa.DataType":
+    """Arrow type of a SQLAlchemy column."""
+    if isinstance(column.type, Numeric):
+        return pa.float64()
+    if isinstance(column.type, Integer):
+        return pa.int32()
+    if isinstance(column.type, Date):
+        return pa.date32()
+    return pa.string()
+
+
+def _converter(column: Any) -> Optional[Callable[[Any], Any]]:
+    """Python conversion applied to a column's values (Decimal -> float)."""
+    if isinstance(column.type, Numeric):
+        return lambda value: None if value is None else float(value)
+    return None
+
+
+def _statement(
+    columns: Sequence[str],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    seasons: Optional[Sequence[str]],
+    completed_only: bool,
+) -> Any:
+    """The game x home history x away history join, ordered by date."""
+    home_history = aliased(TeamHistory)
+    away_history = aliased(TeamHistory)
+
+    statement = (
+        select(
+            Game.id2.label("game_id"),
+            Game.date,
+            Game.season,
+            Game.home_name,
+            Game.away_name,
+            Game.home_point,
+            Game.away_point,
+            *[getattr(home_history, name).label(f"home_{name}") for name in columns],
+            *[getattr(away_history, name).label(f"away_{name}") for name in columns],
+        )
+        .join(
+            home_history,
+            and_(home_history.team_name == Game.home_name, home_history.date == Game.date),
+        )
+        .join(
+            away_history,
+            and_(away_history.team_name == Game.away_name, away_history.date == Game.date),
+        )
+        .order_by(Game.date, Game.id)
+    )
+
+    if start_date is not None:
+        statement = statement.where(Game.date >= start_date)
+    if end_date is not None:
+        statement = statement.where(Game.date <= end_date)
+    if seasons:
+        statement = statement.where(Game.season.in_([str(season) for season in seasons]))
+    if completed_only:
+        statement = statement.where(Game.home_point.isnot(None), Game.away_point.isnot(None))
+    return statement
+
+
+class _CsvSink:
+    """Write chunks of rows to a CSV file."""
+
+    def __init__(self, path: Path, names: List[str]) -> None:
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(names)
+
+    def write(self, columns: List[List[Any]]) -> None:
+        self._writer.writerows(zip(*columns))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ArrowSink:
+    """Write chunks of rows as record batches of a Parquet or Arrow IPC file."""
+
+    def __init__(self, path: Path, schema: "pa.Schema", export_format: str) -> None:
+        self._schema = schema
+        if export_format == "parquet":
+            self._writer = pq.ParquetWriter(str(path), schema, compression="zstd")
+            self._sink = None
+        else:
+            self._sink = pa.OSFile(str(path), "wb")
+            self._writer = pa.ipc.new_file(
+                self._sink, schema, options=pa.ipc.IpcWriteOptions(compression="zstd")
+            )
+
+    def write(self, columns: List[List[Any]]) -> None:
+        batch = pa.record_batch(
+            [pa.array(values, type=field.type) for values, field in zip(columns, self._schema)],
+            schema=self._schema,
+        )
+        self._writer.write_batch(batch)
+
+    def close(self) -> None:
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+
+def export_features(
+    output: Union[str, Path],
+    export_format: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    seasons: Optional[Sequence[str]] = None,
+    completed_only: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """Export one row per game with both teams' statistics.
+
+    Rows hold the game (``game_id``, ``date``, ``season``, team names and
+    final points) followed by ``home_<column>`` and ``away_<column>`` for
+    each team history column. The file is written under a temporary name
+    and moved into place once complete.
+
+    Args:
+        output: Output file
+        export_format: "parquet", "arrow" or "csv" (default: from the file
+            extension)
+        columns: Team history columns to export (default: ``DEFAULT_COLUMNS``)
+        start_date: First game date (inclusive, optional)
+        end_date: Last game date (inclusive, optional)
+        seasons: Only these seasons (optional)
+        completed_only: Skip games without a final score
+        chunk_size: Rows fetched from the cursor and written per batch
+
+    Returns:
+        Output path, number of rows and number of chunks written
+
+    Raises:
+        FeatureExportError: If the format or a column is unknown, or pyarrow
+            is missing for Parquet/Arrow output
+    """
+    output = Path(output)
+    export_format = export_format or _EXTENSIONS.get(output.suffix.lower())
+    if export_format not in EXPORT_FORMATS:
+        raise FeatureExportError(
+            f"Unknown export format for {output.name}, use one of: {', '.join(EXPORT_FORMATS)}"
+        )
+    if export_format != "csv" and pa is None:
+        raise FeatureExportError(
+            f"{export_format} export requires pyarrow (pip install pyarrow), or use csv"
+        )
+
+    columns = list(columns or DEFAULT_COLUMNS)
+    unknown = [name for name in columns if name not in feature_columns()]
+    if unknown:
+        raise FeatureExportError(
+            f"Unknown team history columns: {', '.join(unknown)} "
+            f"(available: {', '.join(feature_columns())})"
+        )
+
+    statement = _statement(columns, start_date, end_date, seasons, completed_only)
+    selected = list(statement.selected_columns)
+    names = [column.name for column in selected]
+    converters = [_converter(column) for column in selected]
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output.with_name(f"{output.name}.{os.getpid()}.tmp")
+    if export_format == "csv":
+        sink: Union[_CsvSink, _ArrowSink] = _CsvSink(temp_path, names)
+    else:
+        schema = pa.schema([(column.name, _arrow_type(column)) for column in selected])
+        sink = _ArrowSink(temp_path, schema, export_format)
+
+    totals = {"rows": 0, "chunks": 0}
+    try:
+        with get_db() as db:
+            for rows in stream_chunks(db, statement, chunk_size):
+                values = [list(column) for column in zip(*rows)]
+                for index, convert in enumerate(converters):
+                    if convert is not None:
+                        values[index] = [convert(value) for value in values[index]]
+                sink.write(values)
+
+                totals["rows"] += len(rows)
+                totals["chunks"] += 1
+                logger.debug("Feature chunk written", **totals)
+    except BaseException:
+        sink.close()
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    sink.close()
+    os.replace(temp_path, output)
+
+    logger.info(
+        "Features exported",
+        path=str(output),
+        format=export_format,
+        columns=len(names),
+        **totals,
+    )
+    return {"path": str(output), **totals}
@@ -0,0 +1,354 @@
+"""Partitioned columnar archive of play-by-play data.
+
+``nba_playbyplay`` is by far the largest table, and historical analyses only
+ever scan it. Completed games are archived to one file per season and month
+(``season=2024/month=1/part.parquet``), with typed columns and dictionary
+encoded text, which is a fraction of the MySQL size and can be scanned,
+filtered on partitions and memory-mapped without touching the database.
+Archived games can optionally be pruned from MySQL.
+
+Requires pyarrow (optional dependency).
+"""
+
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional
+    pa = None
+
+from sqlalchemy import func
+
+from nba_predictor.core.config import get_settings
+from nba_predictor.core.logger import get_logger
+from nba_predictor.models import Game, PlayByPlay, get_db
+
+logger = get_logger(__name__)
+
+ARCHIVE_FORMATS = ("parquet", "arrow")
+_EXTENSIONS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+# Archived play-by-play columns; the text columns are dictionary encoded
+COLUMNS = (
+    ("game_id", "string"),
+    ("game_date", "date32"),
+    ("quarter", "int8"),
+    ("duration", "float32"),
+    ("away_comment", "string"),
+    ("away_score", "int16"),
+    ("home_score", "int16"),
+    ("home_comment", "string"),
+    ("side", "string"),
+    ("event_type", "string"),
+    ("player_name", "string"),
+    ("shot_value", "int8"),
+    ("is_made", "bool_"),
+    ("detail", "string"),
+)
+TEXT_COLUMNS = [name for name, type_name in COLUMNS if type_name == "string"]
+
+# Games whose plays are read from MySQL per query
+GAME_BATCH_SIZE = 200
+
+
+class ArchiveError(Exception):
+    """Exception raised for play-by-play archive errors."""
+
+    pass
+
+
+def is_available() -> bool:
+    """Whether pyarrow is installed."""
+    return pa is not None
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ArchiveError("The play-by-play archive requires pyarrow (pip install pyarrow)")
+
+
+def _schema() -> "pa.Schema":
+    """Plain (not dictionary encoded) schema of archived plays."""
+    return pa.schema([(name, getattr(pa, type_name)()) for name, type_name in COLUMNS])
+
+
+def _partition_dir(directory: Path, season: str, month: int) -> Path:
+    return directory / f"season={season}" / f"month={month}"
+
+
+def _read_partition(partition: Path) -> Optional["pa.Table"]:
+    """Read the file of a partition (either format) with the plain schema."""
+    for archive_format, extension in _EXTENSIONS.items():
+        path = partition / f"part{extension}"
+        if not path.exists():
+            continue
+        if archive_format == "parquet":
+            table = pq.read_table(path)
+        else:
+            with pa.memory_map(str(path)) as source:
+                table = pa.ipc.open_file(source).read_all()
+        return table.cast(_schema())
+    return None
+
+
+def _write_partition(table: "pa.Table", partition: Path, archive_format: str) -> Path:
+    """Write a partition atomically, replacing a file of the other format."""
+    partition.mkdir(parents=True, exist_ok=True)
+    path = partition / f"part{_EXTENSIONS[archive_format]}"
+    temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+
+    if archive_format == "parquet":
+        pq.write_table(table, temp_path, compression="zstd", use_dictionary=TEXT_COLUMNS)
+    else:
+        encoded = table
+        for name in TEXT_COLUMNS:
+            index = encoded.schema.get_field_index(name)
+            encoded = encoded.set_column(
+                index, name, encoded.column(name).dictionary_encode()
+            )
+        options = pa.ipc.IpcWriteOptions(compression="zstd")
+        with pa.OSFile(str(temp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, encoded.schema, options=options) as writer:
+                writer.write_table(encoded)
+
+    os.replace(temp_path, path)
+    for other_format, extension in _EXTENSIONS.items():
+        if other_format != archive_format:
+            (partition / f"part{extension}").unlink(missing_ok=True)
+    return path
+
+
+def _load_plays(game_dates: Dict[str, Any]) -> "pa.Table":
+    """Read the plays of games from MySQL as an archive table."""
+    columns: Dict[str, List[Any]] = {name: [] for name, _ in COLUMNS}
+    game_ids = sorted(game_dates)
+
+    with get_db() as db:
+        for start in range(0, len(game_ids), GAME_BATCH_SIZE):
+            rows = (
+                db.query(
+                    PlayByPlay.game_id,
+                    PlayByPlay.quarter,
+                    PlayByPlay.duration,
+                    PlayByPlay.away_comment,
+                    PlayByPlay.away_score,
+                    PlayByPlay.home_score,
+                    PlayByPlay.home_comment,
+                    PlayByPlay.side,
+                    PlayByPlay.event_type,
+                    PlayByPlay.player_name,
+                    PlayByPlay.shot_value,
+                    PlayByPlay.is_made,
+                    PlayByPlay.detail,
+                )
+                .filter(PlayByPlay.game_id.in_(game_ids[start : start + GAME_BATCH_SIZE]))
+                .order_by(PlayByPlay.game_id, PlayByPlay.id)
+            )
+            for row in rows:
+                values = row._asdict()
+                values["game_date"] = game_dates[values["game_id"]]
+                values["quarter"] = int(values["quarter"])
+                values["duration"] = float(values["duration"])
+                for name, column in columns.items():
+                    column.append(values[name])
+
+    return pa.table(columns, schema=_schema())
+
+
+def archive_play_by_play(
+    season: str,
+    months: Optional[Sequence[int]] = None,
+    prune: bool = False,
+    directory: Optional[Union[str, Path]] = None,
+    archive_format: Optional[str] = None,
+) -> Dict[str, int]:
+    """Archive the play-by-play of a season's completed games.
+
+    Each season/month partition is rewritten with the games found in MySQL;
+    games archived earlier (and possibly pruned since) are kept. Re-running
+    is safe.
+
+    Args:
+        season: NBA season year
+        months: Calendar months to archive (default: all)
+        prune: Delete the archived plays from MySQL once the partition has
+            been written and its row counts verified
+        directory: Archive directory (default: ``EXPORT_PBP_ARCHIVE_DIR``)
+        archive_format: "parquet" or "arrow" (default: ``EXPORT_PBP_ARCHIVE_FORMAT``)
+
+    Returns:
+        Number of partitions written, games and plays archived, and plays pruned
+
+    Raises:
+        ArchiveError: If pyarrow is missing, the format is unknown or a
+            written partition does not match MySQL
+    """
+    _require_pyarrow()
+    settings = get_settings().export
+    directory = Path(directory or settings.pbp_archive_dir)
+    archive_format = archive_format or settings.pbp_archive_format
+    if archive_format not in ARCHIVE_FORMATS:
+        raise ArchiveError(f"Unknown archive format: {archive_format}")
+
+    # Completed games of the season that still have plays in MySQL
+    with get_db() as db:
+        games = (
+            db.query(Game.id2, Game.date)
+            .join(PlayByPlay, PlayByPlay.game_id == Game.id2)
+            .filter(
+                Game.season == season,
+                Game.home_point.isnot(None),
+                Game.away_point.isnot(None),
+            )
+            .distinct()
+            .all()
+        )
+
+    partitions: Dict[int, Dict[str, Any]] = defaultdict(dict)
+    for game_id, game_date in games:
+        if months is None or game_date.month in months:
+            partitions[game_date.month][game_id] = game_date
+
+    totals = {"partitions": 0, "games": 0, "plays": 0, "pruned": 0}
+    for month, game_dates in sorted(partitions.items()):
+        plays = _load_plays(game_dates)
+
+        partition = _partition_dir(directory, season, month)
+        existing = _read_partition(partition)
+        if existing is not None:
+            archived_ids = pa.array(list(game_dates), pa.string())
+            keep = pc.invert(pc.is_in(existing["game_id"], value_set=archived_ids))
+            plays = pa.concat_tables([existing.filter(keep), plays])
+        plays = plays.sort_by([("game_date", "ascending"), ("game_id", "ascending")])
+
+        path = _write_partition(plays, partition, archive_format)
+        totals["partitions"] += 1
+        totals["games"] += len(game_dates)
+        totals["plays"] += plays.num_rows
+        logger.info(
+            "Play-by-play partition written",
+            path=str(path),
+            games=len(game_dates),
+            plays=plays.num_rows,
+        )
+
+        if prune:
+            totals["pruned"] += _prune(path, game_dates)
+
+    logger.info("Play-by-play archived", season=season, **totals)
+    return totals
+
+
+def _prune(path: Path, game_dates: Dict[str, Any]) -> int:
+    """Delete archived plays from MySQL after checking the written file."""
+    written = _read_partition(path.parent)
+    archived_counts = dict(
+        zip(
+            *written.group_by("game_id").aggregate([("game_id", "count")]).to_pydict().values()
+        )
+    )
+    game_ids = sorted(game_dates)
+
+    pruned = 0
+    with get_db() as db:
+        for start in range(0, len(game_ids), GAME_BATCH_SIZE):
+            batch = game_ids[start : start + GAME_BATCH_SIZE]
+            stored_counts = dict(
+                db.query(PlayByPlay.game_id, func.count(PlayByPlay.id))
+                .filter(PlayByPlay.game_id.in_(batch))
+                .group_by(PlayByPlay.game_id)
+                .all()
+            )
+            mismatched = [
+                game_id
+                for game_id, count in stored_counts.items()
+                if archived_counts.get(game_id) != count
+            ]
+            if mismatched:
+                raise ArchiveError(
+                    f"Archive does not match MySQL for {len(mismatched)} games "
+                    f"(e.g. {mismatched[0]}), nothing pruned from this batch"
+                )
+            pruned += (
+                db.query(PlayByPlay)
+                .filter(PlayByPlay.game_id.in_(batch))
+                .delete(synchronize_session=False)
+            )
+
+    logger.info("Archived plays pruned from MySQL", path=str(path), plays=pruned)
+    return pruned
+
+
+def read_play_by_play(
+    seasons: Optional[Iterable[str]] = None,
+    months: Optional[Iterable[int]] = None,
+    game_ids: Optional[Iterable[str]] = None,
+    columns: Optional[List[str]] = None,
+    directory: Optional[Union[str, Path]] = None,
+) -> "pa.Table":
+    """Read archived play-by-play.
+
+    Season and month filters prune whole partitions; files are memory-mapped
+    and text columns come back dictionary encoded. Both archive formats can
+    be mixed in one directory.
+
+    Args:
+        seasons: Only these seasons (optional)
+        months: Only these calendar months (optional)
+        game_ids: Only these games (optional)
+        columns: Columns to read (default: all, plus ``season`` and ``month``)
+        directory: Archive directory (default: ``EXPORT_PBP_ARCHIVE_DIR``)
+
+    Returns:
+        Arrow table of plays (convert with ``.to_pandas()`` if needed)
+
+    Raises:
+        ArchiveError: If pyarrow is missing
+    """
+    _require_pyarrow()
+    directory = Path(directory or get_settings().export.pbp_archive_dir)
+
+    partitioning = ds.partitioning(
+        pa.schema([("season", pa.string()), ("month", pa.int8())]), flavor="hive"
+    )
+    filesystem = pafs.LocalFileSystem(use_mmap=True)
+    formats = {
+        "parquet": ds.ParquetFileFormat(
+            read_options=ds.ParquetReadOptions(dictionary_columns=TEXT_COLUMNS)
+        ),
+        "arrow": ds.IpcFileFormat(),
+    }
+
+    datasets = []
+    for archive_format, extension in _EXTENSIONS.items():
+        files = sorted(str(path) for path in directory.glob(f"season=*/month=*/part{extension}"))
+        if files:
+            datasets.append(
+                ds.dataset(
+                    files,
+                    format=formats[archive_format],
+                    partitioning=partitioning,
+                    partition_base_dir=str(directory),
+                    filesystem=filesystem,
+                )
+            )
+    if not datasets:
+        return _schema().empty_table()
+
+    dataset = datasets[0] if len(datasets) == 1 else ds.dataset(datasets)
+
+    expression = None
+    for field, values in (("season", seasons), ("month", months), ("game_id", game_ids)):
+        if values is None:
+            continue
+        condition = ds.field(field).isin(list(values))
+        expression = condition if expression is None else expression & condition
+
+    return dataset.to_table(columns=columns, filter=expression)
@@ -1,9 +1,18 @@
 """Database models for NBA Predictor."""
 
-from nba_predictor.models.database import Base, create_tables, get_db, init_db
-from nba_predictor.models.game import Game, PlayByPlay, PlayerGameStats
+from nba_predictor.models.database import (
+    Base,
+    create_tables,
+    get_db,
+    init_db,
+    stream_chunks,
+    stream_query,
+)
+from nba_predictor.models.game import Game, PlayByPlay, PlayByPlayQuarter, PlayerGameStats
 from nba_predictor.models.lineup import DailyLineup
+from nba_predictor.models.player import Player, PlayerImpact
 from nba_predictor.models.prediction import Prediction, PredictionFactor
+from nba_predictor.models.rating import TeamRating
 from nba_predictor.models.team import Team, TeamHistory
 
 __all__ = [
@@ -11,12 +20,18 @@ __all__ = [
     "create_tables",
     "get_db",
     "init_db",
+    "stream_chunks",
+    "stream_query",
     "Game",
     "PlayByPlay",
+    "PlayByPlayQuarter",
     "PlayerGameStats",
     "DailyLineup",
+    "Player",
+    "PlayerImpact",
     "Prediction",
     "PredictionFactor",
+    "TeamRating",
     "Team",
     "TeamHistory",
 ]
@@ -1,10 +1,12 @@
 """Database configuration and session management."""
 
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Generator, Iterator, Sequence
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from pymysql.constants import CLIENT
+from sqlalchemy import Row, create_engine
+from sqlalchemy.orm import DeclarativeBase, Query, Session, sessionmaker
+from sqlalchemy.sql import Executable
 
 from nba_predictor.core.config import get_settings
 from nba_predictor.core.logger import get_logger
@@ -18,23 +20,65 @@ class Base(DeclarativeBase):
     pass
 
 
+# Rows fetched from a server-side cursor per round trip
+STREAM_CHUNK_SIZE = 1000
+
 # Global engine and session factory
 _engine = None
 _SessionLocal = None
 
 
+def _client_flag(names: str) -> int:
+    """Combine comma-separated pymysql client flag names into a bit mask.
+
+    Raises:
+        ValueError: If a flag name is unknown
+    """
+    flag = 0
+    for name in filter(None, names.split(",")):
+        value = getattr(CLIENT, name, None)
+        if not isinstance(value, int):
+            raise ValueError(f"Unknown pymysql client flag: {name}")
+        flag |= value
+    return flag
+
+
 def init_db() -> None:
-    """Initialize database engine and session factory."""
+    """Initialize database engine and session factory.
+
+    Pool size, overflow, timeouts, statement echo, isolation level and
+    client flags come from ``DatabaseSettings`` (``DB_*`` variables).
+    """
     global _engine, _SessionLocal
 
-    settings = get_settings()
-    logger.info("Initializing database", db_url=settings.database.url.split("@")[1])
+    config = get_settings().database
+    logger.info(
+        "Initializing database",
+        db_url=config.url.split("@")[1],
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        isolation_level=config.isolation_level,
+        client_flags=config.client_flags or None,
+    )
+
+    url = config.url
+    if config.client_flags:
+        # Passed in the URL so the dialect still adds its own FOUND_ROWS flag
+        url += f"&client_flag={_client_flag(config.client_flags)}"
+
+    engine_options = {}
+    if config.isolation_level:
+        engine_options["isolation_level"] = config.isolation_level
 
     _engine = create_engine(
-        settings.database.url,
-        echo=settings.app.env == "development",
+        url,
+        echo=config.echo,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_recycle=config.pool_recycle,
         pool_pre_ping=True,
-        pool_recycle=3600,
+        **engine_options,
     )
 
     _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
@@ -75,3 +119,47 @@ def get_db() -> Generator[Session, None, None]:
         raise
     finally:
         db.close()
+
+
+def stream_query(query: Query, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Any]:
+    """Iterate a query's rows from a server-side cursor.
+
+    Rows (or ORM objects) are fetched ``chunk_size`` at a time instead of
+    the whole result being loaded first, so memory stays bounded and
+    processing starts with the first chunk. On MySQL this uses pymysql's
+    unbuffered ``SSCursor``; the session's connection cannot run other
+    statements until the iteration is finished.
+
+    Args:
+        query: ORM query to iterate
+        chunk_size: Rows fetched per round trip
+
+    Yields:
+        Query rows
+
+    Example:
+        with get_db() as db:
+            for game in stream_query(db.query(Game).order_by(Game.date)):
+                ...
+    """
+    yield from query.yield_per(chunk_size)
+
+
+def stream_chunks(
+    db: Session, statement: Executable, chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[Sequence[Row]]:
+    """Execute a statement on a server-side cursor and yield its rows in chunks.
+
+    Like ``stream_query``, for consumers that process a batch of rows at a
+    time (bulk writes, columnar exports).
+
+    Args:
+        db: Database session
+        statement: Select statement
+        chunk_size: Rows per chunk
+
+    Yields:
+        Lists of at most ``chunk_size`` rows
+    """
+    result = db.execute(statement.execution_options(stream_results=True, yield_per=chunk_size))
+    yield from result.partitions()
@@ -4,7 +4,18 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import Boolean, Date, DateTime, Integer, Numeric, String, Text
+from sqlalchemy import (
+    Boolean,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    SmallInteger,
+    String,
+    Text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from nba_predictor.models.database import Base
@@ -80,10 +91,51 @@ class PlayByPlay(Base):
     away_comment: Mapped[Optional[str]] = mapped_column(Text)
     away_score: Mapped[Optional[int]] = mapped_column(Integer)
 
+    # Classified at import (see scraper.pbp_parser); NULL for rows imported before
+    side: Mapped[Optional[str]] = mapped_column(String(1))  # "H" or "A"
+    event_type: Mapped[Optional[str]] = mapped_column(String(16), index=True)
+    player_name: Mapped[Optional[str]] = mapped_column(String(100))
+    shot_value: Mapped[Optional[int]] = mapped_column(SmallInteger)
+    is_made: Mapped[Optional[bool]] = mapped_column(Boolean)
+    detail: Mapped[Optional[str]] = mapped_column(String(30))
+
     def __repr__(self) -> str:
         return f"<PlayByPlay(game='{self.game_id}', quarter={self.quarter}, duration={self.duration})>"
 
 
+class PlayByPlayQuarter(Base):
+    """Play-by-play counts of one team in one quarter of a game.
+
+    Maintained when play-by-play is imported, so per-quarter shooting,
+    turnovers and rebounds are indexed reads instead of text scans.
+    """
+
+    __tablename__ = "nba_pbp_quarter_stats"
+    __table_args__ = (Index("idx_game_quarter_side", "game_id", "quarter", "side", unique=True),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    game_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    quarter: Mapped[int] = mapped_column(SmallInteger, nullable=False)  # 5+ are overtimes
+    side: Mapped[str] = mapped_column(String(1), nullable=False)  # "H" or "A"
+
+    field_goals: Mapped[int] = mapped_column(SmallInteger, default=0)
+    field_goal_attempts: Mapped[int] = mapped_column(SmallInteger, default=0)
+    three_pointers: Mapped[int] = mapped_column(SmallInteger, default=0)
+    three_point_attempts: Mapped[int] = mapped_column(SmallInteger, default=0)
+    free_throws: Mapped[int] = mapped_column(SmallInteger, default=0)
+    free_throw_attempts: Mapped[int] = mapped_column(SmallInteger, default=0)
+    offensive_rebounds: Mapped[int] = mapped_column(SmallInteger, default=0)
+    defensive_rebounds: Mapped[int] = mapped_column(SmallInteger, default=0)
+    turnovers: Mapped[int] = mapped_column(SmallInteger, default=0)
+    fouls: Mapped[int] = mapped_column(SmallInteger, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<PlayByPlayQuarter(game='{self.game_id}', quarter={self.quarter}, "
+            f"side='{self.side}', fg={self.field_goals}/{self.field_goal_attempts})>"
+        )
+
+
 class PlayerGameStats(Base):
     """Player game statistics model."""
 
@@ -95,10 +147,13 @@ class PlayerGameStats(Base):
     season: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
     team_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     player_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    player_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("nba_player.id"), index=True
+    )
     is_starter: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    # Playing time
-    minutes_played: Mapped[Optional[str]] = mapped_column(String(10))
+    # Playing time in seconds (box score "34:12" -> 2052)
+    seconds_played: Mapped[Optional[int]] = mapped_column(Integer)
 
     # Shooting stats
     field_goals: Mapped[int] = mapped_column(Integer, default=0)
@@ -129,7 +184,7 @@ class PlayerGameStats(Base):
     points: Mapped[int] = mapped_column(Integer, default=0)
 
     # Plus/minus
-    plus_minus: Mapped[Optional[str]] = mapped_column(String(10))
+    plus_minus: Mapped[Optional[int]] = mapped_column(Integer)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
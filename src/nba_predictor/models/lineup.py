@@ -3,7 +3,7 @@
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import Date, DateTime, Integer, String, Text
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from nba_predictor.models.database import Base
@@ -13,12 +13,20 @@ class DailyLineup(Base):
     """Daily lineup and injury status model."""
 
     __tablename__ = "nba_daily_lineup"
+    __table_args__ = (
+        # Slate loader: latest scrape per team for a game date
+        Index("idx_game_date_team_scrape", "game_date", "team_name", "scrape_date"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     scrape_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
     game_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
     team_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     player_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    # Linked nba_player row (NULL when no confident match)
+    player_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("nba_player.id"), index=True
+    )
     position: Mapped[Optional[str]] = mapped_column(String(10))
     status: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     injury_description: Mapped[Optional[str]] = mapped_column(Text)
@@ -0,0 +1,72 @@
+"""Player registry database models."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from nba_predictor.models.database import Base
+
+
+class Player(Base):
+    """Canonical player identity.
+
+    Lineup and box-score rows refer to players by free-text names; both are
+    linked to a row of this table at import time (``player_id``), so player
+    level joins are integer lookups.
+    """
+
+    __tablename__ = "nba_player"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    # Normalized name (accents folded, punctuation and suffixes removed)
+    name_key: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    # Basketball Reference player ID, e.g. "jamesle01"
+    bbref_id: Mapped[Optional[str]] = mapped_column(String(20), unique=True)
+    # Team the player was last seen with, used to break name ties
+    team_name: Mapped[Optional[str]] = mapped_column(String(100))
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, onupdate=datetime.now
+    )
+
+    def __repr__(self) -> str:
+        return f"<Player(id={self.id}, name='{self.name}', team='{self.team_name}')>"
+
+
+class PlayerImpact(Base):
+    """Rolling per-game production of a player.
+
+    One row per player, holding exponentially weighted averages over the
+    player's recent games. Rows are updated incrementally as box scores are
+    imported, so the predictor reads a player's impact with a primary key
+    lookup instead of scanning box scores.
+    """
+
+    __tablename__ = "nba_player_impact"
+
+    player_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("nba_player.id"), primary_key=True, autoincrement=False
+    )
+    # Team of the player's latest game
+    team_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    last_game_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    games: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Weighted averages per game
+    minutes: Mapped[Decimal] = mapped_column(Numeric(5, 2), nullable=False)
+    points: Mapped[Decimal] = mapped_column(Numeric(5, 2), nullable=False)
+    # Possessions used: FGA + 0.44 * FTA + TOV
+    possessions: Mapped[Decimal] = mapped_column(Numeric(5, 2), nullable=False)
+    plus_minus: Mapped[Decimal] = mapped_column(Numeric(5, 2), nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<PlayerImpact(player_id={self.player_id}, team='{self.team_name}', "
+            f"min={self.minutes}, pts={self.points})>"
+        )
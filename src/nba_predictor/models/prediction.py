@@ -4,7 +4,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import Date, DateTime, Integer, Numeric, String, Text, Boolean, ForeignKey
+from sqlalchemy import Date, DateTime, Integer, Numeric, String, Text, Boolean, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from nba_predictor.models.database import Base
@@ -14,6 +14,12 @@ class Prediction(Base):
     """AI prediction model for NBA games."""
 
     __tablename__ = "nba_prediction"
+    __table_args__ = (
+        # Covers the accuracy report aggregation (season/model filter + outcome)
+        Index("idx_season_model_version", "season", "model_version", "is_correct"),
+        # Pages over pending predictions when reconciling results
+        Index("idx_actual_winner", "actual_winner"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
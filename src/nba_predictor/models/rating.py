@@ -0,0 +1,34 @@
+"""Team rating database models."""
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, Index, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from nba_predictor.models.database import Base
+
+
+class TeamRating(Base):
+    """Elo rating snapshot of a team after the games of a date.
+
+    Only teams that played on a date get a row, so a season holds about two
+    rows per game.
+    """
+
+    __tablename__ = "nba_team_rating"
+    __table_args__ = (
+        # Latest rating of a team before a date
+        Index("idx_team_date", "team_name", "date", unique=True),
+        Index("idx_season_date", "season", "date"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    team_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    date: Mapped[date] = mapped_column(Date, nullable=False)
+    season: Mapped[str] = mapped_column(String(10), nullable=False)
+    elo: Mapped[Decimal] = mapped_column(Numeric(7, 2), nullable=False)
+    games: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<TeamRating(team='{self.team_name}', date='{self.date}', elo={self.elo})>"
@@ -0,0 +1,200 @@
+"""Prediction accuracy reporting from stored predictions."""
+
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import String, and_, case, cast, exists, func, union_all
+from sqlalchemy.orm import Session
+
+from nba_predictor.core.logger import get_logger
+from nba_predictor.models import Game, Prediction, get_db
+
+logger = get_logger(__name__)
+
+
+def _home_win_probability() -> Any:
+    """SQL expression for the home-win probability implied by a prediction."""
+    winner_prob = Prediction.confidence / 100
+    return case(
+        (Prediction.predicted_winner == Prediction.home_team, winner_prob),
+        else_=1 - winner_prob,
+    )
+
+
+def _confidence_bucket() -> Any:
+    """SQL expression mapping confidence to the lower bound of its 10-point bucket."""
+    return case(
+        (Prediction.confidence < 50, 0),
+        (Prediction.confidence < 60, 50),
+        (Prediction.confidence < 70, 60),
+        (Prediction.confidence < 80, 70),
+        (Prediction.confidence < 90, 80),
+        else_=90,
+    )
+
+
+def _metric_columns(columns: Any) -> List[Any]:
+    """Aggregate columns shared by every report grouping.
+
+    Args:
+        columns: Column collection of the scored predictions subquery
+    """
+    home_won = case((columns.actual_winner == columns.home_team, 1), else_=0)
+    error = columns.home_prob - home_won
+    return [
+        func.count().label("predictions"),
+        func.sum(case((columns.is_correct.is_(True), 1), else_=0)).label("correct"),
+        func.avg(columns.confidence).label("average_confidence"),
+        func.avg(error * error).label("brier_score"),
+    ]
+
+
+def _format_rows(rows: List[Any], keys: List[str]) -> List[Dict[str, Any]]:
+    """Convert aggregate rows into report dictionaries."""
+    report = []
+    for row in rows:
+        entry = {key: getattr(row, key) for key in keys}
+        predictions = int(row.predictions)
+        correct = int(row.correct or 0)
+        entry.update(
+            {
+                "predictions": predictions,
+                "correct": correct,
+                "accuracy_percentage": (
+                    round(correct / predictions * 100, 2) if predictions else 0.0
+                ),
+                "average_confidence": round(float(row.average_confidence or 0), 2),
+                "brier_score": (
+                    round(float(row.brier_score), 4) if row.brier_score is not None else None
+                ),
+            }
+        )
+        report.append(entry)
+    return report
+
+
+def _count_missing(db: Session, season: Optional[str], model_version: Optional[str]) -> int:
+    """Count completed games that have no stored prediction."""
+    conditions = [Prediction.game_id == Game.id2]
+    if model_version:
+        conditions.append(Prediction.model_version == model_version)
+
+    query = db.query(func.count(Game.id)).filter(
+        Game.home_point.isnot(None),
+        ~exists().where(and_(*conditions)),
+    )
+    if season:
+        query = query.filter(Game.season == season)
+
+    return int(query.scalar() or 0)
+
+
+def accuracy_report(
+    season: Optional[str] = None, model_version: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build an accuracy report from stored, reconciled predictions.
+
+    All aggregation happens in the database; no model calls are made. Only
+    predictions with a known outcome (``is_correct`` set) are counted, and a
+    game predicted several times by the same model version counts once,
+    with its latest prediction.
+
+    Args:
+        season: Restrict the report to one season (optional)
+        model_version: Restrict the report to one model version (optional)
+
+    Returns:
+        Report with overall, per-confidence-bucket and per-team breakdowns,
+        each grouped by season and model version, plus the number of
+        completed games without a stored prediction
+    """
+    logger.info("Building accuracy report", season=season, model_version=model_version)
+
+    filters = [Prediction.is_correct.isnot(None)]
+    if season:
+        filters.append(Prediction.season == season)
+    if model_version:
+        filters.append(Prediction.model_version == model_version)
+
+    base_columns = [
+        Prediction.id,
+        Prediction.season,
+        Prediction.model_version,
+        Prediction.home_team,
+        Prediction.away_team,
+        Prediction.predicted_winner,
+        Prediction.actual_winner,
+        Prediction.confidence,
+        Prediction.is_correct,
+        _home_win_probability().label("home_prob"),
+        _confidence_bucket().label("bucket"),
+    ]
+
+    with get_db() as db:
+        # Latest prediction per game and model version (rows without a game
+        # reference are kept individually)
+        latest = (
+            db.query(func.max(Prediction.id).label("id"))
+            .filter(*filters)
+            .group_by(
+                func.coalesce(Prediction.game_id, cast(Prediction.id, String)),
+                Prediction.model_version,
+            )
+            .subquery()
+        )
+        scored = (
+            db.query(*base_columns).join(latest, Prediction.id == latest.c.id).subquery()
+        )
+        group = [scored.c.season, scored.c.model_version]
+
+        overall = (
+            db.query(*group, *_metric_columns(scored.c))
+            .group_by(*group)
+            .order_by(*group)
+            .all()
+        )
+
+        by_confidence = (
+            db.query(*group, scored.c.bucket, *_metric_columns(scored.c))
+            .group_by(*group, scored.c.bucket)
+            .order_by(*group, scored.c.bucket)
+            .all()
+        )
+
+        # Each prediction counts for both teams of the game
+        team_rows = union_all(
+            db.query(*scored.c, scored.c.home_team.label("team")).statement,
+            db.query(*scored.c, scored.c.away_team.label("team")).statement,
+        ).subquery()
+        by_team = (
+            db.query(
+                team_rows.c.season,
+                team_rows.c.model_version,
+                team_rows.c.team,
+                *_metric_columns(team_rows.c),
+            )
+            .group_by(team_rows.c.season, team_rows.c.model_version, team_rows.c.team)
+            .order_by(team_rows.c.season, team_rows.c.model_version, team_rows.c.team)
+            .all()
+        )
+
+        games_missing = _count_missing(db, season, model_version)
+
+    confidence_report = _format_rows(by_confidence, ["season", "model_version", "bucket"])
+    for entry in confidence_report:
+        lower = int(entry["bucket"])
+        upper = 49 if lower == 0 else (100 if lower == 90 else lower + 9)
+        entry["bucket"] = f"{lower}-{upper}"
+
+    report = {
+        "overall": _format_rows(overall, ["season", "model_version"]),
+        "by_confidence": confidence_report,
+        "by_team": _format_rows(by_team, ["season", "model_version", "team"]),
+        "games_missing": games_missing,
+    }
+
+    logger.info(
+        "Accuracy report complete",
+        groups=len(report["overall"]),
+        games_missing=games_missing,
+    )
+    return report
@@ -0,0 +1,323 @@
+"""Concurrent, resumable backtesting of game predictors."""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date
+from typing import Any, Dict, List, Optional, Protocol, Set, Tuple
+
+from nba_predictor.core.logger import get_logger
+from nba_predictor.models import Game, Prediction, get_db, stream_query
+
+logger = get_logger(__name__)
+
+
+class GamePredictor(Protocol):
+    """Interface shared by predictors that can be backtested."""
+
+    model_version: str
+
+    def predict_game(
+        self, home_team: str, away_team: str, game_date: date, save_to_db: bool = True
+    ) -> Dict[str, Any]:
+        """Predict outcome of a specific game."""
+        ...
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing out call starts to a maximum rate."""
+
+    def __init__(self, requests_per_minute: float) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Maximum number of calls started per minute
+        """
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller may start its next call."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class BacktestMetrics:
+    """Incrementally maintained accuracy, Brier score and calibration metrics."""
+
+    # Lower bounds of the winner-confidence buckets used for calibration
+    BUCKETS = (0, 50, 60, 70, 80, 90)
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.games = 0
+        self.correct = 0
+        self.total_confidence = 0.0
+        self.total_brier = 0.0
+        self.buckets: Dict[int, Dict[str, float]] = {
+            bucket: {"games": 0, "correct": 0, "confidence": 0.0} for bucket in self.BUCKETS
+        }
+
+    def add(
+        self, home_team: str, predicted_winner: str, confidence: float, actual_winner: str
+    ) -> None:
+        """Add one evaluated prediction.
+
+        Args:
+            home_team: Home team name
+            predicted_winner: Team the predictor picked
+            confidence: Confidence in the predicted winner (0-100)
+            actual_winner: Team that actually won
+        """
+        confidence = min(max(float(confidence), 0.0), 100.0)
+        is_correct = predicted_winner == actual_winner
+
+        # Brier score on the home-win probability implied by the prediction
+        winner_prob = confidence / 100
+        home_prob = winner_prob if predicted_winner == home_team else 1 - winner_prob
+        home_won = 1.0 if actual_winner == home_team else 0.0
+
+        self.games += 1
+        self.correct += int(is_correct)
+        self.total_confidence += confidence
+        self.total_brier += (home_prob - home_won) ** 2
+
+        bucket = max(b for b in self.BUCKETS if confidence >= b)
+        self.buckets[bucket]["games"] += 1
+        self.buckets[bucket]["correct"] += int(is_correct)
+        self.buckets[bucket]["confidence"] += confidence
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize metrics.
+
+        Returns:
+            Dictionary with accuracy, average confidence, Brier score and calibration
+        """
+        calibration = []
+        for lower, values in self.buckets.items():
+            if not values["games"]:
+                continue
+            upper = next((b for b in self.BUCKETS if b > lower), 101) - 1
+            calibration.append(
+                {
+                    "bucket": f"{lower}-{min(upper, 100)}",
+                    "games": int(values["games"]),
+                    "average_confidence": round(values["confidence"] / values["games"], 2),
+                    "accuracy_percentage": round(values["correct"] / values["games"] * 100, 2),
+                }
+            )
+
+        return {
+            "games_analyzed": self.games,
+            "correct_predictions": self.correct,
+            "accuracy_percentage": (
+                round(self.correct / self.games * 100, 2) if self.games else 0.0
+            ),
+            "average_confidence": (
+                round(self.total_confidence / self.games, 2) if self.games else 0.0
+            ),
+            "brier_score": round(self.total_brier / self.games, 4) if self.games else None,
+            "calibration": calibration,
+        }
+
+
+class BacktestEngine:
+    """Replay completed games through a predictor under a rate limit.
+
+    Games are replayed in date order and predicted concurrently. Every
+    prediction is checkpointed as a ``Prediction`` row, so an interrupted run
+    resumes where it stopped: games that already have a prediction from the
+    same model version are scored from the stored row instead of predicted again.
+
+    Predictors with a baseline (gate or fallback) may answer some games with
+    the baseline model. Those predictions are stored under the baseline's
+    model version, count as checkpoints too, and are reported separately
+    from the predictor's own metrics.
+    """
+
+    def __init__(
+        self,
+        predictor: GamePredictor,
+        workers: int = 4,
+        requests_per_minute: float = 50,
+    ) -> None:
+        """Initialize backtest engine.
+
+        Args:
+            predictor: Predictor to evaluate
+            workers: Number of concurrent predictions
+            requests_per_minute: Maximum number of predictions started per minute
+        """
+        self.predictor = predictor
+        self.workers = max(1, workers)
+        self.rate_limiter = RateLimiter(requests_per_minute)
+
+    def run(self, season: str, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Backtest a season.
+
+        Args:
+            season: NBA season year
+            limit: Maximum number of games to evaluate (default: whole season)
+
+        Returns:
+            Accuracy metrics with counts of predicted, resumed and skipped games
+        """
+        model_version = self.predictor.model_version
+        baseline = getattr(self.predictor, "baseline", None)
+        model_versions = [model_version]
+        if baseline is not None and baseline.model_version != model_version:
+            model_versions.append(baseline.model_version)
+
+        logger.info(
+            "Starting backtest",
+            season=season,
+            model_version=model_version,
+            workers=self.workers,
+            limit=limit,
+        )
+
+        stored = self._load_checkpoints(season, model_versions)
+        metrics = BacktestMetrics()
+        baseline_metrics = BacktestMetrics()
+
+        def metrics_for(version: str) -> BacktestMetrics:
+            return metrics if version == model_version else baseline_metrics
+        predicted = 0
+        resumed = 0
+        skipped = 0
+
+        in_flight: Dict[Future, Tuple[str, str]] = {}
+        max_in_flight = self.workers * 2
+
+        def collect(done: Set[Future]) -> None:
+            nonlocal predicted, skipped
+            for future in done:
+                home_team, actual_winner = in_flight.pop(future)
+                try:
+                    prediction = future.result()
+                except Exception as e:
+                    logger.warning("Skipped game in backtest", home=home_team, error=str(e))
+                    skipped += 1
+                    continue
+
+                metrics_for(prediction.get("model_version", model_version)).add(
+                    home_team,
+                    prediction["predicted_winner"],
+                    prediction["confidence"],
+                    actual_winner,
+                )
+                predicted += 1
+
+        # Load the season (about 1.2k small rows) before predicting, so no
+        # cursor or connection stays open during rate-limited calls
+        with get_db() as db:
+            query = (
+                db.query(
+                    Game.id2,
+                    Game.date,
+                    Game.home_name,
+                    Game.away_name,
+                    Game.home_point,
+                    Game.away_point,
+                )
+                .filter(Game.season == season, Game.home_point.isnot(None))
+                .order_by(Game.date, Game.id)
+            )
+            if limit:
+                query = query.limit(limit)
+            games = query.all()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for game_id, game_date, home_team, away_team, home_point, away_point in games:
+                actual_winner = home_team if home_point > away_point else away_team
+
+                if game_id in stored:
+                    predicted_winner, confidence, version = stored[game_id]
+                    metrics_for(version).add(
+                        home_team, predicted_winner, confidence, actual_winner
+                    )
+                    resumed += 1
+                    continue
+
+                if len(in_flight) >= max_in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+                future = executor.submit(self._predict, home_team, away_team, game_date)
+                in_flight[future] = (home_team, actual_winner)
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        results = metrics.to_dict()
+        results.update(
+            {
+                "model_version": model_version,
+                "games_predicted": predicted,
+                "games_resumed": resumed,
+                "games_skipped": skipped,
+                # Games answered by the baseline model (gate or fallback)
+                "baseline": (
+                    {"model_version": model_versions[-1], **baseline_metrics.to_dict()}
+                    if baseline_metrics.games
+                    else None
+                ),
+            }
+        )
+
+        logger.info("Backtest complete", metrics=results)
+        return results
+
+    def _predict(self, home_team: str, away_team: str, game_date: date) -> Dict[str, Any]:
+        """Predict and checkpoint a single game under the rate limit."""
+        self.rate_limiter.wait()
+        return self.predictor.predict_game(home_team, away_team, game_date, save_to_db=True)
+
+    def _load_checkpoints(
+        self, season: str, model_versions: List[str]
+    ) -> Dict[str, Tuple[str, float, str]]:
+        """Load stored predictions for a season.
+
+        Args:
+            season: NBA season year
+            model_versions: Model version of the predictor being evaluated,
+                followed by the version of its baseline (if any)
+
+        Returns:
+            Mapping of game ID to (predicted winner, confidence, model version)
+            of the latest prediction; the predictor's own predictions take
+            precedence over baseline ones
+        """
+        with get_db() as db:
+            query = (
+                db.query(
+                    Prediction.game_id,
+                    Prediction.predicted_winner,
+                    Prediction.confidence,
+                    Prediction.model_version,
+                )
+                .filter(
+                    Prediction.season == season,
+                    Prediction.model_version.in_(model_versions),
+                    Prediction.game_id.isnot(None),
+                )
+                .order_by(Prediction.created_at)
+            )
+            # Later predictions of a game overwrite earlier ones
+            checkpoints: Dict[str, Tuple[str, float, str]] = {}
+            for game_id, winner, confidence, version in stream_query(query):
+                previous = checkpoints.get(game_id)
+                if previous and previous[2] == model_versions[0] != version:
+                    continue
+                checkpoints[game_id] = (winner, float(confidence), version)
+
+        logger.info("Loaded backtest checkpoints", count=len(checkpoints))
+        return checkpoints
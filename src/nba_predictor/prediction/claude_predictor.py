@@ -1,18 +1,103 @@
 """Claude AI-powered NBA game predictor."""
 
 import json
-from datetime import date, datetime
-from decimal import Decimal
-from typing import Any, Dict, List, Optional
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
 
-from anthropic import Anthropic
+from sqlalchemy import and_, func
 
+from nba_predictor.core.anthropic_client import get_anthropic_client
 from nba_predictor.core.config import get_settings
 from nba_predictor.core.logger import get_logger
-from nba_predictor.models import DailyLineup, Game, Prediction, PredictionFactor, TeamHistory, get_db
+from nba_predictor.core.structured_output import (
+    StructuredOutputError,
+    request_structured,
+    tool_definition,
+)
+from nba_predictor.models import DailyLineup, Game, TeamHistory, TeamRating, get_db
+from nba_predictor.prediction.accuracy import accuracy_report
+from nba_predictor.prediction.backtest import BacktestEngine
+from nba_predictor.prediction.baseline import BaselinePredictor
+from nba_predictor.prediction.prompt_encoder import (
+    COMPACT_FORMAT_LEGEND,
+    PROMPT_FORMATS,
+    encode_matchup,
+)
+from nba_predictor.prediction.schemas import GamePrediction
+from nba_predictor.prediction.storage import save_prediction
+from nba_predictor.utils.injuries import (
+    STATUS_GTD,
+    STATUS_OUT,
+    STATUS_QUESTIONABLE,
+    normalize_lineup_status,
+)
+from nba_predictor.utils.player_impact import PlayerImpactCalculator
+from nba_predictor.utils.teams import get_team_registry
 
 logger = get_logger(__name__)
 
+MODEL_NAME = "claude-sonnet-4-5-20250929"
+
+# Static instructions shared by every prediction request. Keeping them in a
+# separate system block (marked with cache_control) lets the API reuse the
+# cached prefix; only the per-game payload changes between calls. Note that
+# prompts shorter than the model's minimum cacheable length are not cached.
+PREDICTION_INSTRUCTIONS = """Please analyze each matchup considering:
+1. Recent form and momentum (win streaks, recent performance)
+2. Offensive and defensive efficiency (points scored vs allowed)
+3. Advanced metrics (pace, eFG%, turnover rate, offensive rating) and Elo rating
+4. Rest factors (days since last game)
+5. Home court advantage
+6. Player availability and lineup strength (consider impact of injuries, key players out, and starting lineup quality)
+
+IMPORTANT: If lineup/injury data is provided, carefully consider:
+- The impact of players listed as OUT on team performance, using the minutes and points
+  per game lost to injuries when given
+- The uncertainty of players listed as Questionable or GTD (Game-Time Decision)
+- The quality and experience of the expected starting lineup
+- How key injuries might affect team chemistry and rotations
+
+Submit your prediction with the submit_prediction tool. The predicted winner must be
+exactly one of the two team names given in the matchup, and the predicted score must
+agree with the predicted winner.
+"""
+
+PREDICTION_TOOL = tool_definition(
+    GamePrediction,
+    name="submit_prediction",
+    description="Submit the prediction for the matchup.",
+)
+
+
+def build_system_prompt(prompt_format: str = "compact") -> str:
+    """Build the static system prompt for a payload format.
+
+    Args:
+        prompt_format: "compact" (fixed-column tables) or "json" (minified JSON)
+
+    Returns:
+        System prompt text
+    """
+    if prompt_format == "compact":
+        return (
+            "You are an expert NBA analyst. Each request describes one matchup. "
+            "Analyze the matchup and provide a prediction.\n\n"
+            f"{COMPACT_FORMAT_LEGEND}\n\n{PREDICTION_INSTRUCTIONS}"
+        )
+
+    return (
+        "You are an expert NBA analyst. Each request describes one matchup and contains, "
+        "as compact JSON, the statistics of the home and away teams and, when available, "
+        "their lineup and injury reports. Analyze the matchup and provide a prediction.\n\n"
+        f"{PREDICTION_INSTRUCTIONS}"
+    )
+
+
+def _compact_json(data: Any) -> str:
+    """Serialize data as minified JSON for prompt payloads."""
+    return json.dumps(data, separators=(",", ":"))
+
 
 class PredictionError(Exception):
     """Base exception for prediction errors."""
@@ -23,33 +108,77 @@ class PredictionError(Exception):
 class ClaudePredictor:
     """AI-powered NBA game predictor using Claude."""
 
-    def __init__(self) -> None:
-        """Initialize Claude predictor."""
+    def __init__(
+        self,
+        prompt_format: str = "compact",
+        baseline: Optional[BaselinePredictor] = None,
+        gate_margin: Optional[float] = None,
+    ) -> None:
+        """Initialize Claude predictor.
+
+        Args:
+            prompt_format: Payload format sent to Claude, "compact" or "json"
+            baseline: Local baseline model used as fallback when the Claude
+                call fails (optional)
+            gate_margin: Only call Claude when the baseline home-win
+                probability is within this distance of 0.5; clearer games
+                keep the baseline prediction (optional, requires ``baseline``)
+        """
         self.settings = get_settings()
 
         if not self.settings.anthropic.api_key:
             raise PredictionError("Anthropic API key not configured")
 
-        self.client = Anthropic(api_key=self.settings.anthropic.api_key)
-        logger.info("Claude predictor initialized")
+        if prompt_format not in PROMPT_FORMATS:
+            raise PredictionError(f"Unknown prompt format: {prompt_format}")
+
+        if gate_margin is not None and baseline is None:
+            raise PredictionError("A baseline model is required to gate Claude calls")
+
+        self.prompt_format = prompt_format
+        self.baseline = baseline
+        self.gate_margin = gate_margin
+        self.model_version = MODEL_NAME
+        self.system_prompt = build_system_prompt(prompt_format)
+        self.client = get_anthropic_client()
+        self.teams = get_team_registry()
+        self.player_impact = PlayerImpactCalculator()
+        logger.info(
+            "Claude predictor initialized",
+            prompt_format=prompt_format,
+            baseline=baseline is not None,
+            gate_margin=gate_margin,
+        )
 
     def predict_game(
-        self, home_team: str, away_team: str, game_date: date, save_to_db: bool = True
+        self,
+        home_team: str,
+        away_team: str,
+        game_date: date,
+        save_to_db: bool = True,
+        lineups: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """Predict outcome of a specific game.
 
         Args:
-            home_team: Home team name
-            away_team: Away team name
+            home_team: Home team name (abbreviations and nicknames are resolved)
+            away_team: Away team name (abbreviations and nicknames are resolved)
             game_date: Date of the game
             save_to_db: Whether to save prediction to database (default: True)
+            lineups: Preloaded slate lineups keyed by team name (optional,
+                loaded for both teams when omitted)
 
         Returns:
-            Prediction dictionary with winner, confidence, and analysis
+            Prediction dictionary with winner, confidence, and analysis;
+            ``source`` is "claude", "baseline_gate" or "baseline_fallback"
+            (baseline predictions carry the baseline ``model_version``)
 
         Raises:
             PredictionError: If prediction fails
         """
+        home_team = self.teams.resolve(home_team) or home_team
+        away_team = self.teams.resolve(away_team) or away_team
+
         logger.info("Predicting game", home=home_team, away=away_team, date=game_date)
 
         try:
@@ -60,40 +189,86 @@ class ClaudePredictor:
             if not home_stats or not away_stats:
                 raise PredictionError("Insufficient data for prediction")
 
+            # Clear-cut games keep the baseline prediction without an API call
+            if self.baseline and self.gate_margin is not None:
+                baseline_prediction = self.baseline.predict_game(
+                    home_team, away_team, game_date, save_to_db=False
+                )
+                if abs(baseline_prediction["home_win_probability"] - 0.5) >= self.gate_margin:
+                    logger.info(
+                        "Baseline confident, skipping Claude",
+                        home_win_probability=baseline_prediction["home_win_probability"],
+                    )
+                    baseline_prediction["source"] = "baseline_gate"
+                    return self._finish_prediction(
+                        home_team, away_team, game_date, baseline_prediction, save_to_db
+                    )
+
             # Gather lineup information
-            home_lineup = self._get_lineup_info(home_team, game_date)
-            away_lineup = self._get_lineup_info(away_team, game_date)
+            if lineups is None:
+                lineups = self._get_slate_lineups(game_date, [home_team, away_team])
+            home_lineup = lineups.get(home_team)
+            away_lineup = lineups.get(away_team)
 
             # Prepare context for Claude
             context = self._prepare_prediction_context(
                 home_team, away_team, home_stats, away_stats, home_lineup, away_lineup
             )
 
+            logger.debug(
+                "Prediction prompt prepared",
+                prompt_format=self.prompt_format,
+                payload_chars=len(context),
+            )
+
             # Get prediction from Claude
-            prediction = self._get_claude_prediction(context)
-
-            # Save to database if requested
-            if save_to_db:
-                prediction_id = self._save_prediction(
-                    home_team=home_team,
-                    away_team=away_team,
-                    game_date=game_date,
-                    prediction=prediction,
+            try:
+                prediction = self._get_claude_prediction(
+                    context, teams=(home_team, away_team)
                 )
-                prediction["prediction_id"] = prediction_id
-
-            logger.info(
-                "Prediction complete",
-                winner=prediction.get("predicted_winner"),
-                confidence=prediction.get("confidence"),
-            )
+                prediction["source"] = "claude"
+            except PredictionError as e:
+                if not self.baseline:
+                    raise
+                logger.warning("Claude unavailable, using baseline prediction", error=str(e))
+                prediction = self.baseline.predict_game(
+                    home_team, away_team, game_date, save_to_db=False
+                )
+                prediction["source"] = "baseline_fallback"
 
-            return prediction
+            return self._finish_prediction(home_team, away_team, game_date, prediction, save_to_db)
 
         except Exception as e:
             logger.error("Prediction failed", error=str(e), exc_info=True)
             raise PredictionError(f"Failed to predict game: {e}")
 
+    def _finish_prediction(
+        self,
+        home_team: str,
+        away_team: str,
+        game_date: date,
+        prediction: Dict[str, Any],
+        save_to_db: bool,
+    ) -> Dict[str, Any]:
+        """Save a prediction if requested and log it."""
+        if save_to_db:
+            prediction_id = self._save_prediction(
+                home_team=home_team,
+                away_team=away_team,
+                game_date=game_date,
+                prediction=prediction,
+            )
+            prediction["prediction_id"] = prediction_id
+
+        logger.info(
+            "Prediction complete",
+            winner=prediction.get("predicted_winner"),
+            confidence=prediction.get("confidence"),
+            model_version=prediction.get("model_version", self.model_version),
+        )
+
+        return prediction
+
     def predict_games_for_date(self, game_date: date) -> List[Dict[str, Any]]:
         """Predict all games for a specific date.
 
@@ -114,10 +289,13 @@ class ClaudePredictor:
 
             predictions = []
 
+            # Load the whole slate's lineups once instead of per team
+            lineups = self._get_slate_lineups(game_date)
+
             for game in games:
                 try:
                     prediction = self.predict_game(
-                        game.home_name, game.away_name, game_date
+                        game.home_name, game.away_name, game_date, lineups=lineups
                     )
                     prediction["game_id"] = game.id2
                     predictions.append(prediction)
@@ -157,6 +335,13 @@ class ClaudePredictor:
             if not history:
                 return None
 
+            rating = (
+                db.query(TeamRating.elo)
+                .filter(TeamRating.team_name == team_name, TeamRating.date < before_date)
+                .order_by(TeamRating.date.desc())
+                .first()
+            )
+
             # Convert to dictionary with serializable values
             stats = {
                 "team_name": history.team_name,
@@ -203,76 +388,101 @@ class ClaudePredictor:
                     ),
                 },
                 "days_since_last_game": history.day_diff,
+                "elo_rating": float(rating.elo) if rating else None,
             }
 
             return stats
 
-    def _get_lineup_info(
-        self, team_name: str, game_date: date
-    ) -> Optional[Dict[str, Any]]:
-        """Get lineup and injury information for a team on a specific date.
+    def _get_slate_lineups(
+        self, game_date: date, team_names: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get lineup and injury information for every team of a slate.
+
+        Loads all lineup rows for the game date in a single query, keeping only
+        each team's most recent scrape so repeated scrapes do not duplicate
+        players in the prompt. The minutes and points each team loses to
+        injuries are looked up from the player impact table in one more query.
 
         Args:
-            team_name: Team name
-            game_date: Date of the game
+            game_date: Date of the games
+            team_names: Restrict the slate to these teams (optional)
 
         Returns:
-            Dictionary with lineup information or None if no data available
+            Dictionary mapping team name to lineup information; teams without
+            lineup data are absent
         """
         with get_db() as db:
-            # Get the most recent lineup data for this team and date
-            # We look for data scraped on the same day or the day before
-            lineups = (
-                db.query(DailyLineup)
-                .filter(
-                    DailyLineup.team_name == team_name,
-                    DailyLineup.game_date == game_date,
+            latest_scrape = db.query(
+                DailyLineup.team_name,
+                func.max(DailyLineup.scrape_date).label("scrape_date"),
+            ).filter(DailyLineup.game_date == game_date)
+            if team_names:
+                latest_scrape = latest_scrape.filter(DailyLineup.team_name.in_(team_names))
+            latest_scrape = latest_scrape.group_by(DailyLineup.team_name).subquery()
+
+            rows = (
+                db.query(
+                    DailyLineup.team_name,
+                    DailyLineup.player_name,
+                    DailyLineup.player_id,
+                    DailyLineup.position,
+                    DailyLineup.status,
+                    DailyLineup.injury_description,
+                )
+                .join(
+                    latest_scrape,
+                    and_(
+                        DailyLineup.team_name == latest_scrape.c.team_name,
+                        DailyLineup.scrape_date == latest_scrape.c.scrape_date,
+                    ),
                 )
+                .filter(DailyLineup.game_date == game_date)
+                .order_by(DailyLineup.team_name, DailyLineup.id)
                 .all()
             )
 
-            if not lineups:
-                return None
-
-            # Organize lineup data by status
-            starters = []
-            out = []
-            questionable = []
-            gtd = []
-            other = []
-
-            for lineup in lineups:
-                player_info = {
-                    "name": lineup.player_name,
-                    "position": lineup.position,
-                }
-
-                if lineup.injury_description:
-                    player_info["injury"] = lineup.injury_description
-
-                if lineup.status == "Starter":
-                    starters.append(player_info)
-                elif lineup.status == "OUT":
-                    out.append(player_info)
-                elif lineup.status in ["Questionable", "Q"]:
-                    questionable.append(player_info)
-                elif lineup.status in ["GTD", "Game-Time Decision"]:
-                    gtd.append(player_info)
-                else:
-                    other.append(player_info)
-
-            lineup_info = {
-                "has_data": True,
-                "starters": starters,
-                "injuries": {
-                    "out": out,
-                    "questionable": questionable,
-                    "gtd": gtd,
-                    "other": other,
+        slate: Dict[str, Dict[str, Any]] = {}
+        seen_players = set()
+        listed_players = []
+
+        for team_name, player_name, player_id, position, status, injury_description in rows:
+            if (team_name, player_name) in seen_players:
+                continue
+            seen_players.add((team_name, player_name))
+            listed_players.append((team_name, player_id, status))
+
+            lineup_info = slate.setdefault(
+                team_name,
+                {
+                    "has_data": True,
+                    "starters": [],
+                    "injuries": {"out": [], "questionable": [], "gtd": [], "other": []},
                 },
-            }
+            )
 
-            return lineup_info
+            player_info = {"name": player_name, "position": position}
+            if injury_description:
+                player_info["injury"] = injury_description
+
+            # Organize lineup data by status
+            injuries = lineup_info["injuries"]
+            status = normalize_lineup_status(status)
+            if status == "Starter":
+                lineup_info["starters"].append(player_info)
+            elif status == STATUS_OUT:
+                injuries["out"].append(player_info)
+            elif status == STATUS_QUESTIONABLE:
+                injuries["questionable"].append(player_info)
+            elif status == STATUS_GTD:
+                injuries["gtd"].append(player_info)
+            else:
+                injuries["other"].append(player_info)
+
+        for team_name, impact in self.player_impact.injury_impact(listed_players).items():
+            slate[team_name]["impact"] = impact
+
+        logger.debug("Slate lineups loaded", date=game_date, teams=len(slate))
+        return slate
 
     def _prepare_prediction_context(
         self,
@@ -282,8 +492,13 @@ class ClaudePredictor:
         away_stats: Dict[str, Any],
         home_lineup: Optional[Dict[str, Any]] = None,
         away_lineup: Optional[Dict[str, Any]] = None,
+        prompt_format: Optional[str] = None,
     ) -> str:
-        """Prepare context for Claude prediction.
+        """Prepare the per-game payload for Claude prediction.
+
+        The analysis instructions and response schema live in the static
+        system prompt (see ``build_system_prompt``) so they can be cached
+        across calls; this payload only carries the game-specific data.
 
         Args:
             home_team: Home team name
@@ -292,69 +507,51 @@ class ClaudePredictor:
             away_stats: Away team statistics
             home_lineup: Home team lineup and injury info (optional)
             away_lineup: Away team lineup and injury info (optional)
+            prompt_format: Payload format (defaults to the predictor's format)
 
         Returns:
             Formatted context string
         """
-        context = f"""You are an expert NBA analyst. Analyze the following matchup and provide a prediction.
-
-MATCHUP: {home_team} (Home) vs {away_team} (Away)
-
-HOME TEAM STATISTICS ({home_team}):
-{json.dumps(home_stats, indent=2)}
+        if (prompt_format or self.prompt_format) == "compact":
+            return encode_matchup(
+                home_team, away_team, home_stats, away_stats, home_lineup, away_lineup
+            )
 
-AWAY TEAM STATISTICS ({away_team}):
-{json.dumps(away_stats, indent=2)}
-"""
+        sections = [
+            f"MATCHUP: {home_team} (Home) vs {away_team} (Away)",
+            f"HOME TEAM STATISTICS ({home_team}): {_compact_json(home_stats)}",
+            f"AWAY TEAM STATISTICS ({away_team}): {_compact_json(away_stats)}",
+        ]
 
         # Add lineup information if available
         if home_lineup:
-            context += f"""
-HOME TEAM LINEUP & INJURY REPORT ({home_team}):
-{json.dumps(home_lineup, indent=2)}
-"""
+            sections.append(
+                f"HOME TEAM LINEUP & INJURY REPORT ({home_team}): {_compact_json(home_lineup)}"
+            )
 
         if away_lineup:
-            context += f"""
-AWAY TEAM LINEUP & INJURY REPORT ({away_team}):
-{json.dumps(away_lineup, indent=2)}
-"""
-
-        lineup_analysis = ""
-        if home_lineup or away_lineup:
-            lineup_analysis = """
-6. Player availability and lineup strength (consider impact of injuries, key players out, and starting lineup quality)"""
-
-        context += f"""
-Please analyze this matchup considering:
-1. Recent form and momentum (win streaks, recent performance)
-2. Offensive and defensive efficiency (points scored vs allowed)
-3. Advanced metrics (pace, eFG%, turnover rate, offensive rating)
-4. Rest factors (days since last game)
-5. Home court advantage{lineup_analysis}
-
-IMPORTANT: If lineup/injury data is provided, carefully consider:
-- The impact of players listed as OUT on team performance
-- The uncertainty of players listed as Questionable or GTD (Game-Time Decision)
-- The quality and experience of the expected starting lineup
-- How key injuries might affect team chemistry and rotations
+            sections.append(
+                f"AWAY TEAM LINEUP & INJURY REPORT ({away_team}): {_compact_json(away_lineup)}"
+            )
 
-Provide your prediction in the following JSON format:
-{{
-    "predicted_winner": "<team name>",
-    "confidence": <0-100>,
-    "predicted_score": {{"home": <score>, "away": <score>}},
-    "key_factors": ["factor 1", "factor 2", "factor 3"],
-    "analysis": "Detailed explanation of your prediction"
-}}
-"""
-        return context
+        return "\n".join(sections)
 
-    def _get_claude_prediction(self, context: str) -> Dict[str, Any]:
+    def _get_claude_prediction(
+        self,
+        context: str,
+        system_prompt: Optional[str] = None,
+        teams: Optional[Tuple[str, str]] = None,
+    ) -> Dict[str, Any]:
         """Get prediction from Claude API.
 
+        The prediction is returned through the ``submit_prediction`` tool and
+        validated against ``GamePrediction``; an invalid answer gets one
+        repair round-trip instead of a new request.
+
         Args:
-            context: Prediction context
+            context: Per-game prediction payload
+            system_prompt: Static system prompt (defaults to the predictor's prompt)
+            teams: Home and away team names the winner must be one of (optional)
 
         Returns:
             Parsed prediction dictionary
@@ -362,48 +559,73 @@ Provide your prediction in the following JSON format:
         Raises:
             PredictionError: If API call fails
         """
+        started = time.perf_counter()
+        logged: List[bool] = []
+
+        def log_partial(snapshot: Dict[str, Any]) -> None:
+            # Winner and confidence are complete once the next field starts streaming
+            if not logged and "predicted_score" in snapshot:
+                logged.append(True)
+                logger.debug(
+                    "Partial prediction",
+                    winner=snapshot.get("predicted_winner"),
+                    confidence=snapshot.get("confidence"),
+                    elapsed_ms=round((time.perf_counter() - started) * 1000, 1),
+                )
+
         try:
-            message = self.client.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=2048,
+            prediction = request_structured(
+                self.client,
+                GamePrediction,
+                PREDICTION_TOOL,
                 messages=[{"role": "user", "content": context}],
+                on_partial=log_partial,
+                on_response=self._log_usage,
+                validation_context=(
+                    {"teams": teams, "home_team": teams[0], "away_team": teams[1]}
+                    if teams
+                    else None
+                ),
+                model=MODEL_NAME,
+                max_tokens=2048,
+                system=[
+                    {
+                        "type": "text",
+                        "text": system_prompt or self.system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
             )
+            return prediction.model_dump()
 
-            response_text = message.content[0].text
-
-            # Extract JSON from response
-            json_start = response_text.find("{")
-            json_end = response_text.rfind("}") + 1
-
-            if json_start == -1 or json_end == 0:
-                raise PredictionError("No JSON found in Claude response")
-
-            json_str = response_text[json_start:json_end]
-            prediction = json.loads(json_str)
-
-            # Validate prediction structure
-            required_fields = [
-                "predicted_winner",
-                "confidence",
-                "predicted_score",
-                "key_factors",
-                "analysis",
-            ]
-
-            for field in required_fields:
-                if field not in prediction:
-                    raise PredictionError(f"Missing required field: {field}")
-
-            return prediction
-
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse Claude response", error=str(e))
-            raise PredictionError(f"Invalid JSON in Claude response: {e}")
+        except StructuredOutputError as e:
+            logger.error("Invalid prediction in Claude response", error=str(e))
+            raise PredictionError(f"Invalid prediction in Claude response: {e}")
 
         except Exception as e:
             logger.error("Claude API call failed", error=str(e))
             raise PredictionError(f"Claude API error: {e}")
 
+    def _log_usage(self, message: Any, latency: float) -> None:
+        """Log token usage and prompt cache statistics for a response.
+
+        Args:
+            message: Response returned by ``messages.create``
+            latency: Wall-clock duration of the API call in seconds
+        """
+        usage = getattr(message, "usage", None)
+        if usage is None:
+            return
+
+        logger.info(
+            "Claude usage",
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            cache_creation_input_tokens=getattr(usage, "cache_creation_input_tokens", None) or 0,
+            cache_read_input_tokens=getattr(usage, "cache_read_input_tokens", None) or 0,
+            latency_ms=round(latency * 1000, 1),
+        )
+
     def _save_prediction(
         self,
         home_team: str,
@@ -417,7 +639,7 @@ Provide your prediction in the following JSON format:
             home_team: Home team name
             away_team: Away team name
             game_date: Date of the game
-            prediction: Prediction dictionary from Claude
+            prediction: Prediction dictionary from Claude (or the baseline fallback)
 
         Returns:
             ID of the saved prediction
@@ -426,133 +648,180 @@ Provide your prediction in the following JSON format:
             PredictionError: If saving fails
         """
         try:
-            with get_db() as db:
-                # Get game_id and season if available
-                game = (
-                    db.query(Game)
-                    .filter(
-                        Game.date == game_date,
-                        Game.home_name == home_team,
-                        Game.away_name == away_team,
-                    )
-                    .first()
-                )
-
-                game_id = game.id2 if game else None
-                season = game.season if game else None
-
-                # Create prediction record
-                prediction_record = Prediction(
-                    game_id=game_id,
-                    game_date=game_date,
-                    season=season,
-                    home_team=home_team,
-                    away_team=away_team,
-                    predicted_winner=prediction["predicted_winner"],
-                    confidence=Decimal(str(prediction["confidence"])),
-                    predicted_home_score=prediction["predicted_score"]["home"],
-                    predicted_away_score=prediction["predicted_score"]["away"],
-                    analysis=prediction["analysis"],
-                    created_at=datetime.utcnow(),
-                    model_version="claude-sonnet-4-5-20250929",
-                )
-
-                db.add(prediction_record)
-                db.flush()  # Get the ID without committing
-
-                # Create factor records
-                for idx, factor in enumerate(prediction.get("key_factors", [])):
-                    factor_record = PredictionFactor(
-                        prediction_id=prediction_record.id,
-                        factor=factor,
-                        order=idx,
-                    )
-                    db.add(factor_record)
-
-                # Check if game has results and update prediction accuracy
-                if game and game.home_point is not None and game.away_point is not None:
-                    actual_winner = (
-                        home_team if game.home_point > game.away_point else away_team
-                    )
-                    prediction_record.actual_winner = actual_winner
-                    prediction_record.actual_home_score = game.home_point
-                    prediction_record.actual_away_score = game.away_point
-                    prediction_record.is_correct = (
-                        prediction["predicted_winner"] == actual_winner
-                    )
-
-                db.commit()
-
-                logger.info(
-                    "Prediction saved to database",
-                    prediction_id=prediction_record.id,
-                    home=home_team,
-                    away=away_team,
-                )
-
-                return prediction_record.id
+            return save_prediction(
+                home_team,
+                away_team,
+                game_date,
+                prediction,
+                model_version=prediction.get("model_version", self.model_version),
+            )
 
         except Exception as e:
             logger.error("Failed to save prediction", error=str(e), exc_info=True)
             raise PredictionError(f"Failed to save prediction: {e}")
 
-    def analyze_prediction_accuracy(self, season: str) -> Dict[str, Any]:
-        """Analyze prediction accuracy for a season.
+    def count_prompt_tokens(self, context: str, system_prompt: Optional[str] = None) -> int:
+        """Count input tokens of a prediction prompt without generating a response.
+
+        Args:
+            context: Per-game prediction payload
+            system_prompt: Static system prompt (defaults to the predictor's prompt)
+
+        Returns:
+            Number of input tokens (system prompt plus payload)
+        """
+        result = self.client.messages.count_tokens(
+            model=MODEL_NAME,
+            system=system_prompt or self.system_prompt,
+            tools=[PREDICTION_TOOL],
+            tool_choice={"type": "tool", "name": PREDICTION_TOOL["name"]},
+            messages=[{"role": "user", "content": context}],
+        )
+        return result.input_tokens
+
+    def benchmark_prompt_formats(
+        self, season: str, limit: Optional[int] = None, live: bool = False
+    ) -> Dict[str, Any]:
+        """Compare prompt size and latency of the available payload formats.
+
+        Token counts come from the token counting endpoint, so a whole season
+        can be measured without generating predictions. With ``live`` enabled
+        every format is also sent to Claude to measure end-to-end latency
+        (one paid call per format and game).
 
         Args:
             season: NBA season year
+            limit: Maximum number of games to benchmark (default: whole season)
+            live: Whether to time real prediction calls
 
         Returns:
-            Accuracy metrics
+            Per-format averages and the token reduction of the compact format
         """
-        logger.info("Analyzing prediction accuracy", season=season)
+        logger.info("Benchmarking prompt formats", season=season, limit=limit, live=live)
+
+        system_prompts = {fmt: build_system_prompt(fmt) for fmt in PROMPT_FORMATS}
+        totals = {fmt: {"tokens": 0, "chars": 0, "latency": 0.0} for fmt in PROMPT_FORMATS}
 
         with get_db() as db:
-            games = (
-                db.query(Game)
+            query = (
+                db.query(Game.date, Game.home_name, Game.away_name)
                 .filter(Game.season == season, Game.home_point.isnot(None))
-                .all()
+                .order_by(Game.date)
             )
+            if limit:
+                query = query.limit(limit)
+            games = query.all()
 
-            total_games = len(games)
-            correct_predictions = 0
-            total_confidence = 0.0
+        games_benchmarked = 0
 
-            for game in games[:50]:  # Limit for cost reasons
-                try:
-                    prediction = self.predict_game(
-                        game.home_name, game.away_name, game.date, save_to_db=False
-                    )
+        for game_date, home_team, away_team in games:
+            home_stats = self._get_team_statistics(home_team, game_date)
+            away_stats = self._get_team_statistics(away_team, game_date)
 
-                    # Determine actual winner
-                    actual_winner = (
-                        game.home_name
-                        if game.home_point > game.away_point
-                        else game.away_name
+            if not home_stats or not away_stats:
+                continue
+
+            lineups = self._get_slate_lineups(game_date, [home_team, away_team])
+            home_lineup = lineups.get(home_team)
+            away_lineup = lineups.get(away_team)
+
+            try:
+                game_totals = {}
+                for fmt in PROMPT_FORMATS:
+                    context = self._prepare_prediction_context(
+                        home_team,
+                        away_team,
+                        home_stats,
+                        away_stats,
+                        home_lineup,
+                        away_lineup,
+                        prompt_format=fmt,
                     )
+                    latency = 0.0
+                    if live:
+                        started = time.perf_counter()
+                        self._get_claude_prediction(context, system_prompts[fmt])
+                        latency = time.perf_counter() - started
+
+                    game_totals[fmt] = {
+                        "tokens": self.count_prompt_tokens(context, system_prompts[fmt]),
+                        "chars": len(system_prompts[fmt]) + len(context),
+                        "latency": latency,
+                    }
+
+            except Exception as e:
+                logger.warning(
+                    "Skipped game in prompt benchmark",
+                    home=home_team,
+                    away=away_team,
+                    error=str(e),
+                )
+                continue
+
+            for fmt, values in game_totals.items():
+                for key, value in values.items():
+                    totals[fmt][key] += value
+            games_benchmarked += 1
+
+        formats = {}
+        for fmt, values in totals.items():
+            divisor = games_benchmarked or 1
+            formats[fmt] = {
+                "avg_input_tokens": round(values["tokens"] / divisor, 1),
+                "avg_chars": round(values["chars"] / divisor, 1),
+                "avg_latency_ms": (
+                    round(values["latency"] / divisor * 1000, 1) if live else None
+                ),
+            }
 
-                    if prediction["predicted_winner"] == actual_winner:
-                        correct_predictions += 1
+        json_tokens = totals["json"]["tokens"]
+        results = {
+            "games_benchmarked": games_benchmarked,
+            "formats": formats,
+            "token_reduction_percentage": (
+                round((1 - totals["compact"]["tokens"] / json_tokens) * 100, 2)
+                if json_tokens
+                else 0.0
+            ),
+        }
 
-                    total_confidence += prediction["confidence"]
+        logger.info("Prompt benchmark complete", results=results)
+        return results
 
-                except Exception as e:
-                    logger.warning("Skipped game in accuracy analysis", error=str(e))
-                    continue
+    def analyze_prediction_accuracy(
+        self,
+        season: str,
+        predict_missing: bool = False,
+        limit: Optional[int] = None,
+        workers: int = 4,
+        requests_per_minute: float = 50,
+    ) -> Dict[str, Any]:
+        """Analyze prediction accuracy for a season.
 
-            accuracy = (
-                correct_predictions / min(50, total_games) * 100
-                if total_games > 0
-                else 0.0
-            )
-            avg_confidence = total_confidence / min(50, total_games) if total_games > 0 else 0.0
+        The report is aggregated in SQL from stored predictions. Completed
+        games without a prediction are only sent to Claude when
+        ``predict_missing`` is set, through a resumable backtest that
+        checkpoints every new prediction.
 
-            metrics = {
-                "games_analyzed": min(50, total_games),
-                "correct_predictions": correct_predictions,
-                "accuracy_percentage": round(accuracy, 2),
-                "average_confidence": round(avg_confidence, 2),
-            }
+        Args:
+            season: NBA season year
+            predict_missing: Whether to predict completed games lacking a prediction
+            limit: Maximum number of games to backtest (default: whole season)
+            workers: Number of concurrent predictions
+            requests_per_minute: Maximum number of API calls started per minute
+
+        Returns:
+            Accuracy report, with backtest metrics when missing games were predicted
+        """
+        logger.info("Analyzing prediction accuracy", season=season, predict_missing=predict_missing)
+
+        backtest = None
+        if predict_missing:
+            engine = BacktestEngine(
+                self, workers=workers, requests_per_minute=requests_per_minute
+            )
+            backtest = engine.run(season, limit=limit)
 
-            logger.info("Accuracy analysis complete", metrics=metrics)
-            return metrics
+        report = accuracy_report(season)
+        report["backtest"] = backtest
+        return report
@@ -0,0 +1,170 @@
+"""Compact, token-efficient encoding of prediction context.
+
+Team statistics are rendered as a pipe-separated fixed-column table and lineups
+as short status-grouped lists. The column legend is part of the static system
+prompt, so the per-game payload carries values only.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+PROMPT_FORMATS = ("compact", "json")
+
+# (column, path into the dictionary built by ClaudePredictor._get_team_statistics)
+STAT_COLUMNS: List[Tuple[str, Tuple[str, ...]]] = [
+    ("gp", ("games_played",)),
+    ("w", ("wins",)),
+    ("wpct", ("win_percentage",)),
+    ("l1", ("recent_form", "last_1")),
+    ("l3", ("recent_form", "last_3")),
+    ("l5", ("recent_form", "last_5")),
+    ("l10", ("recent_form", "last_10")),
+    ("ws", ("win_streak",)),
+    ("ls", ("loss_streak",)),
+    ("pts1", ("point_averages", "last_1")),
+    ("pts3", ("point_averages", "last_3")),
+    ("pts5", ("point_averages", "last_5")),
+    ("pts10", ("point_averages", "last_10")),
+    ("pts", ("point_averages", "overall")),
+    ("opp1", ("points_against_averages", "last_1")),
+    ("opp", ("points_against_averages", "overall")),
+    ("pace", ("advanced_metrics", "pace")),
+    ("efg", ("advanced_metrics", "efg_percentage")),
+    ("tov", ("advanced_metrics", "turnover_percentage")),
+    ("orb", ("advanced_metrics", "offensive_rebound_percentage")),
+    ("ftr", ("advanced_metrics", "free_throw_rate")),
+    ("ortg", ("advanced_metrics", "offensive_rating")),
+    ("rest", ("days_since_last_game",)),
+    ("elo", ("elo_rating",)),
+]
+
+# (short code, key in the lineup dictionary built by ClaudePredictor._get_slate_lineups)
+LINEUP_GROUPS: List[Tuple[str, Tuple[str, ...]]] = [
+    ("S", ("starters",)),
+    ("O", ("injuries", "out")),
+    ("Q", ("injuries", "questionable")),
+    ("G", ("injuries", "gtd")),
+    ("X", ("injuries", "other")),
+]
+
+COMPACT_FORMAT_LEGEND = """Input format:
+- MATCHUP gives the home (H) and away (A) team names.
+- STATS is a pipe-separated table with one row per team. Columns:
+  side: H=home, A=away | gp: games played | w: wins | wpct: win percentage (0-1)
+  l1, l3, l5, l10: wins in the last 1/3/5/10 games | ws, ls: current win/loss streak
+  pts1, pts3, pts5, pts10, pts: points scored per game over the last 1/3/5/10 games and season
+  opp1, opp: points allowed in the last game and per game over the season
+  pace: possessions per 48 min | efg: effective FG% | tov: turnover % | orb: offensive rebound %
+  ftr: free throws per FGA | ortg: offensive rating | rest: days since last game
+  elo: Elo rating (1500 = average; 100 points ~ 64% win chance on a neutral court,
+  home court is worth about 100 points)
+  "-" marks a missing value.
+- LINEUP H / LINEUP A (optional) list players as Name(POS) grouped by status:
+  S=starters, O=out, Q=questionable, G=game-time decision, X=other. Injury notes follow in [brackets].
+  L=minutes/points per game lost to injuries: recent averages of unavailable players, weighted
+  by status (out 1, doubtful 0.75, questionable/GTD 0.5, probable 0.25)."""
+
+
+def _lookup(data: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    """Follow a key path into nested dictionaries, returning None when absent."""
+    value: Any = data
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _format_value(value: Any) -> str:
+    """Render a scalar with the fewest characters that keep its precision."""
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{round(value, 3):g}"
+    return str(value)
+
+
+def encode_team_table(rows: List[Tuple[str, Dict[str, Any]]]) -> str:
+    """Encode team statistics as a fixed-column table.
+
+    Args:
+        rows: (side, statistics) pairs, where side is "H" or "A"
+
+    Returns:
+        Header line followed by one pipe-separated line per team
+    """
+    lines = ["side|" + "|".join(column for column, _ in STAT_COLUMNS)]
+    for side, stats in rows:
+        values = (_format_value(_lookup(stats, path)) for _, path in STAT_COLUMNS)
+        lines.append(side + "|" + "|".join(values))
+    return "\n".join(lines)
+
+
+def encode_lineup(lineup: Dict[str, Any]) -> str:
+    """Encode a lineup and injury report as status-grouped player lists.
+
+    Args:
+        lineup: Lineup dictionary with starters and injuries
+
+    Returns:
+        Compact single-line representation, e.g. ``S=Jrue Holiday(PG),... ; O=... ; L=34.5/21.2``
+    """
+    groups = []
+    for code, path in LINEUP_GROUPS:
+        players = _lookup(lineup, path) or []
+        if not players:
+            continue
+
+        entries = []
+        for player in players:
+            entry = player["name"]
+            if player.get("position"):
+                entry += f"({player['position']})"
+            if player.get("injury"):
+                entry += f"[{player['injury']}]"
+            entries.append(entry)
+
+        groups.append(f"{code}=" + ",".join(entries))
+
+    impact = lineup.get("impact")
+    if impact:
+        groups.append(
+            f"L={_format_value(impact['minutes_lost'])}/{_format_value(impact['points_lost'])}"
+        )
+
+    return "; ".join(groups)
+
+
+def encode_matchup(
+    home_team: str,
+    away_team: str,
+    home_stats: Dict[str, Any],
+    away_stats: Dict[str, Any],
+    home_lineup: Optional[Dict[str, Any]] = None,
+    away_lineup: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Encode a full matchup payload in the compact format.
+
+    Args:
+        home_team: Home team name
+        away_team: Away team name
+        home_stats: Home team statistics
+        away_stats: Away team statistics
+        home_lineup: Home team lineup and injury info (optional)
+        away_lineup: Away team lineup and injury info (optional)
+
+    Returns:
+        Compact payload described by ``COMPACT_FORMAT_LEGEND``
+    """
+    sections = [
+        f"MATCHUP: H={home_team} A={away_team}",
+        "STATS:",
+        encode_team_table([("H", home_stats), ("A", away_stats)]),
+    ]
+
+    if home_lineup:
+        sections.append(f"LINEUP H: {encode_lineup(home_lineup)}")
+
+    if away_lineup:
+        sections.append(f"LINEUP A: {encode_lineup(away_lineup)}")
+
+    return "\n".join(sections)
@@ -0,0 +1,108 @@
+"""Back-fill actual game outcomes into stored predictions."""
+
+from typing import Any, Dict, List
+
+from sqlalchemy import and_, case, func, update
+
+from nba_predictor.core.logger import get_logger
+from nba_predictor.models import Game, Prediction, get_db
+
+logger = get_logger(__name__)
+
+
+def _outcome_values() -> Dict[str, Any]:
+    """SET clause copying a final game's result into the joined prediction.
+
+    Every value is derived from ``Game`` columns only, because MySQL does not
+    guarantee assignment order in multi-table UPDATE statements.
+    """
+    home_won = Game.home_point > Game.away_point
+    return {
+        "actual_home_score": Game.home_point,
+        "actual_away_score": Game.away_point,
+        "actual_winner": case((home_won, Game.home_name), else_=Game.away_name),
+        "is_correct": case(
+            (and_(home_won, Prediction.predicted_winner == Game.home_name), True),
+            (and_(~home_won, Prediction.predicted_winner == Game.away_name), True),
+            else_=False,
+        ),
+    }
+
+
+def reconcile_predictions(batch_size: int = 10000) -> Dict[str, int]:
+    """Fill actual results for predictions whose game has since been played.
+
+    Pending predictions (``actual_winner`` is NULL) are joined to ``nba_game``
+    by ``game_id`` or, for predictions saved without one, by date and teams.
+    Only pending rows are paged, ``batch_size`` IDs at a time through the
+    ``actual_winner`` index, and each page is reconciled by set-based UPDATEs
+    over its ID range. The cost follows the number of pending predictions,
+    not the size of the history, even when old predictions never match a
+    game (postponed games, unknown teams). Rows whose game is not final yet
+    are left untouched, which makes the job safe to run repeatedly (e.g.
+    from cron after each nightly refresh).
+
+    Args:
+        batch_size: Pending predictions reconciled per page
+
+    Returns:
+        Number of predictions matched by game ID and by date/teams
+    """
+    logger.info("Reconciling predictions", batch_size=batch_size)
+
+    final_game = [
+        Game.home_point.isnot(None),
+        Game.away_point.isnot(None),
+        Prediction.actual_winner.is_(None),
+    ]
+    by_game_id: List[Any] = [Prediction.game_id == Game.id2]
+    by_matchup: List[Any] = [
+        Prediction.game_id.is_(None),
+        Prediction.game_date == Game.date,
+        Prediction.home_team == Game.home_name,
+        Prediction.away_team == Game.away_name,
+    ]
+
+    counts = {"matched_by_game_id": 0, "matched_by_teams": 0}
+
+    with get_db() as db:
+        last_id = 0
+        while True:
+            page = [
+                prediction_id
+                for (prediction_id,) in db.query(Prediction.id)
+                .filter(Prediction.actual_winner.is_(None), Prediction.id > last_id)
+                .order_by(Prediction.id)
+                .limit(batch_size)
+            ]
+            if not page:
+                break
+
+            # Rows reconciled earlier in the range are excluded by final_game
+            window = Prediction.id.between(page[0], page[-1])
+
+            result = db.execute(
+                update(Prediction)
+                .where(window, *by_game_id, *final_game)
+                .values(season=func.coalesce(Prediction.season, Game.season), **_outcome_values())
+                .execution_options(synchronize_session=False)
+            )
+            counts["matched_by_game_id"] += result.rowcount
+
+            # Predictions saved before the game was scraped also get their game reference
+            result = db.execute(
+                update(Prediction)
+                .where(window, *by_matchup, *final_game)
+                .values(game_id=Game.id2, season=Game.season, **_outcome_values())
+                .execution_options(synchronize_session=False)
+            )
+            counts["matched_by_teams"] += result.rowcount
+
+            db.commit()
+            last_id = page[-1]
+
+        if not last_id:
+            logger.info("No pending predictions to reconcile")
+
+    logger.info("Predictions reconciled", **counts)
+    return counts
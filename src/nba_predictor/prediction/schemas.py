@@ -0,0 +1,47 @@
+"""Response schemas for Claude predictions."""
+
+from typing import List
+
+from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
+
+
+class PredictedScore(BaseModel):
+    """Predicted final score."""
+
+    home: int = Field(ge=0, description="Home team points")
+    away: int = Field(ge=0, description="Away team points")
+
+
+class GamePrediction(BaseModel):
+    """Prediction of a single game."""
+
+    predicted_winner: str = Field(description="Full name of the team predicted to win")
+    confidence: float = Field(ge=0, le=100, description="Confidence in the winner (0-100)")
+    predicted_score: PredictedScore
+    key_factors: List[str] = Field(description="Most important factors, most important first")
+    analysis: str = Field(description="Detailed explanation of the prediction")
+
+    @field_validator("predicted_winner")
+    @classmethod
+    def validate_winner(cls, value: str, info: ValidationInfo) -> str:
+        """Require the winner to be one of the two teams when they are known."""
+        teams = (info.context or {}).get("teams")
+        if teams and value not in teams:
+            raise ValueError(f"predicted_winner must be one of: {', '.join(teams)}")
+        return value
+
+    @model_validator(mode="after")
+    def validate_score_matches_winner(self, info: ValidationInfo) -> "GamePrediction":
+        """Require the predicted winner to score more when home/away are known."""
+        home_team = (info.context or {}).get("home_team")
+        if home_team is None:
+            return self
+
+        home_wins = self.predicted_winner == home_team
+        score = self.predicted_score
+        if score.home == score.away or (score.home > score.away) != home_wins:
+            raise ValueError(
+                f"predicted_score ({score.home}-{score.away}, home-away) must have "
+                f"{self.predicted_winner} scoring more points"
+            )
+        return self
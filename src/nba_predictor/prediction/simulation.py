@@ -0,0 +1,393 @@
+"""Monte Carlo simulation of the remaining regular season.
+
+The remaining schedule (``Game`` rows without a score) is simulated many
+times at once: each batch draws a (simulations x games) matrix of uniform
+numbers, compares it with the per-game home-win probabilities and turns the
+outcomes into win totals with two matrix products. Conference seeds, play-in
+results and win-total distributions are then aggregated with array
+operations, so 100k seasons take seconds and no model is called per game.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import case, func
+
+from nba_predictor.core.logger import get_logger
+from nba_predictor.models import Game, Prediction, get_db
+from nba_predictor.prediction.baseline import BaselinePredictor
+from nba_predictor.utils.ratings import INITIAL_RATING, RatingCalculator, expected_home_win
+from nba_predictor.utils.teams import get_team_registry
+
+logger = get_logger(__name__)
+
+PROBABILITY_SOURCES = ("elo", "baseline", "predictions")
+
+# Seeds 1-6 qualify directly, 7-10 play in the play-in tournament
+DIRECT_PLAYOFF_SEEDS = 6
+PLAY_IN_SEEDS = 10
+
+# Simulations drawn per batch; bounds memory at batch x remaining games
+BATCH_SIZE = 5000
+
+
+class SimulationError(Exception):
+    """Exception raised by the season simulator."""
+
+    pass
+
+
+def _simulate_batch(
+    simulations: int,
+    seed: Any,
+    base_wins: np.ndarray,
+    home_index: np.ndarray,
+    away_index: np.ndarray,
+    home_probs: np.ndarray,
+    conferences: List[np.ndarray],
+    pair_probs: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Simulate a batch of seasons and return aggregated counts.
+
+    Module-level so that it can run in worker processes.
+
+    Args:
+        simulations: Number of seasons to simulate
+        seed: Seed (or SeedSequence) for the batch's random generator
+        base_wins: Wins already recorded per team
+        home_index: Home team index of each remaining game
+        away_index: Away team index of each remaining game
+        home_probs: Home-win probability of each remaining game
+        conferences: Team indices of each conference
+        pair_probs: Matrix of P(row team beats column team at home) for the play-in
+
+    Returns:
+        Win-total histogram (teams x max wins + 1), seed counts
+        (teams x seeds), playoff and play-in counts per team
+    """
+    rng = np.random.default_rng(seed)
+    teams = len(base_wins)
+    games = len(home_probs)
+    max_wins = int(base_wins.max()) + games + 1
+
+    home_matrix = np.zeros((games, teams), dtype=np.float32)
+    home_matrix[np.arange(games), home_index] = 1
+    away_matrix = np.zeros((games, teams), dtype=np.float32)
+    away_matrix[np.arange(games), away_index] = 1
+
+    win_histogram = np.zeros((teams, max_wins), dtype=np.int64)
+    seeds = max((len(members) for members in conferences), default=0)
+    seed_counts = np.zeros((teams, seeds), dtype=np.int64)
+    playoff_counts = np.zeros(teams, dtype=np.int64)
+    play_in_counts = np.zeros(teams, dtype=np.int64)
+
+    remaining = simulations
+    while remaining > 0:
+        size = min(BATCH_SIZE, remaining)
+        remaining -= size
+
+        home_won = (rng.random((size, games)) < home_probs).astype(np.float32)
+        wins = home_won @ home_matrix + (1 - home_won) @ away_matrix
+        wins = wins.astype(np.int64) + base_wins
+
+        # Win totals: offset each team into its own histogram row
+        offsets = np.arange(teams) * max_wins
+        win_histogram += np.bincount(
+            (wins + offsets).ravel(), minlength=teams * max_wins
+        ).reshape(teams, max_wins)
+
+        for members in conferences:
+            # Rank by wins; ties are broken at random
+            scores = wins[:, members] + rng.random((size, len(members)))
+            order = members[np.argsort(-scores, axis=1)]
+
+            for position in range(order.shape[1]):
+                seed_counts[:, position] += np.bincount(order[:, position], minlength=teams)
+
+            playoff_counts += np.bincount(
+                order[:, :DIRECT_PLAYOFF_SEEDS].ravel(), minlength=teams
+            )
+
+            if order.shape[1] < PLAY_IN_SEEDS:
+                continue
+
+            seven, eight, nine, ten = (order[:, s] for s in range(6, 10))
+            play_in_counts += np.bincount(order[:, 6:10].ravel(), minlength=teams)
+
+            # 7 hosts 8: winner is the 7th seed; 9 hosts 10: loser is eliminated
+            seven_wins = rng.random(size) < pair_probs[seven, eight]
+            seventh = np.where(seven_wins, seven, eight)
+            loser_78 = np.where(seven_wins, eight, seven)
+            nine_wins = rng.random(size) < pair_probs[nine, ten]
+            winner_910 = np.where(nine_wins, nine, ten)
+
+            # Loser of 7/8 hosts winner of 9/10 for the 8th seed
+            host_wins = rng.random(size) < pair_probs[loser_78, winner_910]
+            eighth = np.where(host_wins, loser_78, winner_910)
+
+            playoff_counts += np.bincount(seventh, minlength=teams)
+            playoff_counts += np.bincount(eighth, minlength=teams)
+
+    return {
+        "win_histogram": win_histogram,
+        "seed_counts": seed_counts,
+        "playoff_counts": playoff_counts,
+        "play_in_counts": play_in_counts,
+    }
+
+
+class SeasonSimulator:
+    """Monte Carlo simulator of the remaining regular season and play-in."""
+
+    def __init__(self, source: str = "elo", model_version: Optional[str] = None) -> None:
+        """Initialize season simulator.
+
+        Args:
+            source: Where per-game win probabilities come from: "elo" (current
+                Elo ratings), "baseline" (local baseline model) or
+                "predictions" (stored predictions, Elo for games without one)
+            model_version: Restrict stored predictions to one model version
+        """
+        if source not in PROBABILITY_SOURCES:
+            raise SimulationError(f"Unknown probability source: {source}")
+
+        self.source = source
+        self.model_version = model_version
+        self.ratings = RatingCalculator()
+        self.teams = get_team_registry()
+
+    def simulate(
+        self,
+        season: str,
+        simulations: int = 10000,
+        processes: int = 1,
+        seed: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Simulate the rest of a season.
+
+        Args:
+            season: NBA season year
+            simulations: Number of seasons to simulate
+            processes: Number of worker processes (1 runs in-process)
+            seed: Random seed for reproducible results (optional)
+
+        Returns:
+            Per-team win-total, seed, play-in and playoff distributions with
+            simulation throughput
+        """
+        logger.info(
+            "Simulating season",
+            season=season,
+            simulations=simulations,
+            source=self.source,
+            processes=processes,
+        )
+
+        teams, base_wins, base_losses, schedule = self._load_season(season)
+        if not teams:
+            raise SimulationError(f"No games found for season {season}")
+
+        index = {team: idx for idx, team in enumerate(teams)}
+        home_index = np.array([index[home] for _, home, _ in schedule], dtype=np.int64)
+        away_index = np.array([index[away] for _, _, away in schedule], dtype=np.int64)
+
+        ratings = self.ratings.get_ratings(teams, date.max)
+        rating_array = np.array([ratings.get(team, INITIAL_RATING) for team in teams])
+        pair_probs = expected_home_win(rating_array[:, None], rating_array[None, :])
+        home_probs = self._game_probabilities(schedule, home_index, away_index, pair_probs)
+
+        conferences = []
+        for name in ("East", "West"):
+            members = np.array(
+                [idx for idx, team in enumerate(teams) if self.teams.conference(team) == name],
+                dtype=np.int64,
+            )
+            if len(members):
+                conferences.append(members)
+
+        started = time.perf_counter()
+        seeds = np.random.SeedSequence(seed).spawn(max(1, processes))
+        shares = [
+            simulations // len(seeds) + (i < simulations % len(seeds)) for i in range(len(seeds))
+        ]
+        args = (base_wins, home_index, away_index, home_probs, conferences, pair_probs)
+
+        if processes > 1:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                futures = [
+                    executor.submit(_simulate_batch, share, batch_seed, *args)
+                    for share, batch_seed in zip(shares, seeds)
+                    if share
+                ]
+                batches = [future.result() for future in futures]
+        else:
+            batches = [_simulate_batch(simulations, seeds[0], *args)]
+
+        totals = {key: sum(batch[key] for batch in batches) for key in batches[0]}
+        elapsed = time.perf_counter() - started
+
+        results = {
+            "season": season,
+            "source": self.source,
+            "simulations": simulations,
+            "remaining_games": len(schedule),
+            "elapsed_seconds": round(elapsed, 3),
+            "simulations_per_second": round(simulations / elapsed) if elapsed else None,
+            "teams": self._summarize(teams, base_wins, base_losses, totals, simulations),
+        }
+
+        logger.info(
+            "Season simulation complete",
+            simulations=simulations,
+            remaining_games=len(schedule),
+            simulations_per_second=results["simulations_per_second"],
+        )
+        return results
+
+    def _load_season(
+        self, season: str
+    ) -> Tuple[List[str], np.ndarray, np.ndarray, List[Tuple[str, str, str]]]:
+        """Load current standings and the remaining schedule.
+
+        Returns:
+            Team names, wins and losses per team, and (game ID, home, away)
+            of each remaining game
+        """
+        with get_db() as db:
+            home_won = case((Game.home_point > Game.away_point, 1), else_=0)
+            away_won = case((Game.away_point > Game.home_point, 1), else_=0)
+
+            completed = (
+                db.query(
+                    Game.home_name,
+                    Game.away_name,
+                    func.sum(home_won),
+                    func.sum(away_won),
+                )
+                .filter(Game.season == season, Game.home_point.isnot(None))
+                .group_by(Game.home_name, Game.away_name)
+                .all()
+            )
+
+            schedule = (
+                db.query(Game.id2, Game.home_name, Game.away_name)
+                .filter(Game.season == season, Game.home_point.is_(None))
+                .order_by(Game.date, Game.id)
+                .all()
+            )
+
+        wins: Dict[str, int] = {}
+        losses: Dict[str, int] = {}
+        for home, away, home_wins, away_wins in completed:
+            home_wins, away_wins = int(home_wins or 0), int(away_wins or 0)
+            wins[home] = wins.get(home, 0) + home_wins
+            losses[home] = losses.get(home, 0) + away_wins
+            wins[away] = wins.get(away, 0) + away_wins
+            losses[away] = losses.get(away, 0) + home_wins
+
+        teams = sorted(set(wins) | {team for _, home, away in schedule for team in (home, away)})
+        return (
+            teams,
+            np.array([wins.get(team, 0) for team in teams], dtype=np.int64),
+            np.array([losses.get(team, 0) for team in teams], dtype=np.int64),
+            [(game_id, home, away) for game_id, home, away in schedule],
+        )
+
+    def _game_probabilities(
+        self,
+        schedule: List[Tuple[str, str, str]],
+        home_index: np.ndarray,
+        away_index: np.ndarray,
+        pair_probs: np.ndarray,
+    ) -> np.ndarray:
+        """Home-win probability of each remaining game from the configured source."""
+        probs = pair_probs[home_index, away_index]
+        if not schedule or self.source == "elo":
+            return probs
+
+        if self.source == "baseline":
+            matchups = [(home, away) for _, home, away in schedule]
+            return BaselinePredictor().predict_matchups(matchups, date.max)
+
+        stored = self._stored_probabilities([game_id for game_id, _, _ in schedule])
+        for position, (game_id, _, _) in enumerate(schedule):
+            if game_id in stored:
+                probs[position] = stored[game_id]
+
+        logger.info(
+            "Loaded stored predictions",
+            games=len(schedule),
+            with_prediction=len(stored),
+        )
+        return probs
+
+    def _stored_probabilities(self, game_ids: List[str]) -> Dict[str, float]:
+        """Home-win probability of the latest stored prediction per game."""
+        with get_db() as db:
+            query = db.query(
+                Prediction.game_id,
+                Prediction.home_team,
+                Prediction.predicted_winner,
+                Prediction.confidence,
+            ).filter(Prediction.game_id.in_(game_ids))
+            if self.model_version:
+                query = query.filter(Prediction.model_version == self.model_version)
+            rows = query.order_by(Prediction.created_at).all()
+
+        probabilities = {}
+        for game_id, home_team, predicted_winner, confidence in rows:
+            winner_prob = float(confidence) / 100
+            probabilities[game_id] = (
+                winner_prob if predicted_winner == home_team else 1 - winner_prob
+            )
+        return probabilities
+
+    def _summarize(
+        self,
+        teams: List[str],
+        base_wins: np.ndarray,
+        base_losses: np.ndarray,
+        totals: Dict[str, np.ndarray],
+        simulations: int,
+    ) -> List[Dict[str, Any]]:
+        """Turn aggregated counts into per-team distributions."""
+        histogram = totals["win_histogram"]
+        win_values = np.arange(histogram.shape[1])
+        cumulative = np.cumsum(histogram, axis=1) / simulations
+
+        summary = []
+        for idx, team in enumerate(teams):
+            percentiles = {
+                f"p{int(q * 100)}": int(np.searchsorted(cumulative[idx], q))
+                for q in (0.1, 0.5, 0.9)
+            }
+            summary.append(
+                {
+                    "team": team,
+                    "conference": self.teams.conference(team),
+                    "wins": int(base_wins[idx]),
+                    "losses": int(base_losses[idx]),
+                    "mean_wins": round(float(histogram[idx] @ win_values) / simulations, 1),
+                    "win_percentiles": percentiles,
+                    "win_distribution": {
+                        int(wins): round(count / simulations, 4)
+                        for wins, count in enumerate(histogram[idx])
+                        if count
+                    },
+                    "seed_probabilities": [
+                        round(count / simulations, 4) for count in totals["seed_counts"][idx]
+                    ],
+                    "play_in_probability": round(
+                        float(totals["play_in_counts"][idx]) / simulations, 4
+                    ),
+                    "playoff_probability": round(
+                        float(totals["playoff_counts"][idx]) / simulations, 4
+                    ),
+                }
+            )
+
+        summary.sort(key=lambda entry: (entry["conference"] or "", -entry["mean_wins"]))
+        return summary
@@ -0,0 +1,95 @@
+"""Persistence of predictions shared by every predictor."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict
+
+from nba_predictor.core.logger import get_logger
+from nba_predictor.models import Game, Prediction, PredictionFactor, get_db
+
+logger = get_logger(__name__)
+
+
+def save_prediction(
+    home_team: str,
+    away_team: str,
+    game_date: date,
+    prediction: Dict[str, Any],
+    model_version: str,
+) -> int:
+    """Save a prediction and its key factors to the database.
+
+    If the game has already been played, the actual result is filled in too.
+
+    Args:
+        home_team: Home team name
+        away_team: Away team name
+        game_date: Date of the game
+        prediction: Prediction dictionary (winner, confidence, score, factors, analysis)
+        model_version: Version of the model that produced the prediction
+
+    Returns:
+        ID of the saved prediction
+    """
+    with get_db() as db:
+        # Get game_id and season if available
+        game = (
+            db.query(Game)
+            .filter(
+                Game.date == game_date,
+                Game.home_name == home_team,
+                Game.away_name == away_team,
+            )
+            .first()
+        )
+
+        game_id = game.id2 if game else None
+        season = game.season if game else None
+
+        # Create prediction record
+        prediction_record = Prediction(
+            game_id=game_id,
+            game_date=game_date,
+            season=season,
+            home_team=home_team,
+            away_team=away_team,
+            predicted_winner=prediction["predicted_winner"],
+            confidence=Decimal(str(prediction["confidence"])),
+            predicted_home_score=prediction["predicted_score"]["home"],
+            predicted_away_score=prediction["predicted_score"]["away"],
+            analysis=prediction["analysis"],
+            created_at=datetime.utcnow(),
+            model_version=model_version,
+        )
+
+        db.add(prediction_record)
+        db.flush()  # Get the ID without committing
+
+        # Create factor records
+        for idx, factor in enumerate(prediction.get("key_factors", [])):
+            factor_record = PredictionFactor(
+                prediction_id=prediction_record.id,
+                factor=factor,
+                order=idx,
+            )
+            db.add(factor_record)
+
+        # Check if game has results and update prediction accuracy
+        if game and game.home_point is not None and game.away_point is not None:
+            actual_winner = home_team if game.home_point > game.away_point else away_team
+            prediction_record.actual_winner = actual_winner
+            prediction_record.actual_home_score = game.home_point
+            prediction_record.actual_away_score = game.away_point
+            prediction_record.is_correct = prediction["predicted_winner"] == actual_winner
+
+        db.commit()
+
+        logger.info(
+            "Prediction saved to database",
+            prediction_id=prediction_record.id,
+            home=home_team,
+            away=away_team,
+            model_version=model_version,
+        )
+
+        return prediction_record.id
@@ -7,11 +7,12 @@ from typing import Any, Dict, List, Optional
 
 import cloudscraper
 from bs4 import BeautifulSoup
-from sqlalchemy import and_
 
 from nba_predictor.core.config import get_settings
 from nba_predictor.core.logger import get_logger
-from nba_predictor.models import DailyLineup, get_db
+from nba_predictor.scraper.lineup_writer import replace_lineups
+from nba_predictor.utils.injuries import normalize_lineup_status
+from nba_predictor.utils.teams import get_team_registry
 
 logger = get_logger(__name__)
 
@@ -25,50 +26,16 @@ class BasketballMonsterScraperError(Exception):
 class BasketballMonsterScraper:
     """Scraper for Basketball Monster NBA lineups and injury reports."""
 
-    # Mapping of team abbreviations to full names
-    TEAM_ABBR_MAP = {
-        "ATL": "Atlanta Hawks",
-        "BOS": "Boston Celtics",
-        "BKN": "Brooklyn Nets",
-        "BRK": "Brooklyn Nets",  # Alternative abbreviation
-        "CHA": "Charlotte Hornets",
-        "CHO": "Charlotte Hornets",  # Alternative abbreviation
-        "CHI": "Chicago Bulls",
-        "CLE": "Cleveland Cavaliers",
-        "DAL": "Dallas Mavericks",
-        "DEN": "Denver Nuggets",
-        "DET": "Detroit Pistons",
-        "GSW": "Golden State Warriors",
-        "GS": "Golden State Warriors",  # Alternative abbreviation
-        "HOU": "Houston Rockets",
-        "IND": "Indiana Pacers",
-        "LAC": "Los Angeles Clippers",
-        "LAL": "Los Angeles Lakers",
-        "LA": "Los Angeles Lakers",  # Alternative abbreviation
-        "MEM": "Memphis Grizzlies",
-        "MIA": "Miami Heat",
-        "MIL": "Milwaukee Bucks",
-        "MIN": "Minnesota Timberwolves",
-        "NOP": "New Orleans Pelicans",
-        "NO": "New Orleans Pelicans",  # Alternative abbreviation
-        "NYK": "New York Knicks",
-        "NY": "New York Knicks",  # Alternative abbreviation
-        "OKC": "Oklahoma City Thunder",
-        "ORL": "Orlando Magic",
-        "PHI": "Philadelphia 76ers",
-        "PHX": "Phoenix Suns",
-        "POR": "Portland Trail Blazers",
-        "SAC": "Sacramento Kings",
-        "SAS": "San Antonio Spurs",
-        "SA": "San Antonio Spurs",  # Alternative abbreviation
-        "TOR": "Toronto Raptors",
-        "UTA": "Utah Jazz",
-        "WAS": "Washington Wizards",
-    }
-
-    def __init__(self) -> None:
-        """Initialize the scraper with configuration."""
+    def __init__(self, diagnostics: bool = False) -> None:
+        """Initialize the scraper with configuration.
+
+        Args:
+            diagnostics: Save raw and prettified pages to /tmp and log selector
+                statistics on every import (slow, for debugging layout changes)
+        """
         self.settings = get_settings()
+        self.diagnostics = diagnostics
+        self.teams = get_team_registry()
         self.base_url = "https://basketballmonster.com"
         self.lineups_url = f"{self.base_url}/nbalineups.aspx"
         self.session = self._create_session()
@@ -210,60 +177,17 @@ class BasketballMonsterScraper:
             "Starting lineup import", target_date=target_date, scrape_date=scrape_date
         )
 
-        # Fetch lineups page (with debug enabled to save raw response)
-        lineups_page = self._get_page(self.lineups_url, save_debug=True)
-
-        # Delete existing lineups for this scrape date and game date combination
-        with get_db() as db:
-            deleted = (
-                db.query(DailyLineup)
-                .filter(
-                    and_(
-                        DailyLineup.scrape_date == scrape_date,
-                        DailyLineup.game_date == target_date,
-                    )
-                )
-                .delete(synchronize_session=False)
-            )
-            logger.info("Deleted existing lineups", count=deleted)
+        # Fetch lineups page (the raw response is saved in diagnostics mode)
+        lineups_page = self._get_page(self.lineups_url, save_debug=self.diagnostics)
 
-        lineups_imported = 0
+        entries: List[Dict[str, Any]] = []
 
-        # DEBUG: Save HTML to file for inspection
-        try:
-            debug_path = "/tmp/basketballmonster_debug.html"
-            with open(debug_path, "w", encoding="utf-8", errors="replace") as f:
-                html_content = lineups_page.prettify()
-                f.write(html_content)
-
-            logger.info(
-                "DEBUG: Saved HTML to /tmp/basketballmonster_debug.html",
-                size_chars=len(html_content),
-                first_100_chars=html_content[:100],
-            )
-        except Exception as e:
-            logger.warning("Could not save debug HTML", error=str(e), exc_info=True)
+        if self.diagnostics:
+            self._log_diagnostics(lineups_page)
 
-        # Basketball Monster specific parsing
         # Basketball Monster uses a table-based layout with game matchups
-        logger.info("DEBUG: Testing different selector patterns for Basketball Monster...")
-
-        # Strategy 1: Look for the main lineups table/container
-        # Basketball Monster typically has a table with class containing "lineups" or "matchups"
         main_tables = lineups_page.find_all("table")
-        logger.info(f"DEBUG: Found {len(main_tables)} tables")
-
-        # Strategy 2: Look for divs with game containers
-        game_containers = lineups_page.find_all("div", class_=lambda x: x and any(
-            keyword in str(x).lower() for keyword in ["game", "matchup", "contest"]
-        ))
-        logger.info(f"DEBUG: Found {len(game_containers)} game containers")
-
-        # Strategy 3: Look for repeating patterns - each game usually has two team sections
-        team_sections = lineups_page.find_all(["div", "tr"], class_=lambda x: x and any(
-            keyword in str(x).lower() for keyword in ["team", "roster"]
-        ))
-        logger.info(f"DEBUG: Found {len(team_sections)} team sections")
+        logger.info("Found tables", count=len(main_tables))
 
         # Parse games from tables (most common Basketball Monster structure)
         parsed_games = []
@@ -278,16 +202,12 @@ class BasketballMonsterScraper:
 
                 # Try to parse this table as a game
                 game_lineups = self._parse_basketball_monster_table(
-                    table, scrape_date, target_date
+                    table, scrape_date, target_date, rows
                 )
 
                 if game_lineups:
                     parsed_games.append(game_lineups)
-                    for lineup_data in game_lineups:
-                        with get_db() as db:
-                            lineup = DailyLineup(**lineup_data)
-                            db.add(lineup)
-                            lineups_imported += 1
+                    entries.extend(game_lineups)
 
                     logger.info(f"Parsed game with {len(game_lineups)} players")
 
@@ -300,6 +220,7 @@ class BasketballMonsterScraper:
             logger.warning("No games found in tables, trying alternative parsing strategies")
 
             # Try parsing from div containers
+            game_containers = lineups_page.find_all("div", class_=self._is_game_container)
             for container in game_containers:
                 try:
                     game_lineups = self._parse_game_container(
@@ -307,11 +228,7 @@ class BasketballMonsterScraper:
                     )
 
                     if game_lineups:
-                        for lineup_data in game_lineups:
-                            with get_db() as db:
-                                lineup = DailyLineup(**lineup_data)
-                                db.add(lineup)
-                                lineups_imported += 1
+                        entries.extend(game_lineups)
 
                         logger.info(f"Parsed game container with {len(game_lineups)} players")
 
@@ -319,11 +236,70 @@ class BasketballMonsterScraper:
                     logger.debug(f"Failed to parse game container: {e}")
                     continue
 
+        # Replace the slate in one transaction
+        try:
+            lineups_imported = replace_lineups(
+                scrape_date, target_date, entries, replace_slate=True
+            )
+        except Exception as e:
+            logger.error("Failed to save lineups", error=str(e), exc_info=True)
+            raise BasketballMonsterScraperError(f"Failed to save lineups: {e}")
+
         logger.info("Lineup import completed", lineups_imported=lineups_imported)
         return lineups_imported
 
+    @staticmethod
+    def _is_game_container(classes: Any) -> bool:
+        """Whether a class attribute looks like a game card."""
+        return bool(classes) and any(
+            keyword in str(classes).lower() for keyword in ["game", "matchup", "contest"]
+        )
+
+    def _log_diagnostics(self, lineups_page: BeautifulSoup) -> None:
+        """Save the prettified page and log counts of alternative selectors.
+
+        Only used in diagnostics mode: every strategy is a full document scan.
+
+        Args:
+            lineups_page: Parsed lineups page
+        """
+        # DEBUG: Save HTML to file for inspection
+        try:
+            debug_path = "/tmp/basketballmonster_debug.html"
+            with open(debug_path, "w", encoding="utf-8", errors="replace") as f:
+                html_content = lineups_page.prettify()
+                f.write(html_content)
+
+            logger.info(
+                "DEBUG: Saved HTML to /tmp/basketballmonster_debug.html",
+                size_chars=len(html_content),
+                first_100_chars=html_content[:100],
+            )
+        except Exception as e:
+            logger.warning("Could not save debug HTML", error=str(e), exc_info=True)
+
+        logger.info("DEBUG: Testing different selector patterns for Basketball Monster...")
+
+        # Strategy 1: Look for the main lineups table/container
+        main_tables = lineups_page.find_all("table")
+        logger.info(f"DEBUG: Found {len(main_tables)} tables")
+
+        # Strategy 2: Look for divs with game containers
+        game_containers = lineups_page.find_all("div", class_=self._is_game_container)
+        logger.info(f"DEBUG: Found {len(game_containers)} game containers")
+
+        # Strategy 3: Look for repeating patterns - each game usually has two team sections
+        team_sections = lineups_page.find_all(["div", "tr"], class_=lambda x: x and any(
+            keyword in str(x).lower() for keyword in ["team", "roster"]
+        ))
+        logger.info(f"DEBUG: Found {len(team_sections)} team sections")
+
     def _parse_basketball_monster_table(
-        self, table: Any, scrape_date: date, game_date: date
+        self,
+        table: Any,
+        scrape_date: date,
+        game_date: date,
+        rows: Optional[List[Any]] = None,
     ) -> List[Dict[str, Any]]:
         """Parse a Basketball Monster table for lineup data.
 
@@ -331,30 +307,25 @@ class BasketballMonsterScraper:
             table: BeautifulSoup table element
             scrape_date: Date when data was scraped
             game_date: Date of the game
+            rows: Rows of the table, if already found
 
         Returns:
             List of lineup entry dictionaries
         """
         lineups = []
-        rows = table.find_all("tr")
+        if rows is None:
+            rows = table.find_all("tr")
 
-        # Try to identify teams from the table
-        text_content = table.get_text()
-        found_teams = []
-
-        for abbr in self.TEAM_ABBR_MAP.keys():
-            if abbr in text_content:
-                found_teams.append(abbr)
+        # Try to identify teams from the table (abbreviations, in order of appearance)
+        found_teams = self.teams.find_teams(table.get_text(" "), abbreviations_only=True)
 
         if len(found_teams) < 2:
             logger.debug(f"Table doesn't have 2 teams, found: {found_teams}")
             return lineups
 
         # Use first two teams found
-        team1_abbr = found_teams[0]
-        team2_abbr = found_teams[1]
-        team1_name = self.TEAM_ABBR_MAP.get(team1_abbr, team1_abbr)
-        team2_name = self.TEAM_ABBR_MAP.get(team2_abbr, team2_abbr)
+        team1_name = found_teams[0]
+        team2_name = found_teams[1]
 
         logger.debug(f"Parsing Basketball Monster table: {team1_name} vs {team2_name}")
 
@@ -362,13 +333,13 @@ class BasketballMonsterScraper:
 
         for row in rows:
             try:
-                row_text = row.get_text().strip()
+                row_teams = self.teams.find_teams(row.get_text(" "), abbreviations_only=True)
 
                 # Check if this row contains team header
-                if team1_abbr in row_text and current_team != team1_name:
+                if team1_name in row_teams and current_team != team1_name:
                     current_team = team1_name
                     continue
-                elif team2_abbr in row_text and current_team != team2_name:
+                elif team2_name in row_teams and current_team != team2_name:
                     current_team = team2_name
                     continue
 
@@ -429,14 +400,10 @@ class BasketballMonsterScraper:
                 text_content = team_div.get_text()
 
                 # Find team
-                team_name = None
-                for abbr, full_name in self.TEAM_ABBR_MAP.items():
-                    if abbr in text_content or full_name in text_content:
-                        team_name = full_name
-                        break
-
-                if not team_name:
+                found_teams = self.teams.find_teams(text_content)
+                if not found_teams:
                     continue
+                team_name = found_teams[0]
 
                 # Find player rows/elements
                 player_elements = team_div.find_all(["li", "div", "tr"], class_=lambda x: x and any(
@@ -549,18 +516,4 @@ class BasketballMonsterScraper:
         Returns:
             Normalized status string
         """
-        status_map = {
-            "OUT": "OUT",
-            "O": "OUT",
-            "INJ": "OUT",
-            "GTD": "GTD",
-            "Q": "Questionable",
-            "QUES": "Questionable",
-            "D": "Doubtful",
-            "DOUBT": "Doubtful",
-            "P": "Probable",
-            "PROB": "Probable",
-            "DTD": "GTD",  # Day-to-day
-        }
-
-        return status_map.get(status.upper(), status)
+        return normalize_lineup_status(status)
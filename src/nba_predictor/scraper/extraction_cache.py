@@ -0,0 +1,183 @@
+"""On-disk cache of lineups extracted from screenshots.
+
+Vision calls are the expensive part of an image import. Extraction results
+are stored as one JSON file per screenshot, keyed by the SHA-256 of the image
+bytes plus everything else that determines what Claude is asked (prompt
+version, model and preprocessing options). Re-importing the same screenshot,
+e.g. with another game date or after a database error, then costs nothing,
+and changing the prompt automatically misses the old entries.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from nba_predictor.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+CHUNK_SIZE = 1 << 20
+
+
+def hash_image(image_path: Union[str, Path]) -> str:
+    """Compute the SHA-256 of an image file.
+
+    Args:
+        image_path: Path to the image
+
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(image_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """Directory of cached extraction results, one JSON file per key."""
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory (created on first write)
+        """
+        self.directory = Path(directory)
+
+    @staticmethod
+    def key(image_sha256: str, variant: str) -> str:
+        """Build the cache key of an image.
+
+        Args:
+            image_sha256: SHA-256 of the image bytes
+            variant: Prompt version, model and options the result depends on
+
+        Returns:
+            Cache key
+        """
+        return hashlib.sha256(f"{image_sha256}:{variant}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Get cached lineups.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached lineup dictionaries, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)["lineups"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Ignoring unreadable cache entry", path=str(path), error=str(e))
+            return None
+
+    def put(
+        self,
+        key: str,
+        lineups: List[Dict[str, Any]],
+        image_path: Union[str, Path],
+        image_sha256: str,
+        variant: str,
+    ) -> None:
+        """Store extracted lineups.
+
+        The entry is written to a temporary file and renamed, so concurrent
+        readers never see a partial file.
+
+        Args:
+            key: Cache key
+            lineups: Extracted lineup dictionaries
+            image_path: Image the lineups were extracted from
+            image_sha256: SHA-256 of the image bytes
+            variant: Prompt version, model and options used
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "key": key,
+            "image": str(image_path),
+            "image_sha256": image_sha256,
+            "variant": variant,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "lineups": lineups,
+        }
+
+        path = self._path(key)
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(temp_path, path)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Describe all cache entries.
+
+        Returns:
+            One summary per entry (key, image, hash, variant, creation time,
+            lineup count and file size), oldest first
+        """
+        if not self.directory.is_dir():
+            return []
+
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable cache entry", path=str(path), error=str(e))
+                continue
+            entries.append(
+                {
+                    "key": entry.get("key", path.stem),
+                    "image": entry.get("image"),
+                    "image_sha256": entry.get("image_sha256"),
+                    "variant": entry.get("variant"),
+                    "created_at": entry.get("created_at"),
+                    "lineups": len(entry.get("lineups") or []),
+                    "bytes": path.stat().st_size,
+                }
+            )
+        return sorted(entries, key=lambda entry: entry["created_at"] or "")
+
+    def invalidate(self, image_sha256: str) -> int:
+        """Remove every entry of an image, whatever prompt or options produced it.
+
+        Args:
+            image_sha256: SHA-256 of the image bytes
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for entry in self.entries():
+            if entry["image_sha256"] == image_sha256:
+                self._path(entry["key"]).unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def clear(self) -> int:
+        """Remove all entries.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.directory.is_dir():
+            return 0
+
+        removed = 0
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
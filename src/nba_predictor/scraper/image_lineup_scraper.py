@@ -5,21 +5,89 @@ and uses Claude's vision capabilities to extract structured lineup data.
 """
 
 import base64
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-import anthropic
-from sqlalchemy import and_
+from pydantic import BaseModel, Field
 
+from nba_predictor.core.anthropic_client import get_anthropic_client
 from nba_predictor.core.config import get_settings
 from nba_predictor.core.logger import get_logger
-from nba_predictor.models import DailyLineup, get_db
+from nba_predictor.core.structured_output import (
+    StructuredOutputError,
+    request_structured,
+    tool_definition,
+)
+from nba_predictor.scraper import image_preprocessing
+from nba_predictor.scraper.extraction_cache import ExtractionCache, hash_image
+from nba_predictor.scraper.lineup_writer import replace_lineups
+from nba_predictor.utils.teams import get_team_registry
 
 logger = get_logger(__name__)
 
 
+class LineupEntry(BaseModel):
+    """One player in an extracted lineup."""
+
+    team_name: str = Field(description="Full team name, e.g. Los Angeles Lakers")
+    player_name: str = Field(description="Player first and last name")
+    position: Optional[str] = Field(default=None, description="PG, SG, SF, PF, C, G or F")
+    status: str = Field(
+        default="Active",
+        description=(
+            'One of "Starter", "Expected Lineup", "OUT", "Doubtful", "Questionable", '
+            '"GTD", "Probable" or "Active"'
+        ),
+    )
+    injury_description: Optional[str] = Field(
+        default=None, description="Injury label or description, if any"
+    )
+
+
+class LineupExtraction(BaseModel):
+    """All lineup entries found in a screenshot."""
+
+    lineups: List[LineupEntry]
+
+
+LINEUP_TOOL = tool_definition(
+    LineupExtraction,
+    name="submit_lineups",
+    description="Submit every lineup entry found in the screenshot.",
+)
+
+
+LINEUP_MODEL = "claude-sonnet-4-5-20250929"
+
+# Bump whenever LINEUP_PROMPT or LINEUP_TOOL changes, so cached extractions are not reused
+PROMPT_VERSION = "1"
+
+LINEUP_PROMPT = """You are analyzing a screenshot of NBA daily lineups. Please extract ALL the lineup information from this image.
+
+For each game shown in the image, extract:
+1. Both team names (full names like "Los Angeles Lakers" or abbreviations like "LAL")
+2. For each team, list ALL players in the expected lineup
+3. For each player, provide:
+   - Player name (first and last name)
+   - Position (PG, SG, SF, PF, C, G, or F)
+   - Status (one of: "Starter", "Expected Lineup", "OUT", "Doubtful", "Questionable", "GTD", "Probable", or "Active")
+   - Injury description (if any injury label is shown like "Out", "Doubtful", "GTD", etc.)
+
+If the page is split into several images, they are consecutive parts of the same page, top to bottom, and may overlap slightly.
+
+Submit all entries with the submit_lineups tool, one entry per player.
+
+IMPORTANT:
+- For team names, if you see an abbreviation, convert it to the full team name. For example: "LAL" → "Los Angeles Lakers", "BOS" → "Boston Celtics"
+- Include ALL players shown in the lineup, not just starters
+- If a player is in the "Expected Lineup" section, use status "Expected Lineup"
+- If a player has an injury indicator (Out, Doubtful, Questionable, GTD, etc.), use that as the status
+- If a player has an injury status but no injury description is visible, set injury_description to the status value"""
+
+
 class ImageLineupScraperError(Exception):
     """Base exception for image lineup scraper errors."""
 
@@ -29,56 +97,55 @@ class ImageLineupScraperError(Exception):
 class ImageLineupScraper:
     """Scraper that reads lineup data from images using Claude Vision API."""
 
-    # Mapping of team abbreviations to full names
-    TEAM_ABBR_MAP = {
-        "ATL": "Atlanta Hawks",
-        "BOS": "Boston Celtics",
-        "BKN": "Brooklyn Nets",
-        "BRK": "Brooklyn Nets",
-        "CHA": "Charlotte Hornets",
-        "CHO": "Charlotte Hornets",
-        "CHI": "Chicago Bulls",
-        "CLE": "Cleveland Cavaliers",
-        "DAL": "Dallas Mavericks",
-        "DEN": "Denver Nuggets",
-        "DET": "Detroit Pistons",
-        "GSW": "Golden State Warriors",
-        "GS": "Golden State Warriors",
-        "HOU": "Houston Rockets",
-        "IND": "Indiana Pacers",
-        "LAC": "Los Angeles Clippers",
-        "LAL": "Los Angeles Lakers",
-        "LA": "Los Angeles Lakers",
-        "MEM": "Memphis Grizzlies",
-        "MIA": "Miami Heat",
-        "MIL": "Milwaukee Bucks",
-        "MIN": "Minnesota Timberwolves",
-        "NOP": "New Orleans Pelicans",
-        "NO": "New Orleans Pelicans",
-        "NYK": "New York Knicks",
-        "NY": "New York Knicks",
-        "OKC": "Oklahoma City Thunder",
-        "ORL": "Orlando Magic",
-        "PHI": "Philadelphia 76ers",
-        "PHX": "Phoenix Suns",
-        "POR": "Portland Trail Blazers",
-        "SAC": "Sacramento Kings",
-        "SAS": "San Antonio Spurs",
-        "SA": "San Antonio Spurs",
-        "TOR": "Toronto Raptors",
-        "UTA": "Utah Jazz",
-        "WAS": "Washington Wizards",
-    }
-
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        preprocess: bool = False,
+        tile: bool = False,
+        use_cache: bool = True,
+    ) -> None:
         """Initialize the scraper with Anthropic API.
 
         Args:
-            api_key: Anthropic API key (if not provided, will look for ANTHROPIC_API_KEY env var)
+            api_key: Anthropic API key (if not provided, will look for ANTHROPIC_API_KEY)
+            preprocess: Crop and downscale screenshots before sending them
+                (requires Pillow)
+            tile: When preprocessing, split very tall screenshots into several
+                images instead of shrinking them
+            use_cache: Reuse extractions of identical screenshots from the
+                on-disk cache (``SCRAPER_IMAGE_CACHE_DIR``)
+
+        Raises:
+            ImageLineupScraperError: If preprocessing is requested without Pillow
         """
+        if preprocess and not image_preprocessing.is_available():
+            raise ImageLineupScraperError(
+                "Image preprocessing requires Pillow (pip install Pillow)"
+            )
+
         self.settings = get_settings()
-        self.client = anthropic.Anthropic(api_key=api_key)
-        logger.info("Image lineup scraper initialized")
+        self.client = get_anthropic_client(api_key)
+        self.preprocess = preprocess
+        self.tile = tile
+        self.teams = get_team_registry()
+        self.cache = ExtractionCache(self.settings.scraper.image_cache_dir) if use_cache else None
+        # One lock per cache key, so identical images in one batch are only sent once
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._key_locks_guard = threading.Lock()
+        logger.info(
+            "Image lineup scraper initialized",
+            preprocess=preprocess,
+            tile=tile,
+            cache=use_cache,
+        )
+
+    @property
+    def cache_variant(self) -> str:
+        """Everything besides the image bytes that determines an extraction."""
+        return (
+            f"prompt={PROMPT_VERSION};model={LINEUP_MODEL};"
+            f"preprocess={self.preprocess};tile={self.tile}"
+        )
 
     def _encode_image(self, image_path: Union[str, Path]) -> tuple[str, str]:
         """Encode an image file to base64.
@@ -121,8 +188,57 @@ class ImageLineupScraper:
             logger.error("Failed to encode image", path=str(image_path), error=str(e))
             raise ImageLineupScraperError(f"Failed to encode image: {e}")
 
+    def _image_blocks(self, image_path: Union[str, Path]) -> List[Dict[str, Any]]:
+        """Build the image content blocks for a screenshot.
+
+        Without preprocessing the original file is sent as one block. With
+        preprocessing, the screenshot is cropped and downscaled; with tiling,
+        very tall pages are split and each tile becomes one block (in page order).
+
+        Args:
+            image_path: Path to image file
+
+        Returns:
+            Image content blocks for the Messages API
+
+        Raises:
+            ImageLineupScraperError: If the image cannot be read
+        """
+        if not self.preprocess:
+            image_data, media_type = self._encode_image(image_path)
+            return [
+                {
+                    "type": "image",
+                    "source": {"type": "base64", "media_type": media_type, "data": image_data},
+                }
+            ]
+
+        if not Path(image_path).exists():
+            raise ImageLineupScraperError(f"Image file not found: {image_path}")
+
+        try:
+            prepared, _ = image_preprocessing.preprocess_image(image_path, tile=self.tile)
+        except image_preprocessing.ImagePreprocessingError as e:
+            raise ImageLineupScraperError(str(e))
+
+        return [
+            {
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": image.media_type,
+                    "data": base64.standard_b64encode(image.data).decode("utf-8"),
+                },
+            }
+            for image in prepared
+        ]
+
     def _extract_lineups_from_image(self, image_path: Union[str, Path]) -> List[Dict[str, Any]]:
-        """Extract lineup data from an image using Claude Vision.
+        """Extract lineup data from an image, reusing cached extractions.
+
+        Results are cached by the SHA-256 of the image bytes plus the prompt
+        version, model and preprocessing options, so an identical screenshot
+        is only sent to Claude once.
 
         Args:
             image_path: Path to lineup image (screenshot)
@@ -133,98 +249,90 @@ class ImageLineupScraper:
         Raises:
             ImageLineupScraperError: If extraction fails
         """
+        if self.cache is None:
+            return self._request_lineups(image_path)
+
         try:
-            logger.info("Extracting lineups from image", path=str(image_path))
+            image_sha256 = hash_image(image_path)
+        except OSError as e:
+            logger.error("Failed to read image", path=str(image_path), error=str(e))
+            raise ImageLineupScraperError(f"Failed to read image {image_path}: {e}")
 
-            # Encode image
-            image_data, media_type = self._encode_image(image_path)
+        variant = self.cache_variant
+        key = self.cache.key(image_sha256, variant)
 
-            # Create the prompt for Claude
-            prompt = """You are analyzing a screenshot of NBA daily lineups. Please extract ALL the lineup information from this image.
+        with self._key_locks_guard:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
 
-For each game shown in the image, extract:
-1. Both team names (full names like "Los Angeles Lakers" or abbreviations like "LAL")
-2. For each team, list ALL players in the expected lineup
-3. For each player, provide:
-   - Player name (first and last name)
-   - Position (PG, SG, SF, PF, C, G, or F)
-   - Status (one of: "Starter", "Expected Lineup", "OUT", "Doubtful", "Questionable", "GTD", "Probable", or "Active")
-   - Injury description (if any injury label is shown like "Out", "Doubtful", "GTD", etc.)
+        with key_lock:
+            lineups = self.cache.get(key)
+            if lineups is not None:
+                logger.info("Using cached lineups", path=str(image_path), count=len(lineups))
+                return lineups
 
-Return the data as a JSON array with this exact structure:
-[
-  {
-    "team_name": "Los Angeles Lakers",
-    "player_name": "LeBron James",
-    "position": "SF",
-    "status": "Starter",
-    "injury_description": null
-  },
-  {
-    "team_name": "Boston Celtics",
-    "player_name": "Jayson Tatum",
-    "position": "SF",
-    "status": "OUT",
-    "injury_description": "Out"
-  }
-]
+            lineups = self._request_lineups(image_path)
+            try:
+                self.cache.put(key, lineups, image_path, image_sha256, variant)
+            except OSError as e:
+                logger.warning("Failed to cache lineups", path=str(image_path), error=str(e))
+            return lineups
 
-IMPORTANT:
-- For team names, if you see an abbreviation, convert it to the full team name. For example: "LAL" → "Los Angeles Lakers", "BOS" → "Boston Celtics"
-- Include ALL players shown in the lineup, not just starters
-- If a player is in the "Expected Lineup" section, use status "Expected Lineup"
-- If a player has an injury indicator (Out, Doubtful, Questionable, GTD, etc.), use that as the status
-- If a player has an injury status but no injury description is visible, set injury_description to the status value
-- Only return the JSON array, no other text or explanation"""
+    def _request_lineups(self, image_path: Union[str, Path]) -> List[Dict[str, Any]]:
+        """Extract lineup data from an image using Claude Vision.
+
+        Args:
+            image_path: Path to lineup image (screenshot)
+
+        Returns:
+            List of lineup dictionaries
+
+        Raises:
+            ImageLineupScraperError: If extraction fails
+        """
+        try:
+            logger.info("Extracting lineups from image", path=str(image_path))
+
+            # Encode image (one block per tile when preprocessing)
+            image_blocks = self._image_blocks(image_path)
+
+            progress = {"entries": 0}
+
+            def log_partial(snapshot: Dict[str, Any]) -> None:
+                streamed = len(snapshot.get("lineups") or [])
+                if streamed > progress["entries"]:
+                    progress["entries"] = streamed
+                    logger.debug("Lineup entries streamed", count=streamed)
 
             # Call Claude Vision API
-            message = self.client.messages.create(
-                model="claude-sonnet-4-5-20250929",
+            extraction = request_structured(
+                self.client,
+                LineupExtraction,
+                LINEUP_TOOL,
+                on_partial=log_partial,
+                model=LINEUP_MODEL,
                 max_tokens=4096,
                 messages=[
                     {
                         "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": image_data,
-                                },
-                            },
+                        "content": image_blocks
+                        + [
                             {
                                 "type": "text",
-                                "text": prompt,
+                                "text": LINEUP_PROMPT,
                             },
                         ],
                     }
                 ],
             )
 
-            # Extract response text
-            response_text = message.content[0].text
-            logger.debug("Claude Vision response received", length=len(response_text))
-
-            # Parse JSON response
-            # Claude might wrap the JSON in markdown code blocks, so let's handle that
-            response_text = response_text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            response_text = response_text.strip()
-
-            lineups = json.loads(response_text)
+            lineups = [entry.model_dump() for entry in extraction.lineups]
 
             logger.info("Successfully extracted lineups", count=len(lineups))
             return lineups
 
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse Claude response as JSON", error=str(e), response=response_text[:500])
-            raise ImageLineupScraperError(f"Failed to parse response as JSON: {e}")
+        except StructuredOutputError as e:
+            logger.error("Invalid lineups in Claude response", error=str(e))
+            raise ImageLineupScraperError(f"Failed to parse lineups from response: {e}")
         except Exception as e:
             logger.error("Failed to extract lineups from image", error=str(e), exc_info=True)
             raise ImageLineupScraperError(f"Failed to extract lineups: {e}")
@@ -238,20 +346,81 @@ IMPORTANT:
         Returns:
             Full standardized team name
         """
-        # First try direct abbreviation lookup
-        if team_identifier.upper() in self.TEAM_ABBR_MAP:
-            return self.TEAM_ABBR_MAP[team_identifier.upper()]
+        # Direct lookup of an abbreviation, full name, nickname or alias
+        team_name = self.teams.resolve(team_identifier)
+        if team_name:
+            return team_name
 
-        # Try to match against known full names
-        team_identifier_lower = team_identifier.lower()
-        for abbr, full_name in self.TEAM_ABBR_MAP.items():
-            if team_identifier_lower in full_name.lower() or full_name.lower() in team_identifier_lower:
-                return full_name
+        # Otherwise look for a team mentioned in the text, e.g. "Lakers (LAL)"
+        found_teams = self.teams.find_teams(team_identifier)
+        if found_teams:
+            return found_teams[0]
 
         # Return as-is if no match found
         logger.warning("Could not normalize team name", team=team_identifier)
         return team_identifier
 
+    def _build_entries(
+        self,
+        raw_lineups: List[Dict[str, Any]],
+        scrape_date: date,
+        game_date: date,
+    ) -> List[Dict[str, Any]]:
+        """Normalize extracted lineups and merge duplicate players.
+
+        The same player can appear in several overlapping screenshots. Entries
+        are keyed by team and player name; when a player is seen more than
+        once, the more specific status wins (an injury status over a starter
+        listing over a generic "Active").
+
+        Args:
+            raw_lineups: Lineup dictionaries extracted from one or more images
+            scrape_date: Date of the scrape
+            game_date: Date of the games
+
+        Returns:
+            Database-ready lineup entries, one per team and player
+        """
+        entries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        for lineup_data in raw_lineups:
+            try:
+                team_name = self._normalize_team_name(lineup_data["team_name"])
+                player_name = " ".join(lineup_data["player_name"].split())
+            except (KeyError, AttributeError) as e:
+                logger.error("Skipping invalid lineup entry", lineup=lineup_data, error=str(e))
+                continue
+
+            entry = {
+                "scrape_date": scrape_date,
+                "game_date": game_date,
+                "team_name": team_name,
+                "player_name": player_name,
+                "position": lineup_data.get("position"),
+                "status": lineup_data.get("status") or "Active",
+                "injury_description": lineup_data.get("injury_description"),
+                "notes": None,
+            }
+
+            key = (team_name, player_name.lower())
+            existing = entries.get(key)
+            if existing is None or self._status_rank(entry) > self._status_rank(existing):
+                if existing and not entry["position"]:
+                    entry["position"] = existing["position"]
+                entries[key] = entry
+
+        return list(entries.values())
+
+    @staticmethod
+    def _status_rank(entry: Dict[str, Any]) -> int:
+        """Rank how informative a lineup status is (higher wins when merging)."""
+        status = entry["status"]
+        if status in ("Active", "Expected Lineup"):
+            return 0
+        if status == "Starter":
+            return 1
+        return 2
+
     def import_lineups_from_image(
         self,
         image_path: Union[str, Path],
@@ -269,113 +438,83 @@ IMPORTANT:
         Raises:
             ImageLineupScraperError: If import fails
         """
-        if game_date is None:
-            game_date = date.today()
-
-        scrape_date = date.today()
-
-        logger.info(
-            "Starting lineup import from image",
-            image=str(image_path),
-            game_date=game_date,
-            scrape_date=scrape_date,
+        return self.import_lineups_from_multiple_images(
+            [image_path], game_date, raise_on_error=True
         )
 
-        # Extract lineups from image
-        raw_lineups = self._extract_lineups_from_image(image_path)
-
-        # Delete existing lineups for this scrape date and game date combination
-        with get_db() as db:
-            deleted = (
-                db.query(DailyLineup)
-                .filter(
-                    and_(
-                        DailyLineup.scrape_date == scrape_date,
-                        DailyLineup.game_date == game_date,
-                    )
-                )
-                .delete(synchronize_session=False)
-            )
-            logger.info("Deleted existing lineups", count=deleted)
-
-        # Import lineups to database
-        lineups_imported = 0
-
-        for lineup_data in raw_lineups:
-            try:
-                # Normalize team name
-                team_name = self._normalize_team_name(lineup_data["team_name"])
-
-                # Prepare database entry
-                db_entry = {
-                    "scrape_date": scrape_date,
-                    "game_date": game_date,
-                    "team_name": team_name,
-                    "player_name": lineup_data["player_name"],
-                    "position": lineup_data.get("position"),
-                    "status": lineup_data.get("status", "Active"),
-                    "injury_description": lineup_data.get("injury_description"),
-                    "notes": None,
-                }
-
-                # Save to database
-                with get_db() as db:
-                    lineup = DailyLineup(**db_entry)
-                    db.add(lineup)
-                    lineups_imported += 1
-
-                logger.debug(
-                    "Imported lineup entry",
-                    team=team_name,
-                    player=lineup_data["player_name"],
-                    status=db_entry["status"],
-                )
-
-            except Exception as e:
-                logger.error(
-                    "Failed to import lineup entry",
-                    lineup=lineup_data,
-                    error=str(e),
-                    exc_info=True,
-                )
-                continue
-
-        logger.info("Lineup import completed", lineups_imported=lineups_imported)
-        return lineups_imported
-
     def import_lineups_from_multiple_images(
         self,
         image_paths: List[Union[str, Path]],
         game_date: Optional[date] = None,
+        max_workers: Optional[int] = None,
+        raise_on_error: bool = False,
     ) -> int:
         """Import lineups from multiple image screenshots.
 
-        Useful when you have multiple screenshots of different games.
+        All images are sent to Claude concurrently, so a slate of screenshots
+        takes about as long as a single call. The extracted players are merged
+        and deduplicated, then written with one delete and one bulk insert in
+        a single transaction.
 
         Args:
             image_paths: List of paths to lineup screenshots
             game_date: Date of the games (defaults to today)
+            max_workers: Maximum concurrent Vision calls (default: one per image)
+            raise_on_error: Raise instead of skipping images that fail
 
         Returns:
             Total number of lineup entries imported
+
+        Raises:
+            ImageLineupScraperError: If an image fails and ``raise_on_error`` is set
         """
-        total_imported = 0
+        if game_date is None:
+            game_date = date.today()
 
-        for image_path in image_paths:
-            try:
-                count = self.import_lineups_from_image(image_path, game_date)
-                total_imported += count
-            except Exception as e:
-                logger.error(
-                    "Failed to import from image",
-                    image=str(image_path),
-                    error=str(e),
-                )
-                continue
+        scrape_date = date.today()
+
+        logger.info(
+            "Starting lineup import from images",
+            images=len(image_paths),
+            game_date=game_date,
+            scrape_date=scrape_date,
+        )
+
+        raw_lineups: List[Dict[str, Any]] = []
+        images_failed = 0
+
+        workers = max(1, min(max_workers or len(image_paths), len(image_paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._extract_lineups_from_image, image_path): image_path
+                for image_path in image_paths
+            }
+            for future in as_completed(futures):
+                try:
+                    raw_lineups.extend(future.result())
+                except Exception as e:
+                    if raise_on_error:
+                        raise
+                    images_failed += 1
+                    logger.error(
+                        "Failed to import from image",
+                        image=str(futures[future]),
+                        error=str(e),
+                    )
+
+        entries = self._build_entries(raw_lineups, scrape_date, game_date)
+
+        try:
+            total_imported = replace_lineups(scrape_date, game_date, entries)
+        except Exception as e:
+            logger.error("Failed to save lineups", error=str(e), exc_info=True)
+            raise ImageLineupScraperError(f"Failed to save lineups: {e}")
 
         logger.info(
-            "Completed multiple image import",
+            "Completed image import",
             images_processed=len(image_paths),
+            images_failed=images_failed,
+            extracted=len(raw_lineups),
             total_imported=total_imported,
         )
         return total_imported
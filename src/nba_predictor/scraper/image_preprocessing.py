@@ -0,0 +1,285 @@
+"""Optional preprocessing of lineup screenshots before Vision calls.
+
+Retina screenshots are much larger than what the model actually looks at:
+images whose long edge exceeds ``MAX_LONG_EDGE`` pixels (or whose area exceeds
+``MAX_PIXELS``) are downscaled server-side anyway, after the full payload has
+been uploaded. Preprocessing crops the page to its content, optionally splits
+very tall pages into readable tiles, downscales to the effective resolution
+and re-encodes in a compact format.
+
+Requires Pillow (``pip install Pillow``); without it the scraper sends the
+original image bytes.
+"""
+
+import io
+import math
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+try:
+    from PIL import Image, ImageChops
+except ImportError:  # Pillow is optional
+    Image = None
+    ImageChops = None
+
+from nba_predictor.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Effective input resolution of Claude's vision encoder
+MAX_LONG_EDGE = 1568
+MAX_PIXELS = 1_150_000
+# Approximate image tokens per pixel after the model's own resizing
+PIXELS_PER_TOKEN = 750
+
+# Pages taller than this height/width ratio that would otherwise be shrunk are split into tiles
+MAX_TILE_ASPECT = 2.0
+MAX_TILES = 8
+# Vertical overlap between tiles so rows cut by a tile edge appear whole in the next
+TILE_OVERLAP = 0.05
+
+# Pixels differing from the background by less than this are treated as background
+CROP_THRESHOLD = 16
+CROP_MARGIN = 8
+
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".webp")
+
+MEDIA_TYPES = {"WEBP": "image/webp", "PNG": "image/png", "JPEG": "image/jpeg"}
+
+
+class ImagePreprocessingError(Exception):
+    """Exception raised when an image cannot be preprocessed."""
+
+    pass
+
+
+@dataclass
+class PreparedImage:
+    """Encoded image (or tile) ready to be sent to the Vision API."""
+
+    data: bytes
+    media_type: str
+    width: int
+    height: int
+
+
+def is_available() -> bool:
+    """Whether Pillow is installed."""
+    return Image is not None
+
+
+def _scale(width: int, height: int) -> float:
+    """Scale factor the model applies to an image of the given size."""
+    return min(1.0, MAX_LONG_EDGE / max(width, height), math.sqrt(MAX_PIXELS / (width * height)))
+
+
+def estimate_image_tokens(width: int, height: int) -> int:
+    """Estimate the image tokens billed for an image of the given size.
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        Approximate token count after the model's own downscaling
+    """
+    scale = _scale(width, height)
+    return math.ceil((width * scale) * (height * scale) / PIXELS_PER_TOKEN)
+
+
+def _crop_to_content(image: Any) -> Any:
+    """Crop uniform borders, using the top-left pixel as the background color."""
+    background = Image.new(image.mode, image.size, image.getpixel((0, 0)))
+    difference = ImageChops.difference(image, background).convert("L")
+    mask = difference.point(lambda value: 255 if value > CROP_THRESHOLD else 0)
+    bbox = mask.getbbox()
+    if not bbox:
+        return image
+
+    left, top, right, bottom = bbox
+    return image.crop(
+        (
+            max(0, left - CROP_MARGIN),
+            max(0, top - CROP_MARGIN),
+            min(image.width, right + CROP_MARGIN),
+            min(image.height, bottom + CROP_MARGIN),
+        )
+    )
+
+
+def _tiles(image: Any) -> List[Any]:
+    """Split a very tall image into overlapping tiles of readable aspect ratio.
+
+    Pages that fit the effective resolution are left whole; tiles are at
+    least as tall as the native-resolution chunk the model accepts unscaled.
+    """
+    if _scale(image.width, image.height) >= 1.0 or image.height <= image.width * MAX_TILE_ASPECT:
+        return [image]
+
+    tile_height = max(
+        int(image.width * MAX_TILE_ASPECT),
+        min(MAX_LONG_EDGE, MAX_PIXELS // image.width),
+        math.ceil(image.height / MAX_TILES),
+    )
+    if image.height <= tile_height:
+        return [image]
+
+    step = int(tile_height * (1 - TILE_OVERLAP))
+    tiles = []
+    for top in range(0, image.height, step):
+        bottom = min(top + tile_height, image.height)
+        tiles.append(image.crop((0, top, image.width, bottom)))
+        if bottom == image.height:
+            break
+    return tiles
+
+
+def _downscale(image: Any) -> Any:
+    """Resize an image to the model's effective resolution."""
+    scale = _scale(image.width, image.height)
+    if scale >= 1.0:
+        return image
+    size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+    return image.resize(size, Image.LANCZOS)
+
+
+def preprocess_image(
+    image_path: Union[str, Path],
+    crop: bool = True,
+    tile: bool = False,
+    image_format: str = "WEBP",
+    quality: int = 90,
+) -> Tuple[List[PreparedImage], Dict[str, Any]]:
+    """Prepare a screenshot for a Vision call.
+
+    Args:
+        image_path: Path to the screenshot
+        crop: Crop uniform borders around the content
+        tile: Split very tall pages into several images instead of shrinking
+            them (keeps small text legible at the cost of more image tokens)
+        image_format: Output format, "WEBP", "PNG" or "JPEG"
+        quality: Encoder quality for lossy formats
+
+    Returns:
+        Prepared images (one per tile) and a report with original and
+        processed bytes and estimated tokens
+
+    Raises:
+        ImagePreprocessingError: If Pillow is missing or the image cannot be processed
+    """
+    if not is_available():
+        raise ImagePreprocessingError("Image preprocessing requires Pillow (pip install Pillow)")
+
+    image_format = image_format.upper()
+    if image_format not in MEDIA_TYPES:
+        raise ImagePreprocessingError(f"Unsupported output format: {image_format}")
+
+    image_path = Path(image_path)
+    try:
+        original_bytes = image_path.stat().st_size
+        with Image.open(image_path) as opened:
+            original_size = opened.size
+            image = opened.convert("RGBA")
+    except OSError as e:
+        raise ImagePreprocessingError(f"Failed to open image {image_path}: {e}")
+
+    # Flatten transparency onto white
+    flattened = Image.new("RGB", image.size, (255, 255, 255))
+    flattened.paste(image, mask=image.getchannel("A"))
+    image = flattened
+
+    if crop:
+        image = _crop_to_content(image)
+
+    prepared = []
+    for part in _tiles(image) if tile else [image]:
+        part = _downscale(part)
+        buffer = io.BytesIO()
+        options: Dict[str, Any] = {"optimize": True}
+        if image_format != "PNG":
+            options["quality"] = quality
+        part.save(buffer, format=image_format, **options)
+        prepared.append(
+            PreparedImage(
+                data=buffer.getvalue(),
+                media_type=MEDIA_TYPES[image_format],
+                width=part.width,
+                height=part.height,
+            )
+        )
+
+    original_tokens = estimate_image_tokens(*original_size)
+    processed_tokens = sum(estimate_image_tokens(p.width, p.height) for p in prepared)
+    processed_bytes = sum(len(p.data) for p in prepared)
+
+    report = {
+        "image": str(image_path),
+        "original_size": list(original_size),
+        "processed_sizes": [[p.width, p.height] for p in prepared],
+        "tiles": len(prepared),
+        "original_bytes": original_bytes,
+        "processed_bytes": processed_bytes,
+        "bytes_saved": original_bytes - processed_bytes,
+        "original_tokens": original_tokens,
+        "processed_tokens": processed_tokens,
+        "tokens_saved": original_tokens - processed_tokens,
+    }
+
+    logger.info(
+        "Image preprocessed",
+        image=str(image_path),
+        tiles=len(prepared),
+        bytes_saved=report["bytes_saved"],
+        tokens_saved=report["tokens_saved"],
+    )
+    return prepared, report
+
+
+def benchmark_preprocessing(folder: Union[str, Path], **options: Any) -> Dict[str, Any]:
+    """Preprocess every screenshot in a folder and summarize the savings.
+
+    No API calls are made; token counts are estimates.
+
+    Args:
+        folder: Folder containing sample screenshots
+        **options: Options passed to ``preprocess_image``
+
+    Returns:
+        Per-image reports and totals
+    """
+    paths = sorted(
+        path for path in Path(folder).iterdir() if path.suffix.lower() in IMAGE_SUFFIXES
+    )
+
+    reports = []
+    started = time.perf_counter()
+    for path in paths:
+        image_started = time.perf_counter()
+        _, report = preprocess_image(path, **options)
+        report["elapsed_ms"] = round((time.perf_counter() - image_started) * 1000, 1)
+        reports.append(report)
+    elapsed = time.perf_counter() - started
+
+    totals = {
+        key: sum(report[key] for report in reports)
+        for key in ("original_bytes", "processed_bytes", "original_tokens", "processed_tokens")
+    }
+
+    return {
+        "images": len(reports),
+        "reports": reports,
+        "totals": totals,
+        "bytes_reduction_percentage": (
+            round((1 - totals["processed_bytes"] / totals["original_bytes"]) * 100, 2)
+            if totals["original_bytes"]
+            else 0.0
+        ),
+        "tokens_reduction_percentage": (
+            round((1 - totals["processed_tokens"] / totals["original_tokens"]) * 100, 2)
+            if totals["original_tokens"]
+            else 0.0
+        ),
+        "elapsed_seconds": round(elapsed, 3),
+    }
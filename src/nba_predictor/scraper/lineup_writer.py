@@ -0,0 +1,91 @@
+"""Shared writer for daily lineup scrapes.
+
+Every lineup source (RotoWire, Basketball Monster, screenshots) produces
+normalized lineup dictionaries. They are stored with one scoped delete and
+one bulk insert in a single transaction, so a scrape either fully replaces
+the previous rows or leaves them untouched. Player names are linked to the
+player registry on the way in; names without a confident match are stored
+unlinked.
+"""
+
+from datetime import date
+from typing import Any, Dict, List
+
+from sqlalchemy import insert
+
+from nba_predictor.core.logger import get_logger
+from nba_predictor.models import DailyLineup, get_db
+from nba_predictor.utils.players import get_player_registry
+
+logger = get_logger(__name__)
+
+LINEUP_COLUMNS = (
+    "scrape_date",
+    "game_date",
+    "team_name",
+    "player_name",
+    "position",
+    "status",
+    "injury_description",
+    "notes",
+)
+
+
+def replace_lineups(
+    scrape_date: date,
+    game_date: date,
+    entries: List[Dict[str, Any]],
+    replace_slate: bool = False,
+) -> int:
+    """Replace stored lineups with a new scrape in one transaction.
+
+    An empty scrape never deletes anything, so a page that failed to parse
+    keeps the previous lineups.
+
+    Args:
+        scrape_date: Date of the scrape
+        game_date: Date of the games
+        entries: Normalized lineup dictionaries (``LINEUP_COLUMNS``)
+        replace_slate: Replace every team's lineup for the date; by default
+            only the teams present in ``entries`` are replaced
+
+    Returns:
+        Number of lineup entries inserted
+    """
+    if not entries:
+        logger.warning("No lineups to save", scrape_date=scrape_date, game_date=game_date)
+        return 0
+
+    rows = [
+        {
+            **{column: entry.get(column) for column in LINEUP_COLUMNS},
+            "scrape_date": scrape_date,
+            "game_date": game_date,
+        }
+        for entry in entries
+    ]
+    teams = sorted({row["team_name"] for row in rows})
+
+    player_ids = get_player_registry().link([(row["player_name"], row["team_name"]) for row in rows])
+    for row, player_id in zip(rows, player_ids):
+        row["player_id"] = player_id
+
+    with get_db() as db:
+        query = db.query(DailyLineup).filter(
+            DailyLineup.scrape_date == scrape_date,
+            DailyLineup.game_date == game_date,
+        )
+        if not replace_slate:
+            query = query.filter(DailyLineup.team_name.in_(teams))
+        deleted = query.delete(synchronize_session=False)
+        db.execute(insert(DailyLineup), rows)
+
+    logger.info(
+        "Lineups replaced",
+        game_date=game_date,
+        deleted=deleted,
+        inserted=len(rows),
+        linked=sum(player_id is not None for player_id in player_ids),
+        teams=len(teams),
+    )
+    return len(rows)
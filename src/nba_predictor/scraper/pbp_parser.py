@@ -0,0 +1,295 @@
+"""Play-by-play event classification and per-quarter aggregates.
+
+Basketball Reference describes every play in free text ("L. James makes
+3-pt jump shot from 25 ft (assist by A. Davis)"). Each row is classified
+once, at import time, into typed columns (event type, player, shot value,
+made/missed), and the counts that used to be computed with ``LIKE '%makes%'``
+scans over the text (field goals, turnovers, rebounds per quarter) are stored
+per game, quarter and team in ``nba_pbp_quarter_stats``.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from nba_predictor.core.logger import get_logger
+from nba_predictor.models import PlayByPlay, PlayByPlayQuarter, get_db
+
+logger = get_logger(__name__)
+
+EVENT_FIELD_GOAL = "field_goal"
+EVENT_FREE_THROW = "free_throw"
+EVENT_REBOUND = "rebound"
+EVENT_TURNOVER = "turnover"
+EVENT_FOUL = "foul"
+EVENT_SUBSTITUTION = "substitution"
+EVENT_TIMEOUT = "timeout"
+EVENT_OTHER = "other"
+
+_FIELD_GOAL = re.compile(r"^(?P<player>.+?) (?P<result>makes|misses) (?P<value>[23])-pt ")
+_FREE_THROW = re.compile(
+    r"^(?P<player>.+?) (?P<result>makes|misses) (?:technical |flagrant |clear path )?free throw"
+)
+_REBOUND = re.compile(r"^(?P<kind>Offensive|Defensive) rebound by (?P<player>.+)$")
+_TURNOVER = re.compile(r"^Turnover by (?P<player>.+?)(?: \((?P<reason>[^;)]+)|$)")
+_FOUL = re.compile(r"^(?P<kind>.+?) (?:foul|tech foul)(?: type \d)? by (?P<player>.+?)(?: \(|$)")
+_SUBSTITUTION = re.compile(r"^(?P<player>.+?) enters the game for ")
+
+# Events without a player name ("Offensive rebound by Team")
+_TEAM = "Team"
+
+DETAIL_LENGTH = 30
+
+# Columns of nba_pbp_quarter_stats counted from classified plays
+QUARTER_COUNTS = (
+    "field_goals",
+    "field_goal_attempts",
+    "three_pointers",
+    "three_point_attempts",
+    "free_throws",
+    "free_throw_attempts",
+    "offensive_rebounds",
+    "defensive_rebounds",
+    "turnovers",
+    "fouls",
+)
+
+
+@dataclass(frozen=True)
+class PlayEvent:
+    """Typed description of one play."""
+
+    event_type: str
+    player_name: Optional[str] = None
+    # 1 for free throws, 2 or 3 for field goals
+    shot_value: Optional[int] = None
+    is_made: Optional[bool] = None
+    # Rebound kind, foul kind or turnover reason
+    detail: Optional[str] = None
+
+
+def _player(name: str) -> Optional[str]:
+    name = name.strip()
+    return None if name == _TEAM else name
+
+
+def _detail(text: Optional[str]) -> Optional[str]:
+    return text.strip().lower()[:DETAIL_LENGTH] if text else None
+
+
+def classify_play(comment: Optional[str]) -> PlayEvent:
+    """Classify the text of a play.
+
+    Args:
+        comment: Play description as printed by Basketball Reference
+
+    Returns:
+        Typed event (``EVENT_OTHER`` for plays that are not counted)
+    """
+    if not comment:
+        return PlayEvent(EVENT_OTHER)
+
+    match = _FIELD_GOAL.match(comment)
+    if match:
+        return PlayEvent(
+            EVENT_FIELD_GOAL,
+            _player(match["player"]),
+            int(match["value"]),
+            match["result"] == "makes",
+        )
+
+    match = _FREE_THROW.match(comment)
+    if match:
+        return PlayEvent(EVENT_FREE_THROW, _player(match["player"]), 1, match["result"] == "makes")
+
+    match = _REBOUND.match(comment)
+    if match:
+        return PlayEvent(EVENT_REBOUND, _player(match["player"]), detail=_detail(match["kind"]))
+
+    match = _TURNOVER.match(comment)
+    if match:
+        return PlayEvent(EVENT_TURNOVER, _player(match["player"]), detail=_detail(match["reason"]))
+
+    match = _FOUL.match(comment)
+    if match:
+        return PlayEvent(EVENT_FOUL, _player(match["player"]), detail=_detail(match["kind"]))
+
+    match = _SUBSTITUTION.match(comment)
+    if match:
+        return PlayEvent(EVENT_SUBSTITUTION, _player(match["player"]))
+
+    if "timeout" in comment.lower():
+        return PlayEvent(EVENT_TIMEOUT)
+
+    return PlayEvent(EVENT_OTHER)
+
+
+def classify_row(home_comment: Optional[str], away_comment: Optional[str]) -> Dict[str, Any]:
+    """Typed columns of a play-by-play row.
+
+    Each row describes one play, in the home or the away column.
+
+    Args:
+        home_comment: Home team play text
+        away_comment: Away team play text
+
+    Returns:
+        ``side``, ``event_type``, ``player_name``, ``shot_value``, ``is_made``
+        and ``detail`` values
+    """
+    side = "H" if home_comment else "A" if away_comment else None
+    event = classify_play(home_comment or away_comment)
+    return {
+        "side": side,
+        "event_type": event.event_type,
+        "player_name": event.player_name,
+        "shot_value": event.shot_value,
+        "is_made": event.is_made,
+        "detail": event.detail,
+    }
+
+
+def summarize_quarters(game_id: str, plays: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Count classified plays per quarter and team.
+
+    Args:
+        game_id: Game ID
+        plays: Classified rows with ``quarter`` and the ``classify_row`` columns
+
+    Returns:
+        One ``nba_pbp_quarter_stats`` row per quarter and side
+    """
+    totals: Dict[Tuple[int, str], Dict[str, int]] = {}
+
+    for play in plays:
+        side = play["side"]
+        if side is None or play["event_type"] == EVENT_OTHER:
+            continue
+
+        counts = totals.setdefault(
+            (int(play["quarter"]), side), dict.fromkeys(QUARTER_COUNTS, 0)
+        )
+        event_type = play["event_type"]
+
+        if event_type == EVENT_FIELD_GOAL:
+            counts["field_goal_attempts"] += 1
+            counts["field_goals"] += play["is_made"]
+            if play["shot_value"] == 3:
+                counts["three_point_attempts"] += 1
+                counts["three_pointers"] += play["is_made"]
+        elif event_type == EVENT_FREE_THROW:
+            counts["free_throw_attempts"] += 1
+            counts["free_throws"] += play["is_made"]
+        elif event_type == EVENT_REBOUND:
+            if play["detail"] == "offensive":
+                counts["offensive_rebounds"] += 1
+            else:
+                counts["defensive_rebounds"] += 1
+        elif event_type == EVENT_TURNOVER:
+            counts["turnovers"] += 1
+        elif event_type == EVENT_FOUL:
+            counts["fouls"] += 1
+
+    return [
+        {"game_id": game_id, "quarter": quarter, "side": side, **counts}
+        for (quarter, side), counts in sorted(totals.items())
+    ]
+
+
+def replace_game_plays(db: Session, game_id: str, plays: List[Dict[str, Any]]) -> int:
+    """Replace a game's play-by-play rows and quarter aggregates.
+
+    Args:
+        db: Database session (the caller owns the transaction)
+        game_id: Game ID
+        plays: Classified play rows (``classify_row`` columns included)
+
+    Returns:
+        Number of quarter aggregate rows written
+    """
+    quarters = summarize_quarters(game_id, plays)
+
+    db.query(PlayByPlay).filter(PlayByPlay.game_id == game_id).delete(synchronize_session=False)
+    db.query(PlayByPlayQuarter).filter(PlayByPlayQuarter.game_id == game_id).delete(
+        synchronize_session=False
+    )
+    if plays:
+        db.execute(insert(PlayByPlay), plays)
+    if quarters:
+        db.execute(insert(PlayByPlayQuarter), quarters)
+    return len(quarters)
+
+
+def classify_stored_plays(batch_size: int = 100) -> Dict[str, int]:
+    """Classify play-by-play rows stored before classification existed.
+
+    Rows are updated in place by primary key and the quarter aggregates of
+    their games are rebuilt, ``batch_size`` games per transaction.
+
+    Args:
+        batch_size: Games per transaction
+
+    Returns:
+        Number of games and plays classified
+    """
+    with get_db() as db:
+        game_ids = [
+            game_id
+            for (game_id,) in db.query(PlayByPlay.game_id)
+            .filter(PlayByPlay.event_type.is_(None))
+            .distinct()
+        ]
+
+    classified = {"games": 0, "plays": 0}
+    for start in range(0, len(game_ids), batch_size):
+        batch = game_ids[start : start + batch_size]
+        with get_db() as db:
+            rows = (
+                db.query(
+                    PlayByPlay.id,
+                    PlayByPlay.game_id,
+                    PlayByPlay.quarter,
+                    PlayByPlay.home_comment,
+                    PlayByPlay.away_comment,
+                )
+                .filter(PlayByPlay.game_id.in_(batch))
+                .all()
+            )
+
+            plays_by_game: Dict[str, List[Dict[str, Any]]] = {}
+            for play_id, game_id, quarter, home_comment, away_comment in rows:
+                plays_by_game.setdefault(game_id, []).append(
+                    {"id": play_id, "quarter": quarter, **classify_row(home_comment, away_comment)}
+                )
+
+            updates = [
+                {key: value for key, value in play.items() if key != "quarter"}
+                for plays in plays_by_game.values()
+                for play in plays
+            ]
+            if updates:
+                db.execute(update(PlayByPlay), updates)
+
+            db.query(PlayByPlayQuarter).filter(PlayByPlayQuarter.game_id.in_(batch)).delete(
+                synchronize_session=False
+            )
+            quarters = [
+                row
+                for game_id, plays in plays_by_game.items()
+                for row in summarize_quarters(game_id, plays)
+            ]
+            if quarters:
+                db.execute(insert(PlayByPlayQuarter), quarters)
+
+        classified["games"] += len(plays_by_game)
+        classified["plays"] += len(updates)
+        logger.info(
+            "Play-by-play classified",
+            **classified,
+            remaining=len(game_ids) - start - len(batch),
+        )
+
+    return classified
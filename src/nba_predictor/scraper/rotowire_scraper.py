@@ -7,11 +7,11 @@ from typing import Any, Dict, List, Optional
 
 import cloudscraper
 from bs4 import BeautifulSoup
-from sqlalchemy import and_
 
 from nba_predictor.core.config import get_settings
 from nba_predictor.core.logger import get_logger
-from nba_predictor.models import DailyLineup, get_db
+from nba_predictor.scraper.lineup_writer import replace_lineups
+from nba_predictor.utils.teams import get_team_registry
 
 logger = get_logger(__name__)
 
@@ -25,43 +25,16 @@ class RotoWireScraperError(Exception):
 class RotoWireScraper:
     """Scraper for RotoWire NBA lineups and injury reports."""
 
-    # Mapping of team abbreviations to full names
-    TEAM_ABBR_MAP = {
-        "ATL": "Atlanta Hawks",
-        "BOS": "Boston Celtics",
-        "BKN": "Brooklyn Nets",
-        "CHA": "Charlotte Hornets",
-        "CHI": "Chicago Bulls",
-        "CLE": "Cleveland Cavaliers",
-        "DAL": "Dallas Mavericks",
-        "DEN": "Denver Nuggets",
-        "DET": "Detroit Pistons",
-        "GSW": "Golden State Warriors",
-        "HOU": "Houston Rockets",
-        "IND": "Indiana Pacers",
-        "LAC": "Los Angeles Clippers",
-        "LAL": "Los Angeles Lakers",
-        "MEM": "Memphis Grizzlies",
-        "MIA": "Miami Heat",
-        "MIL": "Milwaukee Bucks",
-        "MIN": "Minnesota Timberwolves",
-        "NOP": "New Orleans Pelicans",
-        "NYK": "New York Knicks",
-        "OKC": "Oklahoma City Thunder",
-        "ORL": "Orlando Magic",
-        "PHI": "Philadelphia 76ers",
-        "PHX": "Phoenix Suns",
-        "POR": "Portland Trail Blazers",
-        "SAC": "Sacramento Kings",
-        "SAS": "San Antonio Spurs",
-        "TOR": "Toronto Raptors",
-        "UTA": "Utah Jazz",
-        "WAS": "Washington Wizards",
-    }
-
-    def __init__(self) -> None:
-        """Initialize the scraper with configuration."""
+    def __init__(self, diagnostics: bool = False) -> None:
+        """Initialize the scraper with configuration.
+
+        Args:
+            diagnostics: Save raw and prettified pages to /tmp and log selector
+                statistics on every import (slow, for debugging layout changes)
+        """
         self.settings = get_settings()
+        self.diagnostics = diagnostics
+        self.teams = get_team_registry()
         self.base_url = "https://www.rotowire.com"
         self.lineups_url = f"{self.base_url}/basketball/nba-lineups.php"
         self.session = self._create_session()
@@ -133,7 +106,6 @@ class RotoWireScraper:
                 status_code=response.status_code,
                 content_length=len(response.content),
                 encoding=response.encoding,
-                apparent_encoding=response.apparent_encoding
             )
 
             # Get text with proper encoding
@@ -145,6 +117,11 @@ class RotoWireScraper:
 
             # Save raw response for debugging if requested
             if save_debug:
+                logger.info(
+                    "DEBUG: Response encoding",
+                    encoding=response.encoding,
+                    apparent_encoding=response.apparent_encoding,
+                )
                 try:
                     with open("/tmp/rotowire_raw_response.html", "w", encoding="utf-8", errors="replace") as f:
                         f.write(html_text)
@@ -182,25 +159,49 @@ class RotoWireScraper:
 
         logger.info("Starting lineup import", target_date=target_date, scrape_date=scrape_date)
 
-        # Fetch lineups page (with debug enabled to save raw response)
-        lineups_page = self._get_page(self.lineups_url, save_debug=True)
-
-        # Delete existing lineups for this scrape date and game date combination
-        with get_db() as db:
-            deleted = (
-                db.query(DailyLineup)
-                .filter(
-                    and_(
-                        DailyLineup.scrape_date == scrape_date,
-                        DailyLineup.game_date == target_date,
-                    )
-                )
-                .delete(synchronize_session=False)
+        # Fetch lineups page (the raw response is saved in diagnostics mode)
+        lineups_page = self._get_page(self.lineups_url, save_debug=self.diagnostics)
+
+        entries: List[Dict[str, Any]] = []
+
+        if self.diagnostics:
+            self._log_diagnostics(lineups_page)
+
+        # Find all lineup boxes (game cards) in a single pass over the document
+        lineup_boxes = lineups_page.select("div.lineup.is-nba")
+        logger.info("Found lineup boxes", count=len(lineup_boxes))
+
+        for box in lineup_boxes:
+            try:
+                game_lineups = self._parse_lineup_box(box, scrape_date, target_date)
+                entries.extend(game_lineups)
+
+                logger.debug("Parsed lineup box", entries=len(game_lineups))
+
+            except Exception as e:
+                logger.error("Failed to parse lineup box", error=str(e), exc_info=True)
+                continue
+
+        # Replace the slate in one transaction
+        try:
+            lineups_imported = replace_lineups(
+                scrape_date, target_date, entries, replace_slate=True
             )
-            logger.info("Deleted existing lineups", count=deleted)
+        except Exception as e:
+            logger.error("Failed to save lineups", error=str(e), exc_info=True)
+            raise RotoWireScraperError(f"Failed to save lineups: {e}")
 
-        lineups_imported = 0
+        logger.info("Lineup import completed", lineups_imported=lineups_imported)
+        return lineups_imported
+
+    def _log_diagnostics(self, lineups_page: BeautifulSoup) -> None:
+        """Save the prettified page and log counts of alternative selectors.
 
+        Only used in diagnostics mode: every pattern is a full document scan.
+
+        Args:
+            lineups_page: Parsed lineups page
+        """
         # DEBUG: Save HTML to file for inspection
         try:
             debug_path = "/tmp/rotowire_debug.html"
@@ -256,34 +257,6 @@ class RotoWireScraper:
                     seen_classes.add(class_str)
                     logger.info("DEBUG: Found div with classes", classes=class_str)
 
-        # Find all lineup boxes (game cards)
-        # Try CSS selector first as it's most reliable
-        lineup_boxes = lineups_page.select("div.lineup.is-nba")
-        if not lineup_boxes:
-            # Fallback to find_all with lambda
-            lineup_boxes = lineups_page.find_all("div", class_=lambda x: x and isinstance(x, list) and "lineup" in x and "is-nba" in x)
-
-        logger.info("Found lineup boxes", count=len(lineup_boxes))
-
-        for box in lineup_boxes:
-            try:
-                game_lineups = self._parse_lineup_box(box, scrape_date, target_date)
-
-                for lineup_data in game_lineups:
-                    with get_db() as db:
-                        lineup = DailyLineup(**lineup_data)
-                        db.add(lineup)
-                        lineups_imported += 1
-
-                logger.debug("Parsed lineup box", entries=len(game_lineups))
-
-            except Exception as e:
-                logger.error("Failed to parse lineup box", error=str(e), exc_info=True)
-                continue
-
-        logger.info("Lineup import completed", lineups_imported=lineups_imported)
-        return lineups_imported
-
     def _parse_lineup_box(
         self, box: Any, scrape_date: date, game_date: date
     ) -> List[Dict[str, Any]]:
@@ -309,8 +282,8 @@ class RotoWireScraper:
         home_abbr = team_abbrs[1].text.strip()
 
         # Convert abbreviations to full team names
-        away_team = self.TEAM_ABBR_MAP.get(away_abbr, away_abbr)
-        home_team = self.TEAM_ABBR_MAP.get(home_abbr, home_abbr)
+        away_team = self.teams.resolve(away_abbr) or away_abbr
+        home_team = self.teams.resolve(home_abbr) or home_abbr
 
         logger.debug("Parsing lineup", away=away_team, home=home_team)
 
@@ -7,12 +7,14 @@ from typing import Any, Dict, List, Optional
 import cloudscraper  # <-- Trocar requests por cloudscraper
 from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
-from sqlalchemy import func
+from sqlalchemy import func, insert
 from urllib3.util.retry import Retry
 
 from nba_predictor.core.config import get_settings
 from nba_predictor.core.logger import get_logger
-from nba_predictor.models import Game, PlayByPlay, PlayerGameStats, get_db
+from nba_predictor.models import Game, PlayerGameStats, get_db
+from nba_predictor.scraper.pbp_parser import classify_row, replace_game_plays
+from nba_predictor.utils.players import get_player_registry
 
 logger = get_logger(__name__)
 
@@ -432,19 +434,12 @@ class BasketballReferenceScraper:
         """
         logger.info("Starting play-by-play import", date=game_date)
 
-        # Delete existing play-by-play data
+        # Each game's existing play-by-play is replaced when its new data is stored
         with get_db() as db:
             game_ids = (
                 db.query(Game.id2).filter(Game.date == game_date).filter(Game.id2.isnot(None)).all()
             )
 
-            for (game_id,) in game_ids:
-                db.query(PlayByPlay).filter(PlayByPlay.game_id == game_id).delete(
-                    synchronize_session=False
-                )
-
-            logger.info("Deleted existing play-by-play data", games=len(game_ids))
-
         games_processed = 0
 
         for (game_id,) in game_ids:
@@ -491,14 +486,6 @@ class BasketballReferenceScraper:
                 .all()
             )
 
-            # Delete existing play-by-play data for these games
-            for (game_id,) in game_ids:
-                db.query(PlayByPlay).filter(PlayByPlay.game_id == game_id).delete(
-                    synchronize_session=False
-                )
-
-            logger.info("Deleted existing play-by-play data for month", games=len(game_ids))
-
         games_processed = 0
 
         for (game_id,) in game_ids:
@@ -517,6 +504,10 @@ class BasketballReferenceScraper:
     def _import_game_play_by_play(self, game_id: str) -> None:
         """Import play-by-play data for a specific game.
 
+        Plays are classified while parsing and stored, together with the
+        game's per-quarter aggregates, in one transaction that replaces the
+        game's previous play-by-play.
+
         Args:
             game_id: Game ID
 
@@ -532,6 +523,7 @@ class BasketballReferenceScraper:
             return
 
         current_quarter = 1
+        plays = []
 
         for row in table.find_all("tr"):
             # Check for quarter markers
@@ -548,14 +540,17 @@ class BasketballReferenceScraper:
             try:
                 play_data = self._extract_play_data(columns, game_id, current_quarter)
                 if play_data:
-                    with get_db() as db:
-                        play = PlayByPlay(**play_data)
-                        db.add(play)
+                    plays.append(play_data)
 
             except Exception as e:
                 logger.debug("Failed to parse play", error=str(e))
                 continue
 
+        with get_db() as db:
+            quarters = replace_game_plays(db, game_id, plays)
+
+        logger.debug("Play-by-play stored", game_id=game_id, plays=len(plays), quarters=quarters)
+
     def _extract_play_data(
         self, columns: List[Any], game_id: str, quarter: int
     ) -> Optional[Dict[str, Any]]:
@@ -579,14 +574,19 @@ class BasketballReferenceScraper:
             seconds = int(time_parts[1])
             duration = 720 - (minutes * 60 + seconds)  # Convert to seconds elapsed
 
+            away_comment = columns[1].text.strip() if columns[1].text else None
+            home_comment = columns[5].text.strip() if columns[5].text else None
+
             return {
                 "game_id": game_id,
                 "quarter": str(quarter),
                 "duration": duration,
-                "away_comment": columns[1].text.strip() if columns[1].text else None,
+                "away_comment": away_comment,
                 "away_score": int(columns[2].text) if columns[2].text else None,
                 "home_score": int(columns[4].text) if columns[4].text else None,
-                "home_comment": columns[5].text.strip() if columns[5].text else None,
+                "home_comment": home_comment,
+                # Typed event columns, classified once here
+                **classify_row(home_comment, away_comment),
             }
 
         except (ValueError, IndexError):
@@ -608,21 +608,10 @@ class BasketballReferenceScraper:
         """
         logger.info("Starting player stats import", game_id=game_id)
 
-        # Delete existing player stats for this game
-        with get_db() as db:
-            deleted = (
-                db.query(PlayerGameStats)
-                .filter(PlayerGameStats.game_id == game_id)
-                .delete(synchronize_session=False)
-            )
-            logger.debug("Deleted existing player stats", count=deleted, game_id=game_id)
-
         # Fetch box score page
         box_score_url = f"{self.base_url}/boxscores/{game_id}.html"
         box_score_page = self._get_page(box_score_url)
 
-        stats_imported = 0
-
         # Get team names from the game
         with get_db() as db:
             game = db.query(Game).filter(Game.id2 == game_id).first()
@@ -645,28 +634,33 @@ class BasketballReferenceScraper:
             logger.warning("Could not find team abbreviations", game_id=game_id)
             return 0
 
-        # Process away team stats (first team)
-        away_stats = self._parse_player_stats_table(
+        # Away team stats (first team), then home team stats (second team)
+        stats = self._parse_player_stats_table(
             box_score_page, team_abbrevs[0], away_team, game_id, game_date, season
-        )
-        for stat in away_stats:
-            with get_db() as db:
-                player_stat = PlayerGameStats(**stat)
-                db.add(player_stat)
-                stats_imported += 1
-
-        # Process home team stats (second team)
-        home_stats = self._parse_player_stats_table(
+        ) + self._parse_player_stats_table(
             box_score_page, team_abbrevs[1], home_team, game_id, game_date, season
         )
-        for stat in home_stats:
-            with get_db() as db:
-                player_stat = PlayerGameStats(**stat)
-                db.add(player_stat)
-                stats_imported += 1
 
-        logger.info("Player stats import completed", game_id=game_id, stats_imported=stats_imported)
-        return stats_imported
+        # Link rows to the player registry (registering new players)
+        player_ids = get_player_registry().resolve(
+            [(stat["player_name"], stat["team_name"], stat.pop("bbref_id")) for stat in stats]
+        )
+        for stat, player_id in zip(stats, player_ids):
+            stat["player_id"] = player_id
+
+        # Replace the game's player stats in one transaction
+        with get_db() as db:
+            deleted = (
+                db.query(PlayerGameStats)
+                .filter(PlayerGameStats.game_id == game_id)
+                .delete(synchronize_session=False)
+            )
+            if stats:
+                db.execute(insert(PlayerGameStats), stats)
+            logger.debug("Deleted existing player stats", count=deleted, game_id=game_id)
+
+        logger.info("Player stats import completed", game_id=game_id, stats_imported=len(stats))
+        return len(stats)
 
     def _parse_player_stats_table(
         self,
@@ -760,6 +754,9 @@ class BasketballReferenceScraper:
             return None
 
         player_name = player_link.text.strip()
+        # Player pages are linked as /players/<letter>/<bbref id>.html
+        href = player_link.get("href") or ""
+        bbref_id = href.rsplit("/", 1)[-1].replace(".html", "") if "/players/" in href else None
 
         # Check if player did not play (DNP)
         mp_cell = cells[1]  # Minutes Played
@@ -772,6 +769,21 @@ class BasketballReferenceScraper:
                 text = cell.text.strip()
                 return int(text) if text and text.isdigit() else default
 
+            # Helper function to convert "MM:SS" playing time to seconds
+            def get_seconds(cell):
+                minutes, _, seconds = cell.text.strip().partition(":")
+                if not minutes.isdigit():
+                    return None
+                return int(minutes) * 60 + (int(seconds) if seconds.isdigit() else 0)
+
+            # Helper function to safely get signed cell text ("+7", "-3") as int
+            def get_signed_int(cell):
+                text = cell.text.strip()
+                try:
+                    return int(text) if text else None
+                except ValueError:
+                    return None
+
             # Helper function to safely get cell text as float
             def get_float(cell, default=None):
                 text = cell.text.strip()
@@ -787,8 +799,9 @@ class BasketballReferenceScraper:
                 "season": season,
                 "team_name": team_name,
                 "player_name": player_name,
+                "bbref_id": bbref_id,
                 "is_starter": is_starter,
-                "minutes_played": cells[1].text.strip() or None,
+                "seconds_played": get_seconds(cells[1]),
                 "field_goals": get_int(cells[2]),
                 "field_goal_attempts": get_int(cells[3]),
                 "field_goal_percentage": get_float(cells[4]),
@@ -807,7 +820,7 @@ class BasketballReferenceScraper:
                 "turnovers": get_int(cells[17]),
                 "personal_fouls": get_int(cells[18]),
                 "points": get_int(cells[19]),
-                "plus_minus": cells[20].text.strip() if len(cells) > 20 else None,
+                "plus_minus": get_signed_int(cells[20]) if len(cells) > 20 else None,
             }
         except (ValueError, IndexError) as e:
             logger.debug("Failed to extract player stat", error=str(e), player=player_name)
@@ -0,0 +1,53 @@
+"""Normalization of lineup and injury statuses across lineup sources.
+
+Basketball Monster prints codes ("Q", "D", "DTD"), RotoWire stores its raw
+injury tag ("Out", "Ques", "Doub", "Prob") and screenshots give words
+("Doubtful", "Game-Time Decision"). All of them are mapped to one spelling
+per status before statuses are compared.
+"""
+
+from typing import Optional
+
+STATUS_OUT = "OUT"
+STATUS_DOUBTFUL = "Doubtful"
+STATUS_QUESTIONABLE = "Questionable"
+STATUS_GTD = "GTD"
+STATUS_PROBABLE = "Probable"
+
+# Upper-cased source spellings -> normalized status
+_STATUS_MAP = {
+    "OUT": STATUS_OUT,
+    "O": STATUS_OUT,
+    "INJ": STATUS_OUT,
+    "OFS": STATUS_OUT,  # Out for season
+    "GTD": STATUS_GTD,
+    "DTD": STATUS_GTD,  # Day-to-day
+    "GAME-TIME DECISION": STATUS_GTD,
+    "GAME TIME DECISION": STATUS_GTD,
+    "Q": STATUS_QUESTIONABLE,
+    "QUES": STATUS_QUESTIONABLE,
+    "QUESTIONABLE": STATUS_QUESTIONABLE,
+    "D": STATUS_DOUBTFUL,
+    "DOUB": STATUS_DOUBTFUL,
+    "DOUBT": STATUS_DOUBTFUL,
+    "DOUBTFUL": STATUS_DOUBTFUL,
+    "P": STATUS_PROBABLE,
+    "PROB": STATUS_PROBABLE,
+    "PROBABLE": STATUS_PROBABLE,
+}
+
+
+def normalize_lineup_status(status: Optional[str]) -> Optional[str]:
+    """Normalize a lineup status as printed by any source.
+
+    Args:
+        status: Raw status ("Out", "Ques", "Q", "Doubtful", "Starter", ...)
+
+    Returns:
+        Normalized injury status (``STATUS_*``), or the stripped input for
+        statuses that are not injuries ("Starter", "Active")
+    """
+    if status is None:
+        return None
+    status = status.strip()
+    return _STATUS_MAP.get(status.upper(), status)
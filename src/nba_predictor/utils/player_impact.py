@@ -0,0 +1,308 @@
+"""Incremental player impact features from box scores.
+
+Each player's minutes, points, possessions used and plus/minus are kept as
+exponentially weighted averages, so recent games count most and every new
+box score row costs one constant-time update. The predictor turns the
+averages of injured players into the minutes and points a team is missing.
+"""
+
+import time
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+
+from nba_predictor.core.logger import get_logger
+from nba_predictor.models import PlayerGameStats, PlayerImpact, get_db, stream_query
+from nba_predictor.utils.injuries import (
+    STATUS_DOUBTFUL,
+    STATUS_GTD,
+    STATUS_OUT,
+    STATUS_PROBABLE,
+    STATUS_QUESTIONABLE,
+    normalize_lineup_status,
+)
+
+logger = get_logger(__name__)
+
+# Games after which a game's weight in the averages has halved
+HALF_LIFE_GAMES = 10
+DECAY = 0.5 ** (1 / HALF_LIFE_GAMES)
+
+FEATURES = ("minutes", "points", "possessions", "plus_minus")
+
+# Share of a player's production counted as lost, by normalized lineup status
+STATUS_WEIGHTS: Dict[str, float] = {
+    STATUS_OUT: 1.0,
+    STATUS_DOUBTFUL: 0.75,
+    STATUS_QUESTIONABLE: 0.5,
+    STATUS_GTD: 0.5,
+    STATUS_PROBABLE: 0.25,
+}
+
+
+class PlayerImpactEngine:
+    """In-memory weighted averages updated in constant time per game."""
+
+    def __init__(self, decay: float = DECAY) -> None:
+        """Initialize the engine.
+
+        Args:
+            decay: Weight kept by the previous average at each new game
+        """
+        self.decay = decay
+        self.players: Dict[int, Dict[str, Any]] = {}
+
+    def load(self, player_id: int, state: Dict[str, Any]) -> None:
+        """Resume from a stored player row."""
+        self.players[player_id] = state
+
+    def update(
+        self,
+        player_id: int,
+        team_name: str,
+        game_date: date,
+        values: Dict[str, float],
+    ) -> None:
+        """Apply one game of a player.
+
+        Args:
+            player_id: Player ID
+            team_name: Team the player played for
+            game_date: Date of the game
+            values: Game value of each feature in ``FEATURES``
+        """
+        state = self.players.get(player_id)
+        if state is None:
+            # First game: the average starts at the observed values
+            state = {"games": 0, **values}
+            self.players[player_id] = state
+        else:
+            for feature in FEATURES:
+                state[feature] = self.decay * state[feature] + (1 - self.decay) * values[feature]
+
+        state["games"] += 1
+        state["team_name"] = team_name
+        state["last_game_date"] = game_date
+
+
+class PlayerImpactCalculator:
+    """Maintain the player impact table and compute injury impact."""
+
+    def __init__(self) -> None:
+        """Initialize player impact calculator."""
+        logger.info("Player impact calculator initialized")
+
+    def rebuild(self) -> int:
+        """Recompute every player's averages from all linked box scores.
+
+        Returns:
+            Number of player rows written
+        """
+        logger.info("Rebuilding player impact")
+
+        with get_db() as db:
+            db.query(PlayerImpact).delete()
+            rows = self._apply_stats(db, PlayerImpactEngine())
+
+        logger.info("Player impact rebuilt", players=rows)
+        return rows
+
+    def update(self) -> int:
+        """Apply box scores imported since the latest update.
+
+        If box scores were imported out of order (on or before the latest
+        processed date), everything is rebuilt instead.
+
+        Returns:
+            Number of player rows written
+        """
+        with get_db() as db:
+            last_date = db.query(func.max(PlayerImpact.last_game_date)).scalar()
+
+            if last_date is not None:
+                processed = db.query(func.coalesce(func.sum(PlayerImpact.games), 0)).scalar()
+                available = (
+                    db.query(func.count(PlayerGameStats.id))
+                    .filter(
+                        PlayerGameStats.player_id.isnot(None),
+                        PlayerGameStats.game_date <= last_date,
+                    )
+                    .scalar()
+                )
+
+                if processed == available:
+                    engine = PlayerImpactEngine()
+                    for row in db.query(PlayerImpact).all():
+                        engine.load(
+                            row.player_id,
+                            {
+                                "games": row.games,
+                                "team_name": row.team_name,
+                                "last_game_date": row.last_game_date,
+                                **{feature: float(getattr(row, feature)) for feature in FEATURES},
+                            },
+                        )
+                    rows = self._apply_stats(db, engine, after_date=last_date)
+                    logger.info("Player impact updated", players=rows)
+                    return rows
+
+                logger.info(
+                    "Box scores imported before latest impact update, rebuilding",
+                    processed=processed,
+                    available=available,
+                )
+
+        return self.rebuild()
+
+    def get_impacts(self, player_ids: Iterable[int]) -> Dict[int, Dict[str, float]]:
+        """Current averages of players.
+
+        Args:
+            player_ids: Players to look up
+
+        Returns:
+            Feature averages keyed by player ID (players without box scores
+            are omitted)
+        """
+        player_ids = list(set(player_ids))
+        if not player_ids:
+            return {}
+
+        with get_db() as db:
+            rows = (
+                db.query(PlayerImpact)
+                .filter(PlayerImpact.player_id.in_(player_ids))
+                .all()
+            )
+            return {
+                row.player_id: {feature: float(getattr(row, feature)) for feature in FEATURES}
+                for row in rows
+            }
+
+    def injury_impact(
+        self, players: Sequence[Tuple[str, Optional[int], str]]
+    ) -> Dict[str, Dict[str, float]]:
+        """Minutes and points per game each team is missing.
+
+        Every unavailable player's averages are weighted by the likelihood
+        of missing the game (``STATUS_WEIGHTS``) and summed per team.
+        Statuses are normalized first, so "Out", "Ques" or "D" count too.
+
+        Args:
+            players: (team name, player ID, lineup status as stored) of listed players
+
+        Returns:
+            ``{"minutes_lost", "points_lost"}`` keyed by team name; teams
+            whose unavailable players have no box scores are omitted
+        """
+        weighted = []
+        for team_name, player_id, status in players:
+            weight = STATUS_WEIGHTS.get(normalize_lineup_status(status))
+            if player_id is not None and weight is not None:
+                weighted.append((team_name, player_id, weight))
+        impacts = self.get_impacts(player_id for _, player_id, _ in weighted)
+
+        lost: Dict[str, Dict[str, float]] = {}
+        for team_name, player_id, weight in weighted:
+            impact = impacts.get(player_id)
+            if impact is None:
+                continue
+            team = lost.setdefault(team_name, {"minutes_lost": 0.0, "points_lost": 0.0})
+            team["minutes_lost"] += weight * impact["minutes"]
+            team["points_lost"] += weight * impact["points"]
+
+        return {
+            team_name: {key: round(value, 1) for key, value in team.items()}
+            for team_name, team in lost.items()
+        }
+
+    def _apply_stats(
+        self,
+        db: Session,
+        engine: PlayerImpactEngine,
+        after_date: Optional[date] = None,
+    ) -> int:
+        """Run linked box score rows through the engine and store changed players.
+
+        Args:
+            db: Database session
+            engine: Engine holding the current averages
+            after_date: Only apply games after this date (optional)
+
+        Returns:
+            Number of player rows written
+        """
+        query = db.query(
+            PlayerGameStats.player_id,
+            PlayerGameStats.team_name,
+            PlayerGameStats.game_date,
+            PlayerGameStats.seconds_played,
+            PlayerGameStats.points,
+            PlayerGameStats.field_goal_attempts,
+            PlayerGameStats.free_throw_attempts,
+            PlayerGameStats.turnovers,
+            PlayerGameStats.plus_minus,
+        ).filter(PlayerGameStats.player_id.isnot(None))
+        if after_date is not None:
+            query = query.filter(PlayerGameStats.game_date > after_date)
+        query = query.order_by(PlayerGameStats.game_date, PlayerGameStats.id)
+
+        started = time.perf_counter()
+        changed = set()
+        box_scores = 0
+        for (
+            player_id,
+            team_name,
+            game_date,
+            seconds_played,
+            points,
+            field_goal_attempts,
+            free_throw_attempts,
+            turnovers,
+            plus_minus,
+        ) in stream_query(query):
+            engine.update(
+                player_id,
+                team_name,
+                game_date,
+                {
+                    "minutes": (seconds_played or 0) / 60,
+                    "points": float(points or 0),
+                    "possessions": (field_goal_attempts or 0)
+                    + 0.44 * (free_throw_attempts or 0)
+                    + (turnovers or 0),
+                    "plus_minus": float(plus_minus or 0),
+                },
+            )
+            changed.add(player_id)
+            box_scores += 1
+
+        logger.debug(
+            "Player impact computed",
+            box_scores=box_scores,
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+
+        if not changed:
+            return 0
+
+        rows: List[Dict[str, Any]] = []
+        for player_id in changed:
+            state = engine.players[player_id]
+            rows.append(
+                {
+                    "player_id": player_id,
+                    "team_name": state["team_name"],
+                    "last_game_date": state["last_game_date"],
+                    "games": state["games"],
+                    **{feature: round(state[feature], 2) for feature in FEATURES},
+                }
+            )
+
+        db.query(PlayerImpact).filter(PlayerImpact.player_id.in_(list(changed))).delete(
+            synchronize_session=False
+        )
+        db.execute(insert(PlayerImpact), rows)
+        return len(rows)
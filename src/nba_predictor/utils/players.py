@@ -0,0 +1,416 @@
+"""Player identity index: links free-text player names to ``nba_player`` rows.
+
+Lineup sources and box scores spell players differently ("Luka Dončić" vs
+"Luka Doncic", "Jaren Jackson Jr." vs "Jaren Jackson", "L. James" vs
+"LeBron James"). Names are reduced to a normalized key (accents folded,
+punctuation and generational suffixes removed) and matched in three steps,
+each a dictionary lookup:
+
+1. exact key,
+2. first initial plus last name (for abbreviated first names),
+3. fuzzy: candidates sharing character trigrams with the name, ranked by
+   edit similarity; only a clear winner above a threshold is accepted.
+
+The team a player was last seen with breaks ties between equal names.
+Box scores, which carry Basketball Reference IDs, are never fuzzy matched.
+"""
+
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import insert, update
+
+from nba_predictor.core.logger import get_logger
+from nba_predictor.models import DailyLineup, Player, PlayerGameStats, get_db
+
+logger = get_logger(__name__)
+
+NAME_SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv", "v"})
+
+# Minimum edit similarity of a fuzzy match, and its required lead over the runner-up
+MIN_SIMILARITY = 0.85
+MIN_MARGIN = 0.05
+# Fuzzy candidates scored with the (slower) edit similarity
+MAX_CANDIDATES = 10
+
+
+def normalize_player_name(name: str) -> str:
+    """Reduce a player name to its matching key.
+
+    Args:
+        name: Player name as printed by any source
+
+    Returns:
+        Lowercase ASCII key without punctuation or generational suffix,
+        e.g. "Jaren Jackson Jr." -> "jaren jackson"
+    """
+    folded = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    cleaned = "".join(
+        char if char.isalnum() else " " for char in folded.lower().replace(".", "").replace("'", "")
+    )
+    tokens = cleaned.split()
+    while len(tokens) > 2 and tokens[-1] in NAME_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def _trigrams(key: str) -> Set[str]:
+    """Character trigrams of a key, padded so word boundaries count."""
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerIndex:
+    """In-memory lookup structures over known players."""
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._keys: Dict[int, str] = {}
+        self._teams: Dict[int, Optional[str]] = {}
+        self._bbrefs: Dict[int, Optional[str]] = {}
+        self._by_key: Dict[str, List[int]] = defaultdict(list)
+        self._by_bbref: Dict[str, int] = {}
+        self._by_last_name: Dict[str, List[int]] = defaultdict(list)
+        self._by_trigram: Dict[str, Set[int]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(
+        self,
+        player_id: int,
+        name: str,
+        team_name: Optional[str] = None,
+        bbref_id: Optional[str] = None,
+    ) -> None:
+        """Add a player to the index.
+
+        Args:
+            player_id: ``nba_player`` ID
+            name: Player name
+            team_name: Team the player was last seen with
+            bbref_id: Basketball Reference player ID
+        """
+        key = normalize_player_name(name)
+        self._keys[player_id] = key
+        self._teams[player_id] = team_name
+        self._bbrefs[player_id] = bbref_id
+        self._by_key[key].append(player_id)
+        if bbref_id:
+            self._by_bbref[bbref_id] = player_id
+        if key:
+            self._by_last_name[key.split()[-1]].append(player_id)
+        for gram in _trigrams(key):
+            self._by_trigram[gram].add(player_id)
+
+    def set_team(self, player_id: int, team_name: str) -> None:
+        """Record the team a player was last seen with."""
+        self._teams[player_id] = team_name
+
+    def set_bbref(self, player_id: int, bbref_id: str) -> None:
+        """Record the Basketball Reference ID of a player."""
+        self._bbrefs[player_id] = bbref_id
+        self._by_bbref[bbref_id] = player_id
+
+    def by_bbref(self, bbref_id: str) -> Optional[int]:
+        """Player with a Basketball Reference ID."""
+        return self._by_bbref.get(bbref_id)
+
+    def has_bbref(self, player_id: int) -> bool:
+        """Whether a player already has a Basketball Reference ID."""
+        return self._bbrefs.get(player_id) is not None
+
+    def _prefer_team(self, player_ids: Sequence[int], team_name: Optional[str]) -> Optional[int]:
+        """The only candidate, or the only one on ``team_name``."""
+        if len(player_ids) == 1:
+            return player_ids[0]
+        on_team = [pid for pid in player_ids if team_name and self._teams.get(pid) == team_name]
+        return on_team[0] if len(on_team) == 1 else None
+
+    def candidates(self, key: str, limit: int = MAX_CANDIDATES) -> List[Tuple[int, float]]:
+        """Fuzzy candidates for a key, best first.
+
+        Args:
+            key: Normalized name
+            limit: Number of candidates scored by edit similarity
+
+        Returns:
+            (player ID, similarity) pairs
+        """
+        shared: Counter = Counter()
+        for gram in _trigrams(key):
+            shared.update(self._by_trigram.get(gram, ()))
+
+        scored = [
+            (pid, SequenceMatcher(None, key, self._keys[pid]).ratio())
+            for pid, _ in shared.most_common(limit)
+        ]
+        return sorted(scored, key=lambda item: item[1], reverse=True)
+
+    def exact_matches(self, name: str) -> List[int]:
+        """Players whose name matches exactly or by first initial.
+
+        Args:
+            name: Player name as printed by any source
+
+        Returns:
+            Player IDs with the same normalized name or, when there are none
+            and the first name is abbreviated ("L. James"), the same initial
+            and last name
+        """
+        key = normalize_player_name(name)
+        if not key:
+            return []
+
+        # 1. Exact normalized name
+        exact = self._by_key.get(key)
+        if exact:
+            return list(exact)
+
+        # 2. Abbreviated first name ("L. James")
+        tokens = key.split()
+        if len(tokens) >= 2 and len(tokens[0]) == 1:
+            rest = " ".join(tokens[1:])
+            return [
+                pid
+                for pid in self._by_last_name.get(tokens[-1], ())
+                if self._keys[pid].startswith(tokens[0])
+                and self._keys[pid].split(" ", 1)[-1] == rest
+            ]
+        return []
+
+    def match(self, name: str, team_name: Optional[str] = None) -> Optional[int]:
+        """Find the player a name refers to.
+
+        Args:
+            name: Player name as printed by any source
+            team_name: Team the name was listed for (breaks ties)
+
+        Returns:
+            Player ID, or None without a confident match
+        """
+        key = normalize_player_name(name)
+        if not key:
+            return None
+
+        # 1.-2. Exact name or initial plus last name
+        exact = self.exact_matches(name)
+        if exact:
+            return self._prefer_team(exact, team_name)
+
+        # 3. Fuzzy match with a clear winner
+        candidates = self.candidates(key)
+        if team_name:
+            candidates = sorted(
+                (
+                    (pid, score + (MIN_MARGIN if self._teams.get(pid) == team_name else 0.0))
+                    for pid, score in candidates
+                ),
+                key=lambda item: item[1],
+                reverse=True,
+            )
+        if not candidates or candidates[0][1] < MIN_SIMILARITY:
+            return None
+        if len(candidates) > 1 and candidates[0][1] - candidates[1][1] < MIN_MARGIN:
+            return None
+        return candidates[0][0]
+
+
+class PlayerRegistry:
+    """``nba_player`` table with an in-memory index, loaded on first use."""
+
+    def __init__(self) -> None:
+        """Initialize the registry (the index is loaded lazily)."""
+        self._index: Optional[PlayerIndex] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> PlayerIndex:
+        """Build the index from the player table."""
+        index = PlayerIndex()
+        with get_db() as db:
+            rows = db.query(Player.id, Player.name, Player.team_name, Player.bbref_id).all()
+        for player_id, name, team_name, bbref_id in rows:
+            index.add(player_id, name, team_name, bbref_id)
+        logger.info("Player index loaded", players=len(index))
+        return index
+
+    @property
+    def index(self) -> PlayerIndex:
+        """The in-memory index."""
+        with self._lock:
+            if self._index is None:
+                self._index = self._load()
+            return self._index
+
+    def reload(self) -> None:
+        """Drop the in-memory index; it is rebuilt on next use."""
+        with self._lock:
+            self._index = None
+
+    def link(self, players: Sequence[Tuple[str, Optional[str]]]) -> List[Optional[int]]:
+        """Link names to known players without creating new ones.
+
+        Used for lineup sources, whose spellings are less reliable than box
+        scores; unmatched names stay unlinked.
+
+        Args:
+            players: (player name, team name) pairs
+
+        Returns:
+            Player ID (or None) per pair
+        """
+        index = self.index
+        return [index.match(name, team_name) for name, team_name in players]
+
+    def resolve(
+        self, players: Sequence[Tuple[str, Optional[str], Optional[str]]]
+    ) -> List[int]:
+        """Resolve box-score players, registering unknown ones.
+
+        Players are matched by Basketball Reference ID first. A row whose ID
+        is not registered yet is attached only to an exact (or initial plus
+        last name) match that has no ID of its own, and the ID is written
+        back to that player; otherwise a new player is created. Box scores
+        are never fuzzy matched, so distinct players with similar names stay
+        apart. New players, team changes and attached IDs are written in one
+        transaction, and the index is updated in place.
+
+        Args:
+            players: (player name, team name, Basketball Reference ID) triples
+
+        Returns:
+            Player ID per triple
+        """
+        index = self.index
+        ids: List[Optional[int]] = []
+        new_players: Dict[Any, Dict[str, Any]] = {}
+        team_updates: Dict[int, str] = {}
+        bbref_updates: Dict[int, str] = {}
+
+        with self._lock:
+            for name, team_name, bbref_id in players:
+                player_id = index.by_bbref(bbref_id) if bbref_id else None
+                if player_id is None and bbref_id in bbref_updates.values():
+                    player_id = next(
+                        pid for pid, claimed in bbref_updates.items() if claimed == bbref_id
+                    )
+                if player_id is None:
+                    candidates = [
+                        pid
+                        for pid in index.exact_matches(name)
+                        if not bbref_id
+                        or (not index.has_bbref(pid) and pid not in bbref_updates)
+                    ]
+                    player_id = index._prefer_team(candidates, team_name) if candidates else None
+                    if player_id is not None and bbref_id:
+                        bbref_updates[player_id] = bbref_id
+                if player_id is None:
+                    new_players.setdefault(
+                        bbref_id or (normalize_player_name(name), team_name),
+                        {
+                            "name": name,
+                            "name_key": normalize_player_name(name),
+                            "bbref_id": bbref_id,
+                            "team_name": team_name,
+                        },
+                    )
+                elif team_name and index._teams.get(player_id) != team_name:
+                    team_updates[player_id] = team_name
+                ids.append(player_id)
+
+            if new_players or team_updates or bbref_updates:
+                with get_db() as db:
+                    if team_updates:
+                        db.execute(
+                            update(Player),
+                            [{"id": pid, "team_name": team} for pid, team in team_updates.items()],
+                        )
+                    if bbref_updates:
+                        db.execute(
+                            update(Player),
+                            [{"id": pid, "bbref_id": bbref} for pid, bbref in bbref_updates.items()],
+                        )
+                    for row in new_players.values():
+                        row["id"] = db.execute(insert(Player).values(**row)).inserted_primary_key[0]
+
+                for player_id, team_name in team_updates.items():
+                    index.set_team(player_id, team_name)
+                for player_id, bbref_id in bbref_updates.items():
+                    index.set_bbref(player_id, bbref_id)
+                for row in new_players.values():
+                    index.add(row["id"], row["name"], row["team_name"], row["bbref_id"])
+                logger.info(
+                    "Players registered",
+                    new=len(new_players),
+                    team_changes=len(team_updates),
+                    ids_attached=len(bbref_updates),
+                )
+
+        resolved = []
+        for (name, team_name, bbref_id), player_id in zip(players, ids):
+            if player_id is None:
+                row = new_players[bbref_id or (normalize_player_name(name), team_name)]
+                player_id = row["id"]
+            resolved.append(player_id)
+        return resolved
+
+    def link_existing(self) -> Dict[str, int]:
+        """Link stored lineup and box-score rows that have no player yet.
+
+        Box-score names are resolved first (registering players), then
+        lineup names are linked against the registry. Each distinct
+        (name, team) pair is matched once, and all its rows are updated with
+        one statement.
+
+        Returns:
+            Rows linked per table
+        """
+        linked = {"player_game_stats": 0, "daily_lineup": 0}
+
+        for table, model, create in (
+            ("player_game_stats", PlayerGameStats, True),
+            ("daily_lineup", DailyLineup, False),
+        ):
+            with get_db() as db:
+                pairs = (
+                    db.query(model.player_name, model.team_name)
+                    .filter(model.player_id.is_(None))
+                    .distinct()
+                    .all()
+                )
+            if not pairs:
+                continue
+
+            if create:
+                ids: List[Optional[int]] = list(
+                    self.resolve([(name, team, None) for name, team in pairs])
+                )
+            else:
+                ids = self.link(pairs)
+
+            with get_db() as db:
+                for (name, team), player_id in zip(pairs, ids):
+                    if player_id is None:
+                        continue
+                    linked[table] += (
+                        db.query(model)
+                        .filter(
+                            model.player_id.is_(None),
+                            model.player_name == name,
+                            model.team_name == team,
+                        )
+                        .update({model.player_id: player_id}, synchronize_session=False)
+                    )
+
+        logger.info("Existing rows linked to players", **linked)
+        return linked
+
+
+@lru_cache
+def get_player_registry() -> PlayerRegistry:
+    """Get the shared player registry."""
+    return PlayerRegistry()
@@ -0,0 +1,315 @@
+"""Incremental Elo team ratings."""
+
+import time
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, func, insert
+from sqlalchemy.orm import Session
+
+from nba_predictor.core.logger import get_logger
+from nba_predictor.models import Game, TeamRating, get_db
+
+logger = get_logger(__name__)
+
+INITIAL_RATING = 1500.0
+K_FACTOR = 20.0
+HOME_ADVANTAGE = 100.0
+# Share of last season's rating kept at the start of a new season
+SEASON_CARRY_OVER = 0.75
+
+
+def expected_home_win(
+    home_rating: float, away_rating: float, home_advantage: float = HOME_ADVANTAGE
+) -> float:
+    """Probability that the home team wins under the Elo model.
+
+    Args:
+        home_rating: Home team rating
+        away_rating: Away team rating
+        home_advantage: Rating points credited to the home team
+
+    Returns:
+        Home-win probability (0-1)
+    """
+    return 1.0 / (1.0 + 10 ** (-(home_rating + home_advantage - away_rating) / 400.0))
+
+
+class EloRatingEngine:
+    """In-memory Elo ratings updated in constant time per game.
+
+    The update follows the usual NBA Elo formulation: a fixed K factor, a
+    home-court bonus and a margin-of-victory multiplier that grows with the
+    margin but shrinks when the favorite wins, which limits autocorrelation.
+    """
+
+    def __init__(
+        self,
+        ratings: Optional[Dict[str, float]] = None,
+        games: Optional[Dict[str, int]] = None,
+        k_factor: float = K_FACTOR,
+        home_advantage: float = HOME_ADVANTAGE,
+    ) -> None:
+        """Initialize rating engine.
+
+        Args:
+            ratings: Starting ratings keyed by team name (others start at 1500)
+            games: Games already played this season keyed by team name
+            k_factor: Maximum rating change of an even game
+            home_advantage: Rating points credited to the home team
+        """
+        self.ratings: Dict[str, float] = dict(ratings or {})
+        self.games: Dict[str, int] = dict(games or {})
+        self.k_factor = k_factor
+        self.home_advantage = home_advantage
+
+    def rating(self, team_name: str) -> float:
+        """Current rating of a team."""
+        return self.ratings.get(team_name, INITIAL_RATING)
+
+    def home_win_probability(self, home_team: str, away_team: str) -> float:
+        """Probability that the home team wins a game between two teams."""
+        return expected_home_win(
+            self.rating(home_team), self.rating(away_team), self.home_advantage
+        )
+
+    def update(self, home_team: str, away_team: str, home_points: int, away_points: int) -> float:
+        """Apply one game result.
+
+        Args:
+            home_team: Home team name
+            away_team: Away team name
+            home_points: Final home score
+            away_points: Final away score
+
+        Returns:
+            Rating points gained by the home team (lost by the away team)
+        """
+        home_rating = self.rating(home_team)
+        away_rating = self.rating(away_team)
+
+        expected = expected_home_win(home_rating, away_rating, self.home_advantage)
+        home_won = home_points > away_points
+        margin = abs(home_points - away_points)
+
+        # Elo difference from the winner's point of view, home edge included
+        winner_diff = home_rating + self.home_advantage - away_rating
+        if not home_won:
+            winner_diff = -winner_diff
+        multiplier = (margin + 3) ** 0.8 / (7.5 + 0.006 * winner_diff)
+
+        change = self.k_factor * multiplier * ((1.0 if home_won else 0.0) - expected)
+
+        self.ratings[home_team] = home_rating + change
+        self.ratings[away_team] = away_rating - change
+        self.games[home_team] = self.games.get(home_team, 0) + 1
+        self.games[away_team] = self.games.get(away_team, 0) + 1
+        return change
+
+
+class RatingCalculator:
+    """Maintain Elo rating snapshots in the database."""
+
+    def __init__(self) -> None:
+        """Initialize rating calculator."""
+        logger.info("Rating calculator initialized")
+
+    def replay_season(self, season: str) -> int:
+        """Rebuild all rating snapshots of a season from game results.
+
+        Ratings start from the previous season's final ratings (regressed
+        toward the mean) when they are available.
+
+        Args:
+            season: NBA season year
+
+        Returns:
+            Number of rating snapshots written
+        """
+        logger.info("Replaying season ratings", season=season)
+
+        with get_db() as db:
+            deleted = db.query(TeamRating).filter(TeamRating.season == season).delete()
+            logger.info("Deleted existing ratings", count=deleted)
+
+            engine = EloRatingEngine(ratings=self._season_start_ratings(db, season))
+            rows = self._apply_games(db, engine, season)
+
+        logger.info("Season ratings replayed", season=season, snapshots=rows)
+        return rows
+
+    def update_ratings(self, season: str) -> int:
+        """Apply games imported since the latest snapshot.
+
+        Each new game costs one constant-time rating update. If games were
+        imported out of order (before the latest snapshot), the season is
+        replayed instead.
+
+        Args:
+            season: NBA season year
+
+        Returns:
+            Number of rating snapshots written
+        """
+        with get_db() as db:
+            last_date = (
+                db.query(func.max(TeamRating.date)).filter(TeamRating.season == season).scalar()
+            )
+
+            if last_date is not None:
+                current = self._latest_snapshots(db, season=season)
+                rated_games = sum(games for _, games in current.values()) // 2
+                played_games = (
+                    db.query(func.count(Game.id))
+                    .filter(
+                        Game.season == season,
+                        Game.home_point.isnot(None),
+                        Game.away_point.isnot(None),
+                        Game.date <= last_date,
+                    )
+                    .scalar()
+                )
+
+                if rated_games == played_games:
+                    ratings = self._season_start_ratings(db, season)
+                    ratings.update({team: elo for team, (elo, _) in current.items()})
+                    engine = EloRatingEngine(
+                        ratings=ratings,
+                        games={team: games for team, (_, games) in current.items()},
+                    )
+                    rows = self._apply_games(db, engine, season, after_date=last_date)
+                    logger.info("Ratings updated", season=season, snapshots=rows)
+                    return rows
+
+                logger.info(
+                    "Games imported before latest rating snapshot, replaying season",
+                    rated_games=rated_games,
+                    played_games=played_games,
+                )
+
+        return self.replay_season(season)
+
+    def get_ratings(
+        self, team_names: Iterable[str], before_date: date
+    ) -> Dict[str, float]:
+        """Latest rating of each team before a date.
+
+        Args:
+            team_names: Teams to look up
+            before_date: Only snapshots strictly before this date are used
+
+        Returns:
+            Ratings keyed by team name (teams without snapshots are omitted)
+        """
+        with get_db() as db:
+            latest = self._latest_snapshots(db, before_date=before_date, team_names=team_names)
+
+        return {team_name: elo for team_name, (elo, _) in latest.items()}
+
+    def _apply_games(
+        self,
+        db: Session,
+        engine: EloRatingEngine,
+        season: str,
+        after_date: Optional[date] = None,
+    ) -> int:
+        """Run completed games through the engine and bulk insert snapshots.
+
+        Args:
+            db: Database session
+            engine: Rating engine holding the starting ratings
+            season: NBA season year
+            after_date: Only apply games after this date (optional)
+
+        Returns:
+            Number of rating snapshots written
+        """
+        query = db.query(
+            Game.date, Game.home_name, Game.away_name, Game.home_point, Game.away_point
+        ).filter(
+            Game.season == season,
+            Game.home_point.isnot(None),
+            Game.away_point.isnot(None),
+        )
+        if after_date is not None:
+            query = query.filter(Game.date > after_date)
+        games = query.order_by(Game.date, Game.id).all()
+
+        started = time.perf_counter()
+        snapshots: List[Dict[str, Any]] = []
+        played: Dict[str, date] = {}
+
+        def flush_date() -> None:
+            for team_name, game_date in played.items():
+                snapshots.append(
+                    {
+                        "team_name": team_name,
+                        "date": game_date,
+                        "season": season,
+                        "elo": round(engine.rating(team_name), 2),
+                        "games": engine.games[team_name],
+                    }
+                )
+            played.clear()
+
+        current_date = None
+        for game_date, home_team, away_team, home_point, away_point in games:
+            if game_date != current_date:
+                flush_date()
+                current_date = game_date
+            engine.update(home_team, away_team, home_point, away_point)
+            played[home_team] = game_date
+            played[away_team] = game_date
+        flush_date()
+
+        logger.debug(
+            "Ratings computed",
+            games=len(games),
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+
+        if snapshots:
+            db.execute(insert(TeamRating), snapshots)
+
+        return len(snapshots)
+
+    def _latest_snapshots(
+        self,
+        db: Session,
+        season: Optional[str] = None,
+        before_date: Optional[date] = None,
+        team_names: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Tuple[float, int]]:
+        """Latest (rating, games played) of each team matching the filters."""
+        latest = db.query(TeamRating.team_name, func.max(TeamRating.date).label("date"))
+        if season is not None:
+            latest = latest.filter(TeamRating.season == season)
+        if before_date is not None:
+            latest = latest.filter(TeamRating.date < before_date)
+        if team_names is not None:
+            latest = latest.filter(TeamRating.team_name.in_(list(team_names)))
+        latest = latest.group_by(TeamRating.team_name).subquery()
+
+        rows = (
+            db.query(TeamRating.team_name, TeamRating.elo, TeamRating.games)
+            .join(
+                latest,
+                and_(
+                    TeamRating.team_name == latest.c.team_name,
+                    TeamRating.date == latest.c.date,
+                ),
+            )
+            .all()
+        )
+        return {team_name: (float(elo), games) for team_name, elo, games in rows}
+
+    def _season_start_ratings(self, db: Session, season: str) -> Dict[str, float]:
+        """Previous season's final ratings regressed toward the mean."""
+        if not season.isdigit():
+            return {}
+
+        previous = self._latest_snapshots(db, season=str(int(season) - 1))
+        return {
+            team_name: SEASON_CARRY_OVER * elo + (1 - SEASON_CARRY_OVER) * INITIAL_RATING
+            for team_name, (elo, _) in previous.items()
+        }
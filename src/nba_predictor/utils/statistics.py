@@ -2,13 +2,14 @@
 
 from datetime import date, timedelta
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, func, or_, update
 from sqlalchemy.orm import Session
 
 from nba_predictor.core.logger import get_logger
-from nba_predictor.models import Game, TeamHistory, get_db
+from nba_predictor.models import Game, TeamHistory, get_db, stream_query
+from nba_predictor.models.database import STREAM_CHUNK_SIZE
 
 logger = get_logger(__name__)
 
@@ -68,18 +69,21 @@ class StatisticsCalculator:
             logger.info("Team statistics generated", records=records_created, dates=len(game_dates), teams=len(teams))
             return records_created
 
-    def _get_team_games(self, db: Session, team_name: str, season: str) -> List[Game]:
-        """Get all games for a team in a season.
+    def _get_team_games(self, db: Session, team_name: str, season: str) -> Iterator[Game]:
+        """Stream all games of a team in a season, in date order.
+
+        Games come from a server-side cursor; the session cannot run other
+        queries until the iteration is finished.
 
         Args:
             db: Database session
             team_name: Team name
             season: Season year
 
-        Returns:
-            List of games
+        Yields:
+            Games
         """
-        return (
+        return stream_query(
             db.query(Game)
             .filter(
                 or_(Game.home_name == team_name, Game.away_name == team_name),
@@ -87,7 +91,6 @@ class StatisticsCalculator:
                 Game.home_point.isnot(None),
             )
             .order_by(Game.date)
-            .all()
         )
 
     def _create_team_history_record(
@@ -346,6 +349,10 @@ class StatisticsCalculator:
     def calculate_streaks(self, season: str) -> int:
         """Calculate win/loss streaks for teams.
 
+        The season's history rows are streamed in one pass, ordered by team
+        and date, and the streaks are written with bulk updates by primary
+        key once the stream is consumed.
+
         Args:
             season: NBA season year
 
@@ -355,34 +362,27 @@ class StatisticsCalculator:
         logger.info("Calculating streaks", season=season)
 
         with get_db() as db:
-            teams = db.query(TeamHistory.team_name).distinct().filter(TeamHistory.season == season).all()
-
-            records_updated = 0
-
-            for (team_name,) in teams:
-                history_records = (
-                    db.query(TeamHistory)
-                    .filter(TeamHistory.team_name == team_name, TeamHistory.season == season)
-                    .order_by(TeamHistory.date)
-                    .all()
-                )
+            query = (
+                db.query(TeamHistory.id, TeamHistory.team_name, TeamHistory.game, TeamHistory.win)
+                .filter(TeamHistory.season == season)
+                .order_by(TeamHistory.team_name, TeamHistory.date)
+            )
 
-                win_streak = 0
-                loss_streak = 0
-                prev_wins = 0
-                prev_games = 0
+            updates = []
+            current_team = None
 
-                for record in history_records:
-                    # Skip if team didn't play on this date
-                    if record.game == prev_games:
-                        # Team didn't play, keep current streaks
-                        record.win_streak = win_streak
-                        record.loss_streak = loss_streak
-                        records_updated += 1
-                        continue
+            for record_id, team_name, games, wins in stream_query(query):
+                if team_name != current_team:
+                    current_team = team_name
+                    win_streak = 0
+                    loss_streak = 0
+                    prev_wins = 0
+                    prev_games = 0
 
+                # Team didn't play on this date: keep current streaks
+                if games != prev_games:
                     # Team played - check if they won or lost
-                    if record.win and record.win > prev_wins:
+                    if wins and wins > prev_wins:
                         # Won the game
                         win_streak += 1
                         loss_streak = 0
@@ -391,11 +391,16 @@ class StatisticsCalculator:
                         win_streak = 0
                         loss_streak += 1
 
-                    record.win_streak = win_streak
-                    record.loss_streak = loss_streak
-                    prev_wins = record.win or 0
-                    prev_games = record.game or 0
-                    records_updated += 1
+                    prev_wins = wins or 0
+                    prev_games = games or 0
+
+                updates.append(
+                    {"id": record_id, "win_streak": win_streak, "loss_streak": loss_streak}
+                )
+
+            for start in range(0, len(updates), STREAM_CHUNK_SIZE):
+                db.execute(update(TeamHistory), updates[start : start + STREAM_CHUNK_SIZE])
 
+            records_updated = len(updates)
             logger.info("Streaks calculated", records=records_updated)
             return records_updated
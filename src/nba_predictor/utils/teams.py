@@ -0,0 +1,276 @@
+"""Team registry: canonical team names, abbreviations and conferences.
+
+Every source spells teams differently: RotoWire and Basketball Monster use
+abbreviations (sometimes Basketball Reference's BRK/CHO/PHO, sometimes
+GS/NO/SA), screenshots give nicknames or full names, and users type whatever
+they like. The registry precomputes one dictionary from every normalized
+spelling to the canonical team, so resolving a name is a single lookup, and
+finding the teams mentioned in a text is one pass over its tokens.
+
+The static list below covers the current league; rows of the ``nba_team``
+table are merged in, so abbreviations or teams added there are recognized
+too.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from nba_predictor.core.logger import get_logger
+from nba_predictor.models import Team, get_db
+
+logger = get_logger(__name__)
+
+# Registries built so far, keyed by use_database
+_registries: Dict[bool, "TeamRegistry"] = {}
+
+
+@dataclass(frozen=True)
+class TeamInfo:
+    """Canonical description of a team."""
+
+    name: str
+    abbreviation: str
+    conference: Optional[str]
+    nickname: str
+
+
+# (full name, primary abbreviation, conference, nickname)
+NBA_TEAMS: Tuple[TeamInfo, ...] = tuple(
+    TeamInfo(*team)
+    for team in (
+        ("Atlanta Hawks", "ATL", "East", "Hawks"),
+        ("Boston Celtics", "BOS", "East", "Celtics"),
+        ("Brooklyn Nets", "BKN", "East", "Nets"),
+        ("Charlotte Hornets", "CHA", "East", "Hornets"),
+        ("Chicago Bulls", "CHI", "East", "Bulls"),
+        ("Cleveland Cavaliers", "CLE", "East", "Cavaliers"),
+        ("Detroit Pistons", "DET", "East", "Pistons"),
+        ("Indiana Pacers", "IND", "East", "Pacers"),
+        ("Miami Heat", "MIA", "East", "Heat"),
+        ("Milwaukee Bucks", "MIL", "East", "Bucks"),
+        ("New York Knicks", "NYK", "East", "Knicks"),
+        ("Orlando Magic", "ORL", "East", "Magic"),
+        ("Philadelphia 76ers", "PHI", "East", "76ers"),
+        ("Toronto Raptors", "TOR", "East", "Raptors"),
+        ("Washington Wizards", "WAS", "East", "Wizards"),
+        ("Dallas Mavericks", "DAL", "West", "Mavericks"),
+        ("Denver Nuggets", "DEN", "West", "Nuggets"),
+        ("Golden State Warriors", "GSW", "West", "Warriors"),
+        ("Houston Rockets", "HOU", "West", "Rockets"),
+        ("Los Angeles Clippers", "LAC", "West", "Clippers"),
+        ("Los Angeles Lakers", "LAL", "West", "Lakers"),
+        ("Memphis Grizzlies", "MEM", "West", "Grizzlies"),
+        ("Minnesota Timberwolves", "MIN", "West", "Timberwolves"),
+        ("New Orleans Pelicans", "NOP", "West", "Pelicans"),
+        ("Oklahoma City Thunder", "OKC", "West", "Thunder"),
+        ("Phoenix Suns", "PHX", "West", "Suns"),
+        ("Portland Trail Blazers", "POR", "West", "Trail Blazers"),
+        ("Sacramento Kings", "SAC", "West", "Kings"),
+        ("San Antonio Spurs", "SAS", "West", "Spurs"),
+        ("Utah Jazz", "UTA", "West", "Jazz"),
+    )
+)
+
+# Alternative abbreviations used by lineup sites and Basketball Reference
+ABBREVIATION_ALIASES: Dict[str, str] = {
+    "BRK": "Brooklyn Nets",
+    "CHO": "Charlotte Hornets",
+    "GS": "Golden State Warriors",
+    "LA": "Los Angeles Lakers",
+    "NO": "New Orleans Pelicans",
+    "NOR": "New Orleans Pelicans",
+    "NY": "New York Knicks",
+    "PHO": "Phoenix Suns",
+    "SA": "San Antonio Spurs",
+    "UTAH": "Utah Jazz",
+    "WSH": "Washington Wizards",
+}
+
+# Common nicknames and spellings besides the full name and official nickname
+NAME_ALIASES: Dict[str, str] = {
+    "Cavs": "Cleveland Cavaliers",
+    "Mavs": "Dallas Mavericks",
+    "Sixers": "Philadelphia 76ers",
+    "Blazers": "Portland Trail Blazers",
+    "Wolves": "Minnesota Timberwolves",
+    "T-Wolves": "Minnesota Timberwolves",
+    "LA Lakers": "Los Angeles Lakers",
+    "L.A. Lakers": "Los Angeles Lakers",
+    "LA Clippers": "Los Angeles Clippers",
+    "L.A. Clippers": "Los Angeles Clippers",
+    "Golden State": "Golden State Warriors",
+    "Oklahoma City": "Oklahoma City Thunder",
+    "New Orleans": "New Orleans Pelicans",
+    "San Antonio": "San Antonio Spurs",
+    "Portland Trailblazers": "Portland Trail Blazers",
+}
+
+# Longest alias in tokens; bounds the n-grams tried when scanning text
+_MAX_ALIAS_TOKENS = 3
+
+_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9]+")
+
+
+def _normalize(text: str) -> str:
+    """Lowercase a name and reduce it to space-separated alphanumeric tokens."""
+    return " ".join(_TOKEN_PATTERN.findall(text.replace(".", ""))).lower()
+
+
+class TeamRegistry:
+    """Precomputed lookups from any known team spelling to the canonical team."""
+
+    def __init__(
+        self,
+        teams: Iterable[TeamInfo] = NBA_TEAMS,
+        extra_abbreviations: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Build the lookup tables.
+
+        Args:
+            teams: Canonical teams
+            extra_abbreviations: Additional abbreviation -> full name pairs
+                (e.g. from the ``nba_team`` table); unknown names are added
+                as teams without a conference
+        """
+        self._teams: Dict[str, TeamInfo] = {team.name: team for team in teams}
+        self._abbreviations: Dict[str, TeamInfo] = {}
+        self._names: Dict[str, TeamInfo] = {}
+
+        for abbreviation, name in (extra_abbreviations or {}).items():
+            if name not in self._teams:
+                self._teams[name] = TeamInfo(name, abbreviation, None, name.split()[-1])
+
+        for team in self._teams.values():
+            self._abbreviations[team.abbreviation.upper()] = team
+            for spelling in (team.name, team.nickname):
+                self._names.setdefault(_normalize(spelling), team)
+
+        abbreviations = dict(ABBREVIATION_ALIASES, **(extra_abbreviations or {}))
+        for abbreviation, name in abbreviations.items():
+            team = self._teams.get(name)
+            if team is not None:
+                self._abbreviations.setdefault(abbreviation.upper(), team)
+
+        for alias, name in NAME_ALIASES.items():
+            team = self._teams.get(name)
+            if team is not None:
+                self._names.setdefault(_normalize(alias), team)
+
+    @property
+    def teams(self) -> List[TeamInfo]:
+        """All canonical teams."""
+        return list(self._teams.values())
+
+    def get(self, identifier: str) -> Optional[TeamInfo]:
+        """Look up a team by abbreviation, full name, nickname or alias.
+
+        Args:
+            identifier: Any known spelling (case-insensitive)
+
+        Returns:
+            Team, or None if the spelling is unknown
+        """
+        identifier = identifier.strip()
+        team = self._abbreviations.get(identifier.upper())
+        if team is not None:
+            return team
+        return self._names.get(_normalize(identifier))
+
+    def resolve(self, identifier: str) -> Optional[str]:
+        """Canonical full name of a team.
+
+        Args:
+            identifier: Any known spelling (case-insensitive)
+
+        Returns:
+            Full team name, or None if the spelling is unknown
+        """
+        team = self.get(identifier)
+        return team.name if team is not None else None
+
+    def conference(self, team_name: str) -> Optional[str]:
+        """Conference ("East" or "West") of a team, or None if unknown."""
+        team = self.get(team_name)
+        return team.conference if team is not None else None
+
+    def find_teams(self, text: str, abbreviations_only: bool = False) -> List[str]:
+        """Find the teams mentioned in a text, in order of first mention.
+
+        The text is tokenized once; each position is matched against the
+        name index with up to ``_MAX_ALIAS_TOKENS`` tokens (longest first)
+        and against the abbreviation index. Abbreviations only match when
+        written in upper case, so words like "No" or "La" are not mistaken
+        for teams.
+
+        Args:
+            text: Text to scan
+            abbreviations_only: Only match abbreviations
+
+        Returns:
+            Distinct full team names
+        """
+        tokens = _TOKEN_PATTERN.findall(text.replace(".", ""))
+        lowered = [token.lower() for token in tokens]
+        found: Dict[str, None] = {}
+
+        position = 0
+        while position < len(tokens):
+            matched = 1
+            team = None
+
+            if not abbreviations_only:
+                for length in range(min(_MAX_ALIAS_TOKENS, len(tokens) - position), 0, -1):
+                    team = self._names.get(" ".join(lowered[position : position + length]))
+                    if team is not None:
+                        matched = length
+                        break
+
+            if team is None and tokens[position].isupper():
+                team = self._abbreviations.get(tokens[position])
+
+            if team is not None:
+                found.setdefault(team.name)
+            position += matched
+
+        return list(found)
+
+
+def _database_abbreviations() -> Optional[Dict[str, str]]:
+    """Abbreviations stored in the ``nba_team`` table (None if unavailable)."""
+    try:
+        with get_db() as db:
+            return {
+                abbreviation: name
+                for name, abbreviation in db.query(Team.name, Team.abbreviation)
+            }
+    except Exception as e:
+        logger.warning("Team table unavailable, using static team list", error=str(e))
+        return None
+
+
+def get_team_registry(use_database: bool = True) -> TeamRegistry:
+    """Get the shared team registry.
+
+    Args:
+        use_database: Merge abbreviations from the ``nba_team`` table
+
+    Returns:
+        Registry, built on first use and reused afterwards. If the team table
+        is unavailable the static registry is returned and the table is
+        tried again on the next call.
+    """
+    registry = _registries.get(use_database)
+    if registry is not None:
+        return registry
+
+    if use_database:
+        extra = _database_abbreviations()
+        if extra is None:
+            return get_team_registry(use_database=False)
+        registry = TeamRegistry(extra_abbreviations=extra)
+    else:
+        registry = TeamRegistry()
+
+    _registries[use_database] = registry
+    return registry
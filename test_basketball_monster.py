@@ -15,7 +15,7 @@ def main():
     setup_logging()
 
     print("Testing Basketball Monster scraper...")
-    scraper = BasketballMonsterScraper()
+    scraper = BasketballMonsterScraper(diagnostics=True)
 
     try:
         count = scraper.import_daily_lineups()